@@ -2,7 +2,11 @@ from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from config import Config
 
-def create_app():
+def create_app(start_scheduler: bool = None):
+    """앱 생성 (start_scheduler가 None이면 SCHEDULER_ENABLED 설정을 따름 - 짧게 실행되는 스크립트는 False)"""
+    if start_scheduler is None:
+        start_scheduler = Config.SCHEDULER_ENABLED
+    
     app = Flask(__name__)
     app.config.from_object(Config)
     
@@ -16,9 +20,21 @@ def create_app():
     with app.app_context():
         db.create_all()
         
-        # 스케줄러 시작
-        from app.scheduler import get_scheduler
-        scheduler = get_scheduler()
-        scheduler.start_scheduler()
+        # 기존 데이터베이스에 새 인덱스 등 스키마 변경 적용
+        from app.migrations import upgrade_database
+        upgrade_database()
+        
+        # 방문자 수 주기적 반영 시작
+        from app.visits import get_visit_counter
+        get_visit_counter().start(app)
+        
+        # 스케줄러 시작 (리더로 선출된 워커 하나에서만 실행)
+        if start_scheduler:
+            from app.scheduler import get_scheduler
+            from app.leader import get_leader_elector
+            scheduler = get_scheduler()
+            get_leader_elector().start(app,
+                                       on_elected=lambda: scheduler.start_scheduler(app),
+                                       on_lost=scheduler.stop_scheduler)
     
     return app
\ No newline at end of file
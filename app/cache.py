@@ -0,0 +1,157 @@
+"""읽기 API 응답 캐시 - 요청 인자와 데이터 버전(크롤링 커밋마다 증가)을 키로 사용
+
+데이터 버전은 DB의 DataVersion 행(app/data_version.py)에서 읽으므로 크롤링을 하지 않는 워커도
+새 버전을 보면 이전 응답을 쓰지 않는다. 기본은 프로세스 메모리에 저장하고, Config.RESPONSE_CACHE_REDIS_URL이 설정되어 있고
+redis 패키지가 설치되어 있으면 여러 프로세스가 Redis를 공유한다.
+"""
+
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Dict, Optional
+from urllib.parse import urlencode
+
+from flask import Response, make_response, request
+
+from app.data_version import get_data_version
+from config import Config
+
+try:
+    import redis
+except ImportError:  # 선택 의존성
+    redis = None
+
+
+class MemoryBackend:
+    """프로세스 내 LRU 저장소"""
+
+    def __init__(self, max_entries: int = None):
+        self.max_entries = max_entries or Config.RESPONSE_CACHE_MAX_ENTRIES
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: Dict):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard_other_versions(self, version: int):
+        # 이전 버전 항목은 더 이상 조회되지 않으므로 비움
+        prefix = f"{version}:"
+        with self._lock:
+            for key in [key for key in self._entries if not key.startswith(prefix)]:
+                del self._entries[key]
+
+
+class RedisBackend:
+    """여러 프로세스가 공유하는 Redis 저장소"""
+
+    def __init__(self, url: str, ttl: int = None):
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl or Config.RESPONSE_CACHE_TTL
+        self.prefix = 'community:response:'
+
+    def get(self, key: str) -> Optional[Dict]:
+        raw = self.client.get(self.prefix + key)
+        return pickle.loads(raw) if raw else None
+
+    def set(self, key: str, entry: Dict):
+        self.client.set(self.prefix + key, pickle.dumps(entry), ex=self.ttl)
+
+    def discard_other_versions(self, version: int):
+        # 이전 버전 항목은 TTL이 지나면 사라짐
+        pass
+
+
+class ResponseCache:
+    """데이터 버전별 응답 본문과 강한 ETag 보관"""
+
+    def __init__(self, backend=None):
+        self.backend = backend or self._create_backend()
+        self._seen_version = None
+
+    def _create_backend(self):
+        url = Config.RESPONSE_CACHE_REDIS_URL
+        if url:
+            if redis is None:
+                print("⚠️ redis 패키지가 없어 메모리 응답 캐시를 사용합니다")
+            else:
+                try:
+                    backend = RedisBackend(url)
+                    backend.client.ping()
+                    return backend
+                except Exception as e:
+                    print(f"⚠️ Redis 연결 실패, 메모리 응답 캐시 사용: {e}")
+        return MemoryBackend()
+
+    def data_version(self) -> int:
+        """현재 데이터 버전 (버전이 바뀌면 이전 버전 항목 정리)"""
+        version = get_data_version().current()
+        if version != self._seen_version:
+            self._seen_version = version
+            self.backend.discard_other_versions(version)
+        return version
+
+    def _request_key(self) -> str:
+        """요청 경로와 정렬된 쿼리 인자로 만든 캐시 키"""
+        args = sorted(request.args.items(multi=True))
+        return f"{self.data_version()}:{request.path}?{urlencode(args)}"
+
+    def serve(self, render) -> Response:
+        """캐시된 응답을 돌려주고, 없으면 render()로 만들어 저장
+
+        If-None-Match가 ETag와 같으면 본문 없이 304를 반환한다.
+        """
+        key = self._request_key()
+        entry = self.backend.get(key)
+
+        if entry is None:
+            response = make_response(render())
+            if response.status_code != 200:
+                return response
+
+            body = response.get_data()
+            entry = {
+                'body': body,
+                'mimetype': response.mimetype,
+                'etag': hashlib.sha1(body).hexdigest()
+            }
+            self.backend.set(key, entry)
+
+        response = Response(entry['body'], mimetype=entry['mimetype'])
+        response.set_etag(entry['etag'])
+        # 브라우저가 매번 ETag로 재검증하도록 함
+        response.headers['Cache-Control'] = 'no-cache'
+        return response.make_conditional(request)
+
+
+def cached_response(view):
+    """뷰 응답을 데이터 버전 기준으로 캐시하는 데코레이터"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        return get_response_cache().serve(lambda: view(*args, **kwargs))
+    return wrapper
+
+
+# 전역 응답 캐시 인스턴스
+response_cache_instance = None
+_instance_lock = threading.Lock()
+
+def get_response_cache() -> ResponseCache:
+    """응답 캐시 인스턴스 반환"""
+    global response_cache_instance
+    with _instance_lock:
+        if response_cache_instance is None:
+            response_cache_instance = ResponseCache()
+    return response_cache_instance
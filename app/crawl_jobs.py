@@ -0,0 +1,148 @@
+"""수동 크롤링 백그라운드 작업 큐 - 요청은 작업 id만 받고 진행 상황은 상태 API로 조회
+
+작업 행(CrawlJob)과 실행 중인 작업 임대(crawl_job)는 DB에 있으므로, 어느 워커가 요청을 받아도
+같은 작업을 돌려주고 상태를 조회할 수 있다. 예약 크롤링과의 중복은 CrawlerManager의 사이트별 임대로 막는다.
+"""
+
+import json
+import threading
+import uuid
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from app.leader import PROCESS_OWNER, acquire_lease, current_lease_owner, release_lease
+from app.models import CrawlJob, db
+from config import Config
+
+JOB_LEASE = 'crawl_job'
+
+
+class CrawlJobQueue:
+    """한 번에 하나의 전체 크롤링만 실행하는 작업 큐 (실행 중이면 어느 워커에서든 같은 작업을 돌려줌)"""
+
+    def __init__(self, crawler_manager=None, history: int = None):
+        self._crawler_manager = crawler_manager
+        self.history = history or Config.CRAWL_JOB_HISTORY
+        self._local_job_id = None   # 이 프로세스에서 실행 중인 작업 (실시간 진행 상황 제공용)
+
+    @property
+    def crawler_manager(self):
+        """스케줄러와 같은 크롤러 관리자 사용 - 예약 크롤링과 같은 사이트를 동시에 돌리지 않음"""
+        if self._crawler_manager is None:
+            from app.scheduler import get_scheduler
+            self._crawler_manager = get_scheduler().crawler_manager
+        return self._crawler_manager
+
+    def submit(self, app) -> Tuple[Dict, bool]:
+        """크롤링 작업 등록 후 (작업 정보, 새로 만들었는지) 반환 (앱 컨텍스트 필요)"""
+        job_id = uuid.uuid4().hex
+
+        # 작업 임대는 작업 id가 소유 - 다른 워커가 이미 가졌으면 그 작업을 돌려줌
+        if not acquire_lease(JOB_LEASE, job_id, Config.CRAWL_JOB_LEASE_TTL):
+            active_id = current_lease_owner(JOB_LEASE)
+            active = db.session.get(CrawlJob, active_id) if active_id else None
+            if active is None:
+                # 임대를 가진 워커가 아직 작업 행을 만들기 전
+                active = CrawlJob(job_id=active_id, status='queued')
+            return active.to_dict(), False
+
+        try:
+            # 임대가 만료된 채 남은 작업은 실행하던 프로세스가 종료된 것
+            db.session.execute(
+                db.update(CrawlJob)
+                .where(CrawlJob.status.in_(('queued', 'running')))
+                .values(status='error', error='작업을 실행하던 프로세스가 종료되었습니다', finished_at=datetime.utcnow())
+            )
+
+            job = CrawlJob(job_id=job_id, status='queued', owner=PROCESS_OWNER, created_at=datetime.utcnow())
+            db.session.add(job)
+            db.session.flush()
+
+            # 최근 history개만 보관
+            stale_ids = db.session.execute(
+                db.select(CrawlJob.job_id).order_by(CrawlJob.created_at.desc()).offset(self.history)
+            ).scalars().all()
+            if stale_ids:
+                db.session.execute(db.delete(CrawlJob).where(CrawlJob.job_id.in_(stale_ids)))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            release_lease(JOB_LEASE, job_id)
+            raise
+
+        snapshot = job.to_dict()
+        self._local_job_id = job_id
+        thread = threading.Thread(target=self._run, args=(app, job_id), daemon=True,
+                                  name=f"crawl-job-{job_id[:8]}")
+        thread.start()
+        return snapshot, True
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """작업 상태 반환 (앱 컨텍스트 필요, 이 프로세스에서 실행 중이면 실시간 진행 상황 포함)"""
+        job = db.session.get(CrawlJob, job_id)
+        if job is None:
+            return None
+        snapshot = job.to_dict()
+        if job.status == 'running' and job_id == self._local_job_id:
+            snapshot['sites'] = self.crawler_manager.get_progress()
+        return snapshot
+
+    def _update(self, job_id: str, **values):
+        """작업 행 갱신 (진행 상황은 JSON으로 저장)"""
+        if 'sites' in values:
+            values['sites'] = json.dumps(values['sites'], ensure_ascii=False, default=str)
+        try:
+            db.session.execute(db.update(CrawlJob).where(CrawlJob.job_id == job_id).values(**values))
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            print(f"수동 크롤링 작업 상태 기록 오류: {e}")
+
+    def _report_progress(self, app, job_id: str, stop: threading.Event):
+        """작업이 끝날 때까지 진행 상황을 DB에 기록하고 작업 임대 연장"""
+        with app.app_context():
+            while not stop.wait(Config.CRAWL_JOB_PROGRESS_INTERVAL):
+                self._update(job_id, sites=self.crawler_manager.get_progress())
+                try:
+                    acquire_lease(JOB_LEASE, job_id, Config.CRAWL_JOB_LEASE_TTL)
+                except Exception as e:
+                    print(f"수동 크롤링 작업 임대 연장 오류: {e}")
+
+    def _run(self, app, job_id: str):
+        """작업 스레드 - 앱 컨텍스트에서 전체 크롤링 실행"""
+        stop = threading.Event()
+        reporter = threading.Thread(target=self._report_progress, args=(app, job_id, stop), daemon=True,
+                                    name=f"crawl-job-progress-{job_id[:8]}")
+
+        with app.app_context():
+            self._update(job_id, status='running', started_at=datetime.utcnow())
+            reporter.start()
+
+            try:
+                new_posts = self.crawler_manager.crawl_all_sites()
+                status, error = 'done', None
+            except Exception as e:
+                print(f"수동 크롤링 작업 오류: {e}")
+                new_posts, status, error = None, 'error', str(e)
+            finally:
+                stop.set()
+                reporter.join()
+
+            self._update(job_id, sites=self.crawler_manager.get_progress(), new_posts=new_posts,
+                         status=status, error=error, finished_at=datetime.utcnow())
+            if self._local_job_id == job_id:
+                self._local_job_id = None
+            release_lease(JOB_LEASE, job_id)
+
+
+# 전역 작업 큐 인스턴스
+crawl_job_queue_instance = None
+_instance_lock = threading.Lock()
+
+def get_crawl_job_queue() -> CrawlJobQueue:
+    """크롤링 작업 큐 인스턴스 반환"""
+    global crawl_job_queue_instance
+    with _instance_lock:
+        if crawl_job_queue_instance is None:
+            crawl_job_queue_instance = CrawlJobQueue()
+    return crawl_job_queue_instance
@@ -0,0 +1,169 @@
+"""asyncio 기반 크롤러 (하나의 비동기 HTTP 클라이언트를 모든 사이트가 공유)"""
+
+import asyncio
+from abc import abstractmethod
+from typing import List, Dict, Optional
+
+import httpx
+
+from config import Config
+from .base_crawler import BaseCrawler
+from .rate_limiter import RateLimitedTransport
+from .site_crawlers import PpomppuCrawler, DcinsideCrawler, RuliwebCrawler, DogdripCrawler
+
+
+def create_async_client(transport: httpx.AsyncBaseTransport = None) -> httpx.AsyncClient:
+    """커넥션 풀이 설정된 공유 비동기 HTTP 클라이언트 생성
+
+    모든 요청(리다이렉트 포함)은 호스트별 공유 속도 제한기를 거친다 (transport: 테스트용 전송 계층).
+    """
+    if transport is None:
+        transport = httpx.AsyncHTTPTransport(limits=httpx.Limits(
+            max_connections=Config.ASYNC_MAX_CONNECTIONS,
+            max_keepalive_connections=Config.ASYNC_MAX_KEEPALIVE
+        ))
+    return httpx.AsyncClient(
+        transport=RateLimitedTransport(transport),
+        timeout=Config.ASYNC_HTTP_TIMEOUT,
+        follow_redirects=True,
+        headers={
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        }
+    )
+
+
+class AsyncBaseCrawler(BaseCrawler):
+    """비동기 크롤러 기본 클래스 - 파싱(parse_posts)은 동기 크롤러 구현을 그대로 사용
+
+    속도 제한은 공유 클라이언트(create_async_client)가, 조건부 GET과 검증자 보관은
+    동기 크롤러와 같은 cache_adapter가 맡으므로 commit_validators()도 그대로 쓴다.
+    """
+
+    def __init__(self, *args, client: Optional[httpx.AsyncClient] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.client = client
+
+    async def get(self, url: str, headers: Dict = None, **kwargs) -> httpx.Response:
+        """저장된 검증자로 조건부 요청을 붙여 공유 클라이언트로 GET 요청"""
+        if self.client is None:
+            raise RuntimeError(f"{self.site_name}: 비동기 HTTP 클라이언트가 설정되지 않았습니다")
+
+        headers = dict(headers or {})
+        conditional = self.cache_adapter.add_conditional_headers(url, headers)
+        response = await self.client.get(url, headers=headers, **kwargs)
+        self.cache_adapter.remember_response(url, response, conditional)
+        return response
+
+    async def fetch(self, url: str, **kwargs) -> httpx.Response:
+        """GET 요청 후 오류 상태 코드면 예외 발생 (304는 변경 없음이므로 그대로 반환)"""
+        response = await self.get(url, **kwargs)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    async def parse_posts_async(self, content) -> List[Dict]:
+        """parse_posts를 별도 스레드에서 실행 (HTML 파싱이 이벤트 루프의 다른 사이트 요청을 막지 않게 함)"""
+        return await asyncio.to_thread(self.parse_posts, content)
+
+    @abstractmethod
+    async def crawl_popular_posts(self) -> List[Dict]:
+        """인기 게시물 크롤링 (비동기)"""
+        pass
+
+
+class AsyncPpomppuCrawler(AsyncBaseCrawler, PpomppuCrawler):
+    """뽐뿌 비동기 크롤러"""
+
+    async def crawl_popular_posts(self) -> List[Dict]:
+        """뽐뿌 인기 게시물 크롤링"""
+        posts = []
+
+        try:
+            url = f"{self.base_url}/hot.php?category=2"
+            response = await self.fetch(url, timeout=10)
+            if self.is_not_modified(response) or self.is_unchanged(response.content):
+                return posts
+            posts = await self.parse_posts_async(response.content)
+        except Exception as e:
+            print(f"뽐뿌 크롤링 오류: {e}")
+
+        return posts
+
+
+class AsyncDcinsideCrawler(AsyncBaseCrawler, DcinsideCrawler):
+    """디시인사이드 비동기 크롤러"""
+
+    async def crawl_popular_posts(self) -> List[Dict]:
+        """디시인사이드 인기 게시물 크롤링"""
+        posts = []
+
+        try:
+            url = f"{self.base_url}/board/lists/?id=dcbest"
+            response = await self.fetch(url, timeout=10)
+            if self.is_not_modified(response) or self.is_unchanged(response.content):
+                return posts
+            posts = await self.parse_posts_async(response.content)
+        except Exception as e:
+            print(f"디시인사이드 크롤링 오류: {e}")
+
+        return posts
+
+
+class AsyncRuliwebCrawler(AsyncBaseCrawler, RuliwebCrawler):
+    """루리웹 비동기 크롤러"""
+
+    async def crawl_popular_posts(self) -> List[Dict]:
+        """루리웹 유머 베스트 게시물 크롤링"""
+        posts = []
+
+        try:
+            url = f"{self.base_url}/best/humor_only?orderby=recommend&range=24h"
+            response = await self.fetch(url, timeout=10)
+            if self.is_not_modified(response) or self.is_unchanged(response.content):
+                return posts
+            posts = await self.parse_posts_async(response.content)
+        except Exception as e:
+            print(f"루리웹 크롤링 오류: {e}")
+
+        return posts
+
+
+class AsyncDogdripCrawler(AsyncBaseCrawler, DogdripCrawler):
+    """개드립 비동기 크롤러"""
+
+    async def crawl_popular_posts(self) -> List[Dict]:
+        """개드립 인기 게시물 크롤링"""
+        posts = []
+
+        try:
+            headers = dict(self.browser_headers)
+            # httpx가 디코딩하지 못하는 zstd 응답을 받지 않도록 인코딩 제한
+            headers['Accept-Encoding'] = 'gzip, deflate'
+
+            # 먼저 메인 페이지 방문으로 세션 쿠키 얻기
+            print("개드립 메인 페이지 방문 중...")
+            await self.get(self.base_url, headers=headers, timeout=10)
+
+            url = f"{self.base_url}/?mid=dogdrip&sort_index=popular"
+            headers['Referer'] = self.base_url + '/'
+            print(f"개드립 인기글 페이지 접속 중: {url}")
+            response = await self.fetch(url, headers=headers, timeout=15)
+
+            print(f"개드립 응답 상태: {response.status_code}, 길이: {len(response.content)}")
+            if self.is_not_modified(response) or self.is_unchanged(response.content):
+                return posts
+            posts = await self.parse_posts_async(response.content)
+        except Exception as e:
+            print(f"개드립 크롤링 오류: {e}")
+
+        return posts
+
+
+# 비동기 구현이 있는 사이트
+ASYNC_CRAWLERS = {
+    'ppomppu': AsyncPpomppuCrawler,
+    'dcinside': AsyncDcinsideCrawler,
+    'ruliweb': AsyncRuliwebCrawler,
+    'dogdrip': AsyncDogdripCrawler
+}
+
@@ -4,13 +4,30 @@ import re
 from datetime import datetime
 from typing import List, Dict
 from abc import ABC, abstractmethod
+from .http_cache import CachingAdapter
+from .fingerprints import compute_fingerprint
 
 class BaseCrawler(ABC):
     """크롤러 기본 클래스"""
     
+    # 목록 지문 계산에 사용할 HTML 영역 (시작, 끝 문자열) - None이면 문서 전체
+    fingerprint_markers = None
+    
     def __init__(self, site_name: str):
         self.site_name = site_name
         self.session = requests.Session()
+        
+        # 목록 페이지 변경 없음(304, 동일 지문) 여부 - CrawlerManager가 크롤링마다 초기화
+        self.unchanged = False
+        
+        # 목록 지문 저장소 (CrawlerManager가 설정) 및 저장 후 기록할 이번 목록의 지문
+        self.fingerprints = None
+        self.pending_fingerprint = None
+        
+        # 모든 요청은 호스트별 공유 속도 제한기와 디스크 HTTP 캐시(조건부 GET)를 거침
+        self.cache_adapter = CachingAdapter(site_name)
+        self.session.mount('http://', self.cache_adapter)
+        self.session.mount('https://', self.cache_adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
@@ -20,6 +37,35 @@ class BaseCrawler(ABC):
         """인기 게시물 크롤링"""
         pass
     
+    def reset_crawl_state(self):
+        """크롤링 시작 전 변경 여부 상태 초기화"""
+        self.unchanged = False
+        self.pending_fingerprint = None
+        self.cache_adapter.discard_pending()
+    
+    def commit_validators(self):
+        """이번 크롤링에서 받은 HTTP 캐시 검증자 기록 (게시물 저장이 끝난 뒤 CrawlerManager가 호출)"""
+        self.cache_adapter.commit_pending()
+    
+    def is_not_modified(self, response) -> bool:
+        """조건부 요청에 서버가 304로 응답했는지 확인 (변경 없으면 파싱 생략)"""
+        if getattr(response, 'status_code', None) == 304:
+            print(f"{self.site_name}: 목록 페이지 변경 없음 (304) - 파싱 생략")
+            self.unchanged = True
+            return True
+        return False
+    
+    def is_unchanged(self, content) -> bool:
+        """목록 영역 지문이 지난 크롤링과 같은지 확인 (같으면 파싱 생략)"""
+        fingerprint = compute_fingerprint(content, self.fingerprint_markers)
+        self.pending_fingerprint = fingerprint
+        
+        if self.fingerprints is not None and self.fingerprints.get(self.site_name) == fingerprint:
+            print(f"{self.site_name}: 목록 내용 변경 없음 (지문 일치) - 파싱 생략")
+            self.unchanged = True
+            return True
+        return False
+    
     def categorize_post(self, title: str, content: str = "") -> str:
         """게시물 카테고리 분류 - 단순히 '인기' 카테고리로 통일"""
         return '인기'
@@ -0,0 +1,218 @@
+"""크롤러가 공유하는 Playwright 브라우저 풀
+
+Playwright 동기 API 객체는 만든 스레드에서만 쓸 수 있으므로, 워커 스레드마다 브라우저를 하나씩
+띄워 두고 작업을 큐로 넘긴다. 작업마다 새 컨텍스트(쿠키/저장소 분리)를 만들고 끝나면 닫으며,
+브라우저는 N회 사용했거나 메모리가 커지면 다시 띄운다.
+"""
+
+import atexit
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional, Set
+
+from config import Config
+from .resource_blocking import install_resource_blocking
+
+try:
+    import psutil
+except ImportError:  # requirements.txt에 포함 - 없으면 경고 후 사용 횟수로만 재시작
+    psutil = None
+
+_STOP = object()
+
+# Playwright 드라이버 프로세스를 워커별로 구분하기 위해 드라이버 시작을 한 번에 하나씩 처리
+_driver_start_lock = threading.Lock()
+
+
+def _child_pids() -> Set[int]:
+    """이 프로세스의 직계 자식 프로세스 id"""
+    try:
+        return {child.pid for child in psutil.Process().children()}
+    except psutil.Error:
+        return set()
+
+
+class BrowserWorker(threading.Thread):
+    """브라우저 하나를 소유하고 큐의 작업을 순서대로 실행하는 스레드"""
+
+    def __init__(self, pool, index: int):
+        super().__init__(daemon=True, name=f"browser-{index}")
+        self.pool = pool
+        self.playwright = None
+        self.browser = None
+        self.uses = 0
+        # 이 워커의 Playwright 드라이버 프로세스 (브라우저와 렌더러는 그 자식으로 실행됨)
+        self.driver_pids = set()
+
+    def run(self):
+        while True:
+            item = self.pool.tasks.get()
+            if item is _STOP:
+                break
+
+            future, task, device, context_options, block_profile = item
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                future.set_result(self._run_task(task, device, context_options, block_profile))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                self._recycle_if_needed()
+
+        self._close_browser()
+        if self.playwright is not None:
+            self.playwright.stop()
+            self.playwright = None
+            self.driver_pids = set()
+
+    def _ensure_browser(self):
+        """브라우저가 없거나 죽었으면 새로 실행"""
+        if self.browser is not None and self.browser.is_connected():
+            return
+
+        self._close_browser()
+        if self.playwright is None:
+            from playwright.sync_api import sync_playwright
+            with _driver_start_lock:
+                before = _child_pids() if psutil is not None else set()
+                self.playwright = sync_playwright().start()
+                self.driver_pids = (_child_pids() - before) if psutil is not None else set()
+
+        print(f"🌐 {self.name} 브라우저 시작")
+        self.browser = self.playwright.chromium.launch(
+            headless=Config.BROWSER_POOL_HEADLESS,
+            args=Config.BROWSER_POOL_ARGS
+        )
+        self.uses = 0
+
+    def _run_task(self, task, device, context_options, block_profile):
+        """새 컨텍스트에서 task(context) 실행 후 컨텍스트 닫기 (block_profile이 있으면 요청 차단 규칙 적용)"""
+        self._ensure_browser()
+
+        options = dict(self.playwright.devices[device]) if device else {}
+        options.update(context_options or {})
+
+        context = self.browser.new_context(**options)
+        blocker = install_resource_blocking(context, block_profile)
+        try:
+            return task(context)
+        finally:
+            self.uses += 1
+            if blocker is not None:
+                print(f"🚫 {self.name} 요청 차단 ({block_profile}): {blocker.summary()}")
+            try:
+                context.close()
+            except Exception:
+                pass
+
+    def _recycle_if_needed(self):
+        """사용 횟수나 메모리 한도를 넘으면 브라우저 종료 (다음 작업에서 다시 실행)"""
+        if self.browser is None:
+            return
+
+        reason = None
+        if self.uses >= Config.BROWSER_POOL_MAX_USES:
+            reason = f"{self.uses}회 사용"
+        else:
+            memory_mb = self.memory_mb()
+            if memory_mb is not None and memory_mb > Config.BROWSER_POOL_MAX_MEMORY_MB:
+                reason = f"메모리 {memory_mb:.0f}MB"
+
+        if reason:
+            print(f"♻️ {self.name} 브라우저 재시작 ({reason})")
+            self._close_browser()
+
+    def memory_mb(self) -> Optional[float]:
+        """이 워커가 띄운 브라우저 프로세스 트리(브라우저 + 렌더러 등)의 메모리 합 (측정할 수 없으면 None)"""
+        if psutil is None:
+            self.pool.warn_no_psutil()
+            return None
+        if not self.driver_pids:
+            return None
+
+        total = 0
+        for pid in self.driver_pids:
+            try:
+                processes = psutil.Process(pid).children(recursive=True)
+            except psutil.Error:
+                continue
+            for process in processes:
+                try:
+                    total += process.memory_info().rss
+                except psutil.Error:
+                    pass
+        return total / (1024 * 1024)
+
+    def _close_browser(self):
+        if self.browser is not None:
+            try:
+                self.browser.close()
+            except Exception:
+                pass
+            self.browser = None
+
+
+class BrowserPool:
+    """오래 유지되는 브라우저 워커 풀 - run()으로 격리된 컨텍스트에서 작업 실행"""
+
+    def __init__(self, size: int = None):
+        self.size = size or Config.BROWSER_POOL_SIZE
+        self.tasks = queue.Queue()
+        self.workers = []
+        self._lock = threading.Lock()
+        self._warned_no_psutil = False
+
+    def _start_workers(self):
+        with self._lock:
+            if self.workers:
+                return
+            for index in range(self.size):
+                worker = BrowserWorker(self, index)
+                worker.start()
+                self.workers.append(worker)
+            atexit.register(self.shutdown)
+
+    def run(self, task: Callable, device: str = None, context_options: Optional[Dict] = None,
+            timeout: float = None, block_profile: str = None):
+        """비어 있는 브라우저의 새 컨텍스트에서 task(context)를 실행하고 결과 반환
+
+        device: Playwright 디바이스 이름 (예: 'iPhone 14 Pro'), context_options: new_context() 인자,
+        block_profile: 요청 차단 프로필 이름 (Config.RESOURCE_BLOCK_PROFILES, 없으면 차단하지 않음)
+        """
+        self._start_workers()
+        future = Future()
+        self.tasks.put((future, task, device, context_options, block_profile))
+        return future.result(timeout=timeout or Config.BROWSER_POOL_TASK_TIMEOUT)
+
+    def warn_no_psutil(self):
+        """psutil이 없어 메모리 기준 재시작을 못 한다는 경고 (한 번만 출력)"""
+        with self._lock:
+            if self._warned_no_psutil:
+                return
+            self._warned_no_psutil = True
+        print("⚠️ psutil이 설치되지 않아 브라우저 메모리 기준 재시작을 건너뜀 (사용 횟수 기준만 적용)")
+
+    def shutdown(self):
+        """모든 워커의 브라우저 종료"""
+        with self._lock:
+            workers, self.workers = self.workers, []
+        for _ in workers:
+            self.tasks.put(_STOP)
+        for worker in workers:
+            worker.join(timeout=10)
+
+
+# 전역 브라우저 풀 인스턴스
+browser_pool_instance = None
+_instance_lock = threading.Lock()
+
+def get_browser_pool() -> BrowserPool:
+    """브라우저 풀 인스턴스 반환"""
+    global browser_pool_instance
+    with _instance_lock:
+        if browser_pool_instance is None:
+            browser_pool_instance = BrowserPool()
+    return browser_pool_instance
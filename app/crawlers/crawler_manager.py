@@ -1,12 +1,27 @@
 from .site_crawlers import PpomppuCrawler, FmkoreaCrawler, BobaeCrawler, DcinsideCrawler, RuliwebCrawler, DogdripCrawler
+from .async_crawler import ASYNC_CRAWLERS, create_async_client
+from .http_cache import get_http_cache
+from .fingerprints import FingerprintStore
 from app.models import Post, db
+from app.data_version import bump_data_version, get_data_version
+from app.leader import PROCESS_OWNER, acquire_lease, release_lease
+from config import Config
+from flask import current_app
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Tuple
+import asyncio
+import threading
+import time
+
+# 사이트별 크롤링 잠금 임대 이름 접두사 (모든 워커가 공유)
+SITE_LEASE_PREFIX = 'crawl_site:'
 
 class CrawlerManager:
     """크롤러 관리자 클래스"""
     
     def __init__(self):
+        # 사이트별 크롤러 (크롤링할 때마다 같은 클래스의 새 인스턴스를 만들어 실행 - new_crawler)
         self.crawlers = {
             'ppomppu': PpomppuCrawler(),
             'fmkorea': FmkoreaCrawler(),
@@ -15,76 +30,466 @@ class CrawlerManager:
             'dcinside': DcinsideCrawler(),
             'dogdrip': DogdripCrawler()
         }
+        
+        # 사이트별 마지막 목록 지문 - 같으면 크롤러가 파싱 없이 '변경 없음'을 반환
+        self.fingerprints = FingerprintStore()
+        for crawler in self.crawlers.values():
+            crawler.fingerprints = self.fingerprints
+        
+        # 사이트별 마지막 크롤링 결과 (상태, 게시물 수, 소요 시간) - 통째로 비우지 않고 사이트 항목만 교체
+        self.last_crawl_report = {}
+        
+        # 현재(또는 마지막) 전체 크롤링의 사이트별 결과 (진행 상황 조회용)
+        self.current_run = {}
+        
+        # 이 프로세스에서 실행 중인 사이트 (제한 시간을 넘긴 워커 포함) - 다른 워커와는 DB 임대로 중복 방지
+        self._running_sites = set()
+        # 제한 시간을 넘겨 결과를 버린 사이트 - 워커가 끝날 때 DB 임대를 직접 해제
+        self._abandoned_sites = set()
+        self._running_lock = threading.Lock()
+    
+    def new_crawler(self, site_name: str):
+        """이번 크롤링 전용 크롤러 인스턴스 (변경 여부/지문/검증자 상태를 다른 실행과 공유하지 않음)"""
+        crawler = type(self.crawlers[site_name])()
+        crawler.fingerprints = self.fingerprints
+        return crawler
+    
+    def _claim_site(self, site_name: str, run: Dict = None) -> bool:
+        """이 프로세스와 다른 워커 어디에서도 실행 중이 아닌 사이트만 점유 (앱 컨텍스트 필요)"""
+        with self._running_lock:
+            if site_name in self._running_sites:
+                claimed = False
+            else:
+                self._running_sites.add(site_name)
+                claimed = True
+        
+        if claimed:
+            try:
+                claimed = acquire_lease(f"{SITE_LEASE_PREFIX}{site_name}", PROCESS_OWNER, Config.CRAWL_SITE_LOCK_TTL)
+            except Exception as e:
+                print(f"{site_name} 크롤링 잠금 오류: {e}")
+                claimed = False
+            if not claimed:
+                with self._running_lock:
+                    self._running_sites.discard(site_name)
+        
+        if not claimed:
+            print(f"{site_name} 이전 크롤링이 아직 실행 중이므로 건너뜀")
+            self._record(site_name, 'skipped', time.monotonic(), run)
+        return claimed
+    
+    def _release_site(self, site_name: str, local: bool = True):
+        """사이트 잠금 해제 (local=False면 DB 임대만 해제 - 워커 스레드가 끝날 때 직접 해제)"""
+        release_lease(f"{SITE_LEASE_PREFIX}{site_name}", PROCESS_OWNER)
+        if local:
+            with self._running_lock:
+                self._running_sites.discard(site_name)
     
-    def crawl_all_sites(self) -> int:
-        """모든 사이트 크롤링"""
+    def _worker_finished(self, app, site_name: str):
+        """워커 스레드 종료 처리 - 제한 시간을 넘겨 버려진 워커면 DB 임대도 여기서 해제"""
+        with self._running_lock:
+            self._running_sites.discard(site_name)
+            abandoned = site_name in self._abandoned_sites
+            self._abandoned_sites.discard(site_name)
+        if abandoned:
+            with app.app_context():
+                release_lease(f"{SITE_LEASE_PREFIX}{site_name}", PROCESS_OWNER)
+    
+    def _abandon_site(self, site_name: str):
+        """제한 시간을 넘긴 사이트의 결과를 버림 - 워커가 아직 실행 중이면 끝날 때 잠금을 풀고, 이미 끝났으면 지금 해제"""
+        with self._running_lock:
+            still_running = site_name in self._running_sites
+            if still_running:
+                self._abandoned_sites.add(site_name)
+        if not still_running:
+            self._release_site(site_name)
+    
+    def crawl_all_sites(self, concurrent: bool = None, max_workers: int = None,
+                        site_timeout: float = None, use_async: bool = None) -> int:
+        """모든 사이트 크롤링 (use_async면 비동기 크롤러로, concurrent면 사이트별 워커로 동시에)"""
+        if use_async is None:
+            use_async = Config.CRAWL_ASYNC
+        if use_async:
+            return self.crawl_all_sites_async(site_timeout)
+        
+        if concurrent is None:
+            concurrent = Config.CRAWL_CONCURRENT
+        
+        run = self.current_run = {}
+        
+        if concurrent:
+            total_new_posts = self._crawl_concurrently(
+                max_workers or Config.CRAWL_MAX_WORKERS,
+                site_timeout or Config.CRAWL_SITE_TIMEOUT,
+                run
+            )
+        else:
+            total_new_posts = self._crawl_sequentially(run)
+        
+        self._report_cache_stats(run)
+        return total_new_posts
+    
+    def _crawl_sequentially(self, run: Dict) -> int:
+        """사이트를 하나씩 순서대로 크롤링"""
         total_new_posts = 0
         
-        for site_name, crawler in self.crawlers.items():
+        for site_name in self.crawlers:
+            if not self._claim_site(site_name, run):
+                continue
+            
+            started_at = time.monotonic()
             try:
                 print(f"{site_name} 크롤링 시작...")
+                crawler = self.new_crawler(site_name)
                 posts = crawler.crawl_popular_posts()
-                new_posts = self.save_posts(posts)
-                total_new_posts += new_posts
-                print(f"{site_name}: {new_posts}개 새 게시물 저장")
+                total_new_posts += self._save_site_posts(site_name, posts, started_at, crawler, run)['new_posts']
                 
             except Exception as e:
                 print(f"{site_name} 크롤링 오류: {e}")
+                self._record(site_name, 'error', started_at, run, error=str(e))
                 continue
+            finally:
+                self._release_site(site_name)
+        
+        return total_new_posts
+    
+    def _crawl_concurrently(self, max_workers: int, site_timeout: float, run: Dict) -> int:
+        """사이트별 워커에서 동시에 크롤링 (저장은 호출한 스레드에서 순차 처리)"""
+        app = current_app._get_current_object()
+        total_new_posts = 0
+        started = {}
+        
+        def run_worker(site_name, crawler):
+            started[site_name] = time.monotonic()
+            try:
+                return crawler.crawl_popular_posts()
+            finally:
+                self._worker_finished(app, site_name)
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='crawler')
+        futures = {}
+        crawlers = {}
+        
+        for site_name in self.crawlers:
+            if not self._claim_site(site_name, run):
+                continue
+            
+            print(f"{site_name} 크롤링 시작...")
+            crawlers[site_name] = self.new_crawler(site_name)
+            futures[executor.submit(run_worker, site_name, crawlers[site_name])] = site_name
+        
+        pending = set(futures)
+        
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=1, return_when=FIRST_COMPLETED)
+                
+                # DB 세션은 스레드에 묶여 있으므로 저장은 여기(호출 스레드)에서만 수행
+                for future in done:
+                    site_name = futures[future]
+                    try:
+                        posts = future.result()
+                        report = self._save_site_posts(site_name, posts, started[site_name], crawlers[site_name], run)
+                        total_new_posts += report['new_posts']
+                    except Exception as e:
+                        print(f"{site_name} 크롤링 오류: {e}")
+                        self._record(site_name, 'error', started.get(site_name, time.monotonic()), run, error=str(e))
+                    finally:
+                        self._release_site(site_name, local=False)
+                
+                # 제한 시간을 넘긴 사이트는 기다리지 않고 결과를 버림 (그 크롤러 인스턴스는 다시 쓰지 않음)
+                now = time.monotonic()
+                for future in list(pending):
+                    site_name = futures[future]
+                    if site_name in started and now - started[site_name] > site_timeout:
+                        pending.discard(future)
+                        print(f"{site_name} 크롤링 제한 시간 초과 ({site_timeout}초) - 결과 무시")
+                        self._record(site_name, 'timeout', started[site_name], run,
+                                     error=f'제한 시간 초과 ({site_timeout}초)')
+                        self._abandon_site(site_name)
+        finally:
+            # 아직 시작하지 않은 작업은 취소하고, 실행 중인 워커는 기다리지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
+            for future, site_name in futures.items():
+                if future.cancelled():
+                    self._release_site(site_name)
+        
+        return total_new_posts
+    
+    def crawl_all_sites_async(self, site_timeout: float = None) -> int:
+        """하나의 이벤트 루프에서 모든 사이트 크롤링
+
+        비동기 구현이 있는 사이트는 공유 HTTP 클라이언트로 동시에 요청하고,
+        나머지(Playwright를 쓰는 보배드림 등)는 별도 스레드에서 실행한다.
+        """
+        site_timeout = site_timeout or Config.CRAWL_SITE_TIMEOUT
+        run = self.current_run = {}
+        
+        claimed = [site_name for site_name in self.crawlers if self._claim_site(site_name, run)]
+        try:
+            results = asyncio.run(self._gather_async(site_timeout, claimed, current_app._get_current_object()))
+        except Exception:
+            for site_name in claimed:
+                self._release_site(site_name)
+            raise
+        
+        # 저장은 호출한 스레드에서 사이트 순서대로 처리
+        total_new_posts = 0
+        for site_name in claimed:
+            status, posts, elapsed, error, crawler = results[site_name]
+            started_at = time.monotonic() - elapsed
+            threaded = site_name not in ASYNC_CRAWLERS
+            
+            try:
+                if status != 'success':
+                    print(f"{site_name} 크롤링 오류: {error}")
+                    self._record(site_name, status, started_at, run, error=error)
+                    continue
+                
+                total_new_posts += self._save_site_posts(site_name, posts, started_at, crawler, run)['new_posts']
+            except Exception as e:
+                print(f"{site_name} 크롤링 오류: {e}")
+                self._record(site_name, 'error', started_at, run, error=str(e))
+            finally:
+                if threaded and status == 'timeout':
+                    # 스레드는 아직 실행 중일 수 있으므로 끝날 때 잠금을 풀게 함
+                    self._abandon_site(site_name)
+                else:
+                    self._release_site(site_name, local=not threaded)
         
+        self._report_cache_stats(run)
         return total_new_posts
     
+    async def _gather_async(self, site_timeout: float, site_names: List[str], app) -> Dict[str, tuple]:
+        """사이트별 크롤링 코루틴을 동시에 실행하고 (상태, 게시물, 소요 시간, 오류, 크롤러) 반환"""
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=max(1, len(site_names)), thread_name_prefix='crawler')
+        
+        def run_threaded(site_name, crawler):
+            try:
+                return crawler.crawl_popular_posts()
+            finally:
+                self._worker_finished(app, site_name)
+        
+        async def run(site_name, crawler, make_coro):
+            print(f"{site_name} 크롤링 시작...")
+            started_at = time.monotonic()
+            try:
+                posts = await asyncio.wait_for(make_coro(), timeout=site_timeout)
+                status, error = 'success', None
+            except asyncio.TimeoutError:
+                posts, status, error = [], 'timeout', f'제한 시간 초과 ({site_timeout}초)'
+            except Exception as e:
+                posts, status, error = [], 'error', str(e)
+            return site_name, (status, posts, round(time.monotonic() - started_at, 2), error, crawler)
+        
+        try:
+            async with create_async_client() as client:
+                jobs = []
+                for site_name in site_names:
+                    if site_name in ASYNC_CRAWLERS:
+                        async_crawler = ASYNC_CRAWLERS[site_name](client=client)
+                        async_crawler.fingerprints = self.fingerprints
+                        jobs.append(run(site_name, async_crawler, async_crawler.crawl_popular_posts))
+                    else:
+                        crawler = self.new_crawler(site_name)
+                        jobs.append(run(site_name, crawler,
+                                        lambda s=site_name, c=crawler: loop.run_in_executor(executor, run_threaded, s, c)))
+                
+                return dict(await asyncio.gather(*jobs))
+        finally:
+            # 제한 시간을 넘긴 스레드 작업은 기다리지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _save_site_posts(self, site_name: str, posts: List[Dict], started_at: float, crawler, run: Dict = None) -> Dict:
+        """사이트 크롤링 결과 저장 후 결과 기록 반환 (crawler: 이번 실행에서 목록을 받은 인스턴스)"""
+        if crawler.unchanged:
+            refreshed = self.refresh_timestamps(site_name)
+            crawler.commit_validators()
+            print(f"{site_name}: 변경 없음 ({refreshed}개 게시물 수집 시각 갱신)")
+            return self._record(site_name, 'unchanged', started_at, run, refreshed=refreshed)
+        
+        new_posts, changed_posts = self._upsert_posts(posts)
+        
+        # 저장까지 끝난 목록만 지문과 HTTP 캐시 검증자를 기록 (실패하면 다음 크롤링에서 다시 받아 파싱)
+        if posts and crawler.pending_fingerprint:
+            self.fingerprints.update(site_name, crawler.pending_fingerprint, [post['url'] for post in posts])
+        if posts:
+            crawler.commit_validators()
+        
+        print(f"{site_name}: {new_posts}개 새 게시물 저장")
+        return self._record(site_name, 'success', started_at, run, posts=len(posts), new_posts=new_posts,
+                            changed_posts=changed_posts)
+    
+    def refresh_timestamps(self, site_name: str) -> int:
+        """목록이 바뀌지 않은 사이트는 지난번 게시물들의 수집 시각만 갱신"""
+        urls = self.fingerprints.get_urls(site_name)
+        if not urls:
+            return 0
+        
+        try:
+            refreshed = Post.query.filter(Post.url.in_(urls)).update(
+                {Post.crawled_at: datetime.utcnow()}, synchronize_session=False
+            )
+            if refreshed:
+                bump_data_version()
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            print(f"데이터베이스 커밋 오류: {e}")
+            raise
+        
+        if refreshed:
+            get_data_version().expire()
+        return refreshed
+    
+    def _report_cache_stats(self, run: Dict):
+        """사이트별 HTTP 캐시 통계 (적중 / 미스 / 재검증 횟수)를 이번 실행 결과에 추가"""
+        cache_stats = get_http_cache().get_stats()
+        for site_name, report in run.items():
+            if site_name in cache_stats:
+                report['http_cache'] = cache_stats[site_name]
+                counts = cache_stats[site_name]
+                print(f"{site_name} HTTP 캐시: 적중 {counts['hits']}, 미스 {counts['misses']}, 재검증 {counts['revalidations']}")
+    
+    def get_progress(self) -> Dict[str, Dict]:
+        """현재 전체 크롤링의 사이트별 진행 상황 (끝난 사이트는 결과, 나머지는 running / pending)"""
+        with self._running_lock:
+            running = set(self._running_sites)
+        
+        run = self.current_run
+        progress = {}
+        for site_name in self.crawlers:
+            if site_name in run:
+                progress[site_name] = dict(run[site_name])
+            else:
+                progress[site_name] = {'status': 'running' if site_name in running else 'pending'}
+        return progress
+    
+    def _record(self, site_name: str, status: str, started_at: float, run: Dict = None, **extra) -> Dict:
+        """사이트별 크롤링 결과 기록 후 반환 (run: 전체 크롤링이면 그 실행의 결과 모음)"""
+        report = {
+            'status': status,
+            'posts': 0,
+            'new_posts': 0,
+            'changed_posts': 0,
+            'elapsed': round(time.monotonic() - started_at, 2)
+        }
+        report.update(extra)
+        self.last_crawl_report[site_name] = report
+        if run is not None:
+            run[site_name] = report
+        return report
+    
     def crawl_site(self, site_name: str) -> int:
         """특정 사이트 크롤링"""
+        return self.crawl_site_with_report(site_name)['new_posts']
+    
+    def crawl_site_with_report(self, site_name: str) -> Dict:
+        """특정 사이트 크롤링 후 이번 실행의 결과 기록 반환 (다른 크롤링이 last_crawl_report를 바꿔도 영향 없음)"""
         if site_name not in self.crawlers:
             raise ValueError(f"지원하지 않는 사이트: {site_name}")
         
-        crawler = self.crawlers[site_name]
-        posts = crawler.crawl_popular_posts()
-        return self.save_posts(posts)
+        run = {}
+        if not self._claim_site(site_name, run):
+            return run[site_name]
+        
+        started_at = time.monotonic()
+        try:
+            crawler = self.new_crawler(site_name)
+            posts = crawler.crawl_popular_posts()
+            return self._save_site_posts(site_name, posts, started_at, crawler)
+        finally:
+            self._release_site(site_name)
     
     def save_posts(self, posts_data: List[Dict]) -> int:
-        """게시물 데이터 저장"""
-        new_posts_count = 0
-        
+        """게시물 데이터 저장 후 새 게시물 수 반환"""
+        return self._upsert_posts(posts_data)[0]
+    
+    def _upsert_posts(self, posts_data: List[Dict]) -> Tuple[int, int]:
+        """게시물 데이터 저장 (URL 기준 일괄 upsert) 후 (새 게시물 수, 수치가 바뀐 기존 게시물 수) 반환
+
+        기존 URL은 한 번의 SELECT로 찾고, 조회수/추천수/댓글수/수집 시각 갱신과
+        새 게시물 추가를 각각 하나의 executemany 문으로 처리한다.
+        """
+        # 같은 URL이 여러 번 들어오면 첫 데이터에 이후 수치만 덮어씀
+        incoming = {}
         for post_data in posts_data:
             try:
-                # 중복 체크 (URL 기준)
-                existing_post = Post.query.filter_by(url=post_data['url']).first()
-                
-                if existing_post:
+                url = post_data['url']
+                if url in incoming:
+                    for key in ('views', 'likes', 'comments'):
+                        if key in post_data:
+                            incoming[url][key] = post_data[key]
+                else:
+                    incoming[url] = dict(post_data)
+            except Exception as e:
+                print(f"게시물 저장 오류: {e}")
+                continue
+        
+        if not incoming:
+            return 0, 0
+        
+        # 중복 체크 (URL 기준) - 한 번의 쿼리로 기존 게시물 조회
+        existing = {}
+        rows = db.session.query(Post.id, Post.url, Post.views, Post.likes, Post.comments) \
+            .filter(Post.url.in_(list(incoming))) \
+            .order_by(Post.id) \
+            .all()
+        for row in rows:
+            existing.setdefault(row.url, row)
+        
+        now = datetime.utcnow()
+        updates = []
+        inserts = []
+        changed = 0
+        
+        for url, post_data in incoming.items():
+            try:
+                row = existing.get(url)
+                if row:
                     # 기존 게시물 업데이트 (조회수, 추천수 등)
-                    existing_post.views = post_data.get('views', existing_post.views)
-                    existing_post.likes = post_data.get('likes', existing_post.likes)
-                    existing_post.comments = post_data.get('comments', existing_post.comments)
-                    existing_post.crawled_at = datetime.utcnow()
+                    update = {
+                        'id': row.id,
+                        'views': post_data.get('views', row.views) or 0,
+                        'likes': post_data.get('likes', row.likes),
+                        'comments': post_data.get('comments', row.comments),
+                        'crawled_at': now
+                    }
+                    if (update['views'], update['likes'], update['comments']) != (row.views, row.likes, row.comments):
+                        changed += 1
+                    updates.append(update)
                 else:
                     # 새 게시물 생성
-                    new_post = Post(
-                        title=post_data['title'],
-                        url=post_data['url'],
-                        site=post_data['site'],
-                        category=post_data['category'],
-                        author=post_data.get('author', ''),
-                        views=post_data.get('views', 0),
-                        likes=post_data.get('likes', 0),
-                        comments=post_data.get('comments', 0),
-                        created_at=datetime.utcnow(),
-                        crawled_at=datetime.utcnow()
-                    )
-                    
-                    db.session.add(new_post)
-                    new_posts_count += 1
-                
+                    inserts.append({
+                        'title': post_data['title'],
+                        'url': url,
+                        'site': post_data['site'],
+                        'category': post_data['category'],
+                        'author': post_data.get('author', ''),
+                        'views': post_data.get('views') or 0,
+                        'likes': post_data.get('likes', 0),
+                        'comments': post_data.get('comments', 0),
+                        'created_at': now,
+                        'crawled_at': now
+                    })
             except Exception as e:
                 print(f"게시물 저장 오류: {e}")
                 continue
         
         try:
+            if updates:
+                db.session.execute(db.update(Post), updates)
+            if inserts:
+                db.session.execute(db.insert(Post), inserts)
+            # 같은 트랜잭션에서 데이터 버전을 올려 모든 워커의 응답/통계 캐시를 무효화
+            bump_data_version()
             db.session.commit()
         except Exception as e:
             db.session.rollback()
             print(f"데이터베이스 커밋 오류: {e}")
             raise
         
-        return new_posts_count
\ No newline at end of file
+        get_data_version().expire()
+        
+        return len(inserts), changed
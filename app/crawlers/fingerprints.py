@@ -0,0 +1,78 @@
+"""목록 페이지 내용 지문(fingerprint) 저장소 - 내용이 같으면 파싱과 저장을 건너뜀"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from config import Config
+
+# 요청마다 달라지는 스크립트/스타일/주석은 지문에서 제외
+_VOLATILE_BLOCKS = re.compile(rb'<script\b.*?</script>|<style\b.*?</style>|<!--.*?-->', re.S | re.I)
+_WHITESPACE = re.compile(rb'\s+')
+
+
+def compute_fingerprint(content, markers: Optional[Tuple[bytes, bytes]] = None) -> str:
+    """HTML에서 게시물 목록 영역만 잘라 정규화한 뒤 해시 계산
+
+    markers가 (시작, 끝) 문자열이면 그 사이 영역만 사용하고, 찾지 못하면 문서 전체를 사용한다.
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8', errors='ignore')
+
+    region = content
+    if markers:
+        start_marker, end_marker = markers
+        start = content.find(start_marker)
+        if start != -1:
+            end = content.find(end_marker, start)
+            region = content[start:end + len(end_marker)] if end != -1 else content[start:]
+
+    region = _VOLATILE_BLOCKS.sub(b'', region)
+    region = _WHITESPACE.sub(b' ', region)
+    return hashlib.sha1(region).hexdigest()
+
+
+class FingerprintStore:
+    """사이트별 마지막 목록 지문과 그때 저장한 게시물 URL을 파일에 보관"""
+
+    def __init__(self, path: str = None):
+        self.path = path or Config.FINGERPRINT_FILE
+        self._lock = threading.Lock()
+        self._data = self._load()
+
+    def _load(self) -> Dict:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, site_name: str) -> Optional[str]:
+        """사이트의 마지막 지문 반환"""
+        with self._lock:
+            entry = self._data.get(site_name)
+            return entry['hash'] if entry else None
+
+    def get_urls(self, site_name: str) -> List[str]:
+        """마지막 지문을 기록할 때 저장한 게시물 URL 목록"""
+        with self._lock:
+            entry = self._data.get(site_name)
+            return list(entry['urls']) if entry else []
+
+    def update(self, site_name: str, fingerprint: str, urls: List[str]):
+        """저장이 끝난 목록의 지문 기록"""
+        with self._lock:
+            self._data[site_name] = {
+                'hash': fingerprint,
+                'urls': urls,
+                'updated_at': time.time()
+            }
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
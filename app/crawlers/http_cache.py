@@ -0,0 +1,199 @@
+"""목록 페이지용 디스크 HTTP 캐시 (ETag / Last-Modified 조건부 요청)"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Optional
+
+from config import Config
+from .rate_limiter import RateLimitedAdapter
+
+
+class HTTPCache:
+    """응답 검증자(ETag, Last-Modified)를 디스크에 저장하는 캐시 (본문은 저장하지 않음)
+
+    용량(max_bytes)과 보관 기간(max_age)을 넘는 항목은 오래된 것부터 삭제한다.
+    """
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = None, max_age: int = None):
+        self.cache_dir = cache_dir or Config.HTTP_CACHE_DIR
+        self.max_bytes = max_bytes if max_bytes is not None else Config.HTTP_CACHE_MAX_BYTES
+        self.max_age = max_age if max_age is not None else Config.HTTP_CACHE_MAX_AGE
+        self.stats = defaultdict(lambda: {'hits': 0, 'misses': 0, 'revalidations': 0})
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> str:
+        """URL에 해당하는 검증자 파일 경로"""
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """저장된 검증자 반환 (없거나 보관 기간이 지났으면 None)"""
+        meta_path = self._path(url)
+        with self._lock:
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                return None
+
+            if time.time() - meta.get('stored_at', 0) > self.max_age:
+                self._remove(meta_path)
+                return None
+            return meta
+
+    @staticmethod
+    def validators(url: str, response) -> Optional[Dict]:
+        """200 응답의 검증자 (없으면 None) - 저장은 store()로 따로 함"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return None
+        return {'url': url, 'etag': etag, 'last_modified': last_modified}
+
+    def store(self, meta: Dict):
+        """validators()로 만든 검증자 저장"""
+        meta = dict(meta, stored_at=time.time())
+        with self._lock:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._path(meta['url']), 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            self._enforce_limits()
+
+    def touch(self, url: str):
+        """304로 재검증된 항목의 보관 시작 시각 갱신"""
+        meta_path = self._path(url)
+        with self._lock:
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                meta['stored_at'] = time.time()
+                with open(meta_path, 'w', encoding='utf-8') as f:
+                    json.dump(meta, f)
+            except (OSError, ValueError):
+                pass
+
+    def record(self, site_name: str, kind: str):
+        """사이트별 캐시 통계 기록 (hits / misses / revalidations)"""
+        with self._lock:
+            self.stats[site_name][kind] += 1
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """사이트별 캐시 통계 사본 반환"""
+        with self._lock:
+            return {site: dict(counts) for site, counts in self.stats.items()}
+
+    def _remove(self, *paths):
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _enforce_limits(self):
+        """보관 기간이 지난 항목 삭제 후 용량을 넘으면 오래된 항목부터 삭제 (잠금 상태에서 호출)"""
+        entries = []
+        now = time.time()
+
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.json'):
+                continue
+            meta_path = os.path.join(self.cache_dir, name)
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                size = os.path.getsize(meta_path)
+            except (OSError, ValueError):
+                self._remove(meta_path)
+                continue
+
+            if now - meta.get('stored_at', 0) > self.max_age:
+                self._remove(meta_path)
+                continue
+            entries.append((meta.get('stored_at', 0), size, meta_path))
+
+        total_size = sum(entry[1] for entry in entries)
+        for stored_at, size, meta_path in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+            self._remove(meta_path)
+            total_size -= size
+
+
+class CachingAdapter(RateLimitedAdapter):
+    """GET 요청에 If-None-Match / If-Modified-Since를 붙이고 200 응답의 검증자를 모아 두는 어댑터
+
+    서버가 304로 응답하면 본문 없는 304 응답을 그대로 돌려주므로,
+    크롤러는 BaseCrawler.is_not_modified()로 확인한 뒤 파싱을 건너뛸 수 있다.
+    새 검증자는 게시물이 DB에 저장된 뒤 commit_pending()으로 기록하므로,
+    저장에 실패한 목록은 다음 크롤링에서 304로 건너뛰지 않고 다시 받는다.
+    """
+
+    def __init__(self, site_name: str, cache: HTTPCache = None, **kwargs):
+        self.site_name = site_name
+        self.cache = cache or get_http_cache()
+        self._pending = {}   # URL -> 아직 기록하지 않은 검증자
+        self._pending_lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def commit_pending(self):
+        """모아 둔 검증자를 디스크 캐시에 기록"""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for meta in pending.values():
+            self.cache.store(meta)
+
+    def discard_pending(self):
+        """모아 둔 검증자 버림 (다음 크롤링 시작 시)"""
+        with self._pending_lock:
+            self._pending = {}
+
+    def add_conditional_headers(self, url: str, headers) -> bool:
+        """저장된 검증자로 조건부 요청 헤더를 추가하고, 추가했으면 True (비동기 크롤러도 사용)"""
+        entry = self.cache.lookup(url)
+        if not entry or 'If-None-Match' in headers or 'If-Modified-Since' in headers:
+            return False
+
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        self.cache.record(self.site_name, 'revalidations')
+        return True
+
+    def remember_response(self, url: str, response, conditional: bool):
+        """304는 캐시 적중으로 기록하고, 200 응답의 검증자는 commit_pending() 때까지 모아 둠"""
+        if response.status_code == 304 and conditional:
+            self.cache.record(self.site_name, 'hits')
+            self.cache.touch(url)
+        elif response.status_code == 200:
+            self.cache.record(self.site_name, 'misses')
+            meta = self.cache.validators(url, response)
+            if meta:
+                with self._pending_lock:
+                    self._pending[url] = meta
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET':
+            return super().send(request, **kwargs)
+
+        conditional = self.add_conditional_headers(request.url, request.headers)
+        response = super().send(request, **kwargs)
+        self.remember_response(request.url, response, conditional)
+        return response
+
+
+# 전역 HTTP 캐시 인스턴스
+http_cache_instance = None
+_instance_lock = threading.Lock()
+
+def get_http_cache() -> HTTPCache:
+    """HTTP 캐시 인스턴스 반환"""
+    global http_cache_instance
+    with _instance_lock:
+        if http_cache_instance is None:
+            http_cache_instance = HTTPCache()
+    return http_cache_instance
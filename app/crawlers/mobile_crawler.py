@@ -5,78 +5,100 @@ iPhone 14 Pro 화면으로 에뮬레이션하여 실제 모바일 화면 캡처
 페이지 끝까지 크롤링 및 봇 탐지 우회 강화
 """
 
+import os
 import time
 import random
 from typing import List, Dict
-from playwright.sync_api import sync_playwright
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
+from .rate_limiter import get_rate_limiter
+from .browser_pool import get_browser_pool
+from config import Config
 
 
 class MobileCrawler:
     """모바일 화면 크롤링을 위한 기본 클래스"""
     
+    # 에뮬레이션할 모바일 디바이스 (Playwright 디바이스 이름)
+    mobile_device = 'iPhone 14 Pro'
+    
+    # 요청 차단 프로필 (목록 HTML만 필요하므로 이미지/미디어/폰트/광고 차단)
+    block_profile = 'crawl'
+    
+    # 사이트별 목록 파싱 규칙 (하위 클래스에서 지정)
+    # list_selectors: 앞에서부터 시도할 게시물 링크 선택자, post_url_patterns: 게시물 링크로 인정할 href 문자열
+    display_name = ''
+    default_author = ''
+    list_selectors = []
+    post_url_patterns = []
+    
     def __init__(self, site_name: str):
         self.site_name = site_name
-        self.playwright = None
-        self.browser = None
-        self.context = None
         self.page = None
     
-    def setup_mobile_browser(self):
-        """모바일 브라우저 환경 설정 (iPhone 14 Pro 에뮬레이션)"""
-        try:
-            print(f"📱 {self.site_name} 모바일 브라우저 설정 중...")
-            
-            # Playwright 초기화
-            self.playwright = sync_playwright().start()
-            
-            # 브라우저 실행 (headless 모드)
-            self.browser = self.playwright.chromium.launch(
-                headless=False,
-                args=[
-                    '--no-sandbox', 
-                    '--disable-dev-shm-usage',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-features=VizDisplayCompositor'
-                ]
-            )
-            
-            # iPhone 14 Pro 디바이스로 컨텍스트 생성
-            self.context = self.browser.new_context(**self.playwright.devices['iPhone 14 Pro'])
-            
-            # 새 페이지 생성
-            self.page = self.context.new_page()
-            
-            # 타임아웃 설정
+    def run_with_mobile_page(self, fetch, url: str) -> str:
+        """공유 브라우저 풀의 새 모바일 컨텍스트(iPhone 14 Pro 에뮬레이션)에서 fetch(url) 실행"""
+        def task(context):
+            # 새 페이지 생성 후 타임아웃 설정
+            self.page = context.new_page()
             self.page.set_default_timeout(30000)  # 30초
-            
-            print(f"✅ {self.site_name} 모바일 브라우저 설정 완료")
-            return True
-            
+            try:
+                return fetch(url)
+            finally:
+                self.page = None
+        
+        try:
+            print(f"📱 {self.site_name} 모바일 브라우저 컨텍스트 준비 중...")
+            return get_browser_pool().run(task, device=self.mobile_device, block_profile=self.block_profile)
         except Exception as e:
-            print(f"❌ {self.site_name} 브라우저 설정 실패: {e}")
-            self.cleanup()
+            print(f"❌ {self.site_name} 브라우저 실행 실패: {e}")
+            return None
+    
+    def open_page(self, url: str) -> bool:
+        """페이지 이동 후 사이트 목록 셀렉터가 나타날 때까지만 대기 (networkidle 대신)"""
+        get_rate_limiter().wait(url)
+        response = self.page.goto(url, wait_until='domcontentloaded', timeout=30000)
+        
+        if response is None or response.status != 200:
+            print(f"❌ {self.site_name} HTTP 상태: {response.status if response else '응답 없음'}")
             return False
+        
+        ready_selector = Config.CRAWL_READY_SELECTORS.get(self.site_name)
+        if ready_selector:
+            started_at = time.monotonic()
+            try:
+                self.page.wait_for_selector(ready_selector, state='attached', timeout=Config.CRAWL_READY_TIMEOUT)
+                print(f"⚡ {self.site_name} 목록 준비 완료 ({time.monotonic() - started_at:.1f}초)")
+            except Exception:
+                print(f"⚠️ {self.site_name} 목록 셀렉터 대기 시간 초과, 현재 내용으로 진행")
+        return True
+    
+    def save_debug_screenshot(self):
+        """Config.CRAWL_DEBUG_SCREENSHOTS가 켜져 있을 때만 전체 페이지 스크린샷 저장"""
+        if not Config.CRAWL_DEBUG_SCREENSHOTS:
+            return
+        try:
+            os.makedirs(Config.CRAWL_DEBUG_SCREENSHOT_DIR, exist_ok=True)
+            screenshot_path = os.path.join(Config.CRAWL_DEBUG_SCREENSHOT_DIR,
+                                           f"mobile_screenshot_{self.site_name}_{int(time.time())}.png")
+            self.page.screenshot(path=screenshot_path, full_page=True)
+            print(f"📸 {self.site_name} 디버그 스크린샷 저장: {screenshot_path}")
+        except Exception as e:
+            print(f"⚠️ {self.site_name} 디버그 스크린샷 실패: {e}")
     
     def get_mobile_page_source(self, url: str) -> str:
         """모바일 화면에서 페이지 소스 가져오기 (페이지 끝까지)"""
-        if not self.setup_mobile_browser():
-            return None
-        
+        return self.run_with_mobile_page(self._fetch_mobile_page_source, url)
+    
+    def _fetch_mobile_page_source(self, url: str) -> str:
+        """페이지 끝까지 스크롤한 뒤 소스 반환 (브라우저 풀 워커에서 실행)"""
         try:
             print(f"📱 {self.site_name} 모바일 페이지 접속: {url}")
             
-            # 페이지 이동
-            response = self.page.goto(url, wait_until='networkidle', timeout=30000)
-            
-            if response.status != 200:
-                print(f"❌ {self.site_name} HTTP 상태: {response.status}")
+            # 페이지 이동 (목록이 나타날 때까지만 대기)
+            if not self.open_page(url):
                 return None
             
-            # 페이지 로딩 대기
-            time.sleep(3)
-            
             # 페이지 끝까지 스크롤하여 모든 콘텐츠 로드
             print(f"📜 {self.site_name} 페이지 끝까지 스크롤 중...")
             
@@ -97,10 +119,8 @@ class MobileCrawler:
             self.page.evaluate("window.scrollTo(0, 0)")
             time.sleep(2)
             
-            # 스크린샷 촬영 (페이지가 로드된 상태에서)
-            screenshot_path = f"mobile_screenshot_{self.site_name}_{int(time.time())}.png"
-            self.page.screenshot(path=screenshot_path, full_page=True)
-            print(f"📸 {self.site_name} 모바일 스크린샷 저장: {screenshot_path}")
+            # 디버그 스크린샷 (설정 시에만)
+            self.save_debug_screenshot()
             
             # 페이지 소스 반환
             page_source = self.page.content()
@@ -126,38 +146,88 @@ class MobileCrawler:
                 return True
         return False
     
-    def cleanup(self):
-        """브라우저 리소스 정리"""
-        try:
-            if self.page:
-                self.page.close()
-                self.page = None
-            
-            if self.context:
-                self.context.close()
-                self.context = None
-            
-            if self.browser:
-                self.browser.close()
-                self.browser = None
-            
-            if self.playwright:
-                self.playwright.stop()
-                self.playwright = None
-            
-            print(f"🔌 {self.site_name} 모바일 브라우저 정리 완료")
+    def parse_posts(self, page_source: str) -> List[Dict]:
+        """모바일 페이지 소스에서 게시물 링크 추출 (5개 넘게 잡히는 첫 선택자 사용, 페이지 끝까지)"""
+        soup = BeautifulSoup(page_source, 'html.parser')
+        
+        post_list = []
+        seen_titles = set()
+        
+        print(f"📱 {self.display_name} 모바일 페이지 분석 중... (페이지 크기: {len(page_source)} 문자)")
+        
+        for selector in self.list_selectors:
+            elements = soup.select(selector)
+            print(f"📱 {selector} 선택자로 {len(elements)}개 요소 발견")
             
-        except Exception as e:
-            print(f"❌ {self.site_name} 브라우저 정리 오류: {e}")
+            if len(elements) > 5:
+                # 제한 없이 모든 요소 처리 (페이지 끝까지)
+                for element in elements:
+                    try:
+                        title = element.get_text(strip=True)
+                        if not title or len(title) < 5:
+                            continue
+                        
+                        if title in seen_titles:
+                            continue
+                        
+                        if self.should_exclude_post(title):
+                            continue
+                        
+                        seen_titles.add(title)
+                        
+                        # URL 구성
+                        href = element.get('href', '')
+                        if href.startswith('/'):
+                            post_url = self.base_url + href
+                        elif href.startswith('http'):
+                            post_url = href
+                        else:
+                            post_url = f"{self.base_url}/{href}"
+                        
+                        # 게시물인지 확인
+                        if not any(pattern in href for pattern in self.post_url_patterns):
+                            continue
+                        
+                        post_data = {
+                            'title': title,
+                            'url': post_url,
+                            'site': self.site_name,
+                            'category': '인기',
+                            'author': self.default_author,
+                            'views': 0,
+                            'likes': 1,
+                            'comments': 0,
+                            'popularity_score': 1
+                        }
+                        
+                        post_list.append(post_data)
+                        
+                    except Exception as e:
+                        continue
+                
+                if post_list:
+                    break
+        
+        return post_list
     
-    def __del__(self):
-        """소멸자에서 리소스 정리"""
-        self.cleanup()
+    def cleanup(self):
+        """크롤링 후 정리 (컨텍스트는 작업이 끝나면 닫히고 브라우저는 브라우저 풀이 관리)"""
+        self.page = None
 
 
 class MobilePpomppuCrawler(MobileCrawler):
     """Playwright 기반 뽐뿌 모바일 크롤러"""
     
+    display_name = '뽐뿌'
+    default_author = '뽐뿌'
+    list_selectors = [
+        'table tr td a',
+        'a[href*="zboard.php"]',
+        'a[href*="view.php"]',
+        '.list a'
+    ]
+    post_url_patterns = ['zboard', 'view', 'hot']
+    
     def __init__(self):
         super().__init__('ppomppu')
         self.base_url = 'https://www.ppomppu.co.kr'
@@ -170,81 +240,12 @@ class MobilePpomppuCrawler(MobileCrawler):
             # 모바일 HOT 게시판 접속
             url = f"{self.base_url}/hot.php?category=2"
             
-            # 모바일 페이지 소스 가져오기 (스크린샷 자동 촬영)
+            # 모바일 페이지 소스 가져오기
             page_source = self.get_mobile_page_source(url)
             if not page_source:
                 return posts
             
-            # BeautifulSoup으로 파싱
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            post_list = []
-            seen_titles = set()
-            
-            # 뽐뿌 모바일 버전 게시물 파싱
-            selectors = [
-                'table tr td a',
-                'a[href*="zboard.php"]',
-                'a[href*="view.php"]',
-                '.list a'
-            ]
-            
-            print(f"📱 뽐뿌 모바일 페이지 분석 중... (페이지 크기: {len(page_source)} 문자)")
-            
-            for selector in selectors:
-                elements = soup.select(selector)
-                print(f"📱 {selector} 선택자로 {len(elements)}개 요소 발견")
-                
-                if len(elements) > 5:
-                    # 제한 없이 모든 요소 처리 (페이지 끝까지)
-                    for element in elements:
-                        try:
-                            title = element.get_text(strip=True)
-                            if not title or len(title) < 5:
-                                continue
-                            
-                            if title in seen_titles:
-                                continue
-                            
-                            if self.should_exclude_post(title):
-                                continue
-                            
-                            seen_titles.add(title)
-                            
-                            # URL 구성
-                            href = element.get('href', '')
-                            if href.startswith('/'):
-                                post_url = self.base_url + href
-                            elif href.startswith('http'):
-                                post_url = href
-                            else:
-                                post_url = f"{self.base_url}/{href}"
-                            
-                            # 게시물인지 확인
-                            if not any(pattern in href for pattern in ['zboard', 'view', 'hot']):
-                                continue
-                            
-                            post_data = {
-                                'title': title,
-                                'url': post_url,
-                                'site': self.site_name,
-                                'category': '인기',
-                                'author': '뽐뿌',
-                                'views': 0,
-                                'likes': 1,
-                                'comments': 0,
-                                'popularity_score': 1
-                            }
-                            
-                            post_list.append(post_data)
-                            
-                        except Exception as e:
-                            continue
-                    
-                    if post_list:
-                        break
-            
-            posts = post_list
+            posts = self.parse_posts(page_source)
             
             if not posts:
                 print(f"⚠️  뽐뿌 모바일에서 게시물을 찾지 못했습니다.")
@@ -265,6 +266,16 @@ class MobilePpomppuCrawler(MobileCrawler):
 class MobileBobaeCrawler(MobileCrawler):
     """Playwright 기반 보배드림 모바일 크롤러"""
     
+    display_name = '보배드림'
+    default_author = '보배드림'
+    list_selectors = [
+        'table tr td a',
+        'a[href*="view"]',
+        '.list a',
+        'div[class*="list"] a'
+    ]
+    post_url_patterns = ['view', 'read', 'best']
+    
     def __init__(self):
         super().__init__('bobae')
         self.base_url = 'https://www.bobaedream.co.kr'
@@ -277,81 +288,12 @@ class MobileBobaeCrawler(MobileCrawler):
             # 모바일 베스트 게시판 접속
             url = f"{self.base_url}/board/bulletin/list.php?code=best&vdate=w"
             
-            # 모바일 페이지 소스 가져오기 (스크린샷 자동 촬영)
+            # 모바일 페이지 소스 가져오기
             page_source = self.get_mobile_page_source(url)
             if not page_source:
                 return posts
             
-            # BeautifulSoup으로 파싱
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            post_list = []
-            seen_titles = set()
-            
-            # 보배드림 모바일 버전 게시물 파싱
-            selectors = [
-                'table tr td a',
-                'a[href*="view"]',
-                '.list a',
-                'div[class*="list"] a'
-            ]
-            
-            print(f"📱 보배드림 모바일 페이지 분석 중... (페이지 크기: {len(page_source)} 문자)")
-            
-            for selector in selectors:
-                elements = soup.select(selector)
-                print(f"📱 {selector} 선택자로 {len(elements)}개 요소 발견")
-                
-                if len(elements) > 5:
-                    # 제한 없이 모든 요소 처리 (페이지 끝까지)
-                    for element in elements:
-                        try:
-                            title = element.get_text(strip=True)
-                            if not title or len(title) < 5:
-                                continue
-                            
-                            if title in seen_titles:
-                                continue
-                            
-                            if self.should_exclude_post(title):
-                                continue
-                            
-                            seen_titles.add(title)
-                            
-                            # URL 구성
-                            href = element.get('href', '')
-                            if href.startswith('/'):
-                                post_url = self.base_url + href
-                            elif href.startswith('http'):
-                                post_url = href
-                            else:
-                                post_url = f"{self.base_url}/{href}"
-                            
-                            # 게시물인지 확인
-                            if not any(pattern in href for pattern in ['view', 'read', 'best']):
-                                continue
-                            
-                            post_data = {
-                                'title': title,
-                                'url': post_url,
-                                'site': self.site_name,
-                                'category': '인기',
-                                'author': '보배드림',
-                                'views': 0,
-                                'likes': 1,
-                                'comments': 0,
-                                'popularity_score': 1
-                            }
-                            
-                            post_list.append(post_data)
-                            
-                        except Exception as e:
-                            continue
-                    
-                    if post_list:
-                        break
-            
-            posts = post_list
+            posts = self.parse_posts(page_source)
             
             if not posts:
                 print(f"⚠️  보배드림 모바일에서 게시물을 찾지 못했습니다.")
@@ -372,6 +314,16 @@ class MobileBobaeCrawler(MobileCrawler):
 class MobileDcinsideCrawler(MobileCrawler):
     """Playwright 기반 디시인사이드 모바일 크롤러 (툴팁 제거 강화)"""
     
+    display_name = '디시인사이드'
+    default_author = '디시'
+    list_selectors = [
+        'tr.ub-content a',
+        '.gall_tit a',
+        'a[href*="view"]',
+        'td a'
+    ]
+    post_url_patterns = ['view', 'board']
+    
     def __init__(self):
         super().__init__('dcinside')
         self.base_url = 'https://gall.dcinside.com'
@@ -389,76 +341,7 @@ class MobileDcinsideCrawler(MobileCrawler):
             if not page_source:
                 return posts
             
-            # BeautifulSoup으로 파싱
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            post_list = []
-            seen_titles = set()
-            
-            # 디시인사이드 모바일 버전 게시물 파싱
-            selectors = [
-                'tr.ub-content a',
-                '.gall_tit a',
-                'a[href*="view"]',
-                'td a'
-            ]
-            
-            print(f"📱 디시인사이드 모바일 페이지 분석 중... (페이지 크기: {len(page_source)} 문자)")
-            
-            for selector in selectors:
-                elements = soup.select(selector)
-                print(f"📱 {selector} 선택자로 {len(elements)}개 요소 발견")
-                
-                if len(elements) > 5:
-                    # 제한 없이 모든 요소 처리 (페이지 끝까지)
-                    for element in elements:
-                        try:
-                            title = element.get_text(strip=True)
-                            if not title or len(title) < 5:
-                                continue
-                            
-                            if title in seen_titles:
-                                continue
-                            
-                            if self.should_exclude_post(title):
-                                continue
-                            
-                            seen_titles.add(title)
-                            
-                            # URL 구성
-                            href = element.get('href', '')
-                            if href.startswith('/'):
-                                post_url = self.base_url + href
-                            elif href.startswith('http'):
-                                post_url = href
-                            else:
-                                post_url = f"{self.base_url}/{href}"
-                            
-                            # 게시물인지 확인
-                            if not any(pattern in href for pattern in ['view', 'board']):
-                                continue
-                            
-                            post_data = {
-                                'title': title,
-                                'url': post_url,
-                                'site': self.site_name,
-                                'category': '인기',
-                                'author': '디시',
-                                'views': 0,
-                                'likes': 1,
-                                'comments': 0,
-                                'popularity_score': 1
-                            }
-                            
-                            post_list.append(post_data)
-                            
-                        except Exception as e:
-                            continue
-                    
-                    if post_list:
-                        break
-            
-            posts = post_list
+            posts = self.parse_posts(page_source)
             
             if not posts:
                 print(f"⚠️  디시인사이드 모바일에서 게시물을 찾지 못했습니다.")
@@ -477,15 +360,13 @@ class MobileDcinsideCrawler(MobileCrawler):
     
     def get_mobile_page_source_with_tooltip_removal(self, url: str) -> str:
         """툴팁 제거가 포함된 페이지 소스 가져오기"""
-        if not self.setup_mobile_browser():
-            return None
-        
+        return self.run_with_mobile_page(self._fetch_page_source_with_tooltip_removal, url)
+    
+    def _fetch_page_source_with_tooltip_removal(self, url: str) -> str:
+        """툴팁을 제거하고 소스 반환 (브라우저 풀 워커에서 실행)"""
         try:
             print(f"🌐 {self.site_name} 페이지 접속 중...")
-            response = self.page.goto(url, wait_until='networkidle', timeout=30000)
-            
-            if response.status != 200:
-                print(f"❌ {self.site_name} HTTP 상태: {response.status}")
+            if not self.open_page(url):
                 return None
             
             # 툴팁 제거를 위한 마우스 오버 시뮬레이션
@@ -539,10 +420,8 @@ class MobileDcinsideCrawler(MobileCrawler):
             self.page.evaluate("window.scrollTo(0, 0)")
             time.sleep(2)
             
-            # 스크린샷 촬영
-            screenshot_path = f"mobile_screenshot_{self.site_name}_{int(time.time())}.png"
-            self.page.screenshot(path=screenshot_path, full_page=True)
-            print(f"📸 {self.site_name} 스크린샷 저장: {screenshot_path}")
+            # 디버그 스크린샷 (설정 시에만)
+            self.save_debug_screenshot()
             
             # 페이지 소스 가져오기
             page_source = self.page.content()
@@ -558,6 +437,19 @@ class MobileDcinsideCrawler(MobileCrawler):
 class MobileFmkoreaCrawler(MobileCrawler):
     """Playwright 기반 에펨코리아 모바일 크롤러 (봇 탐지 우회 강화)"""
     
+    display_name = '에펨코리아'
+    default_author = '에펨코리아'
+    list_selectors = [
+        'a.hx',
+        'a[href*="/best/"]',
+        '.li.li_best a',
+        'a[href*="document_srl"]',
+        '.title a',
+        '.bd_lst a',
+        'li a'
+    ]
+    post_url_patterns = ['best', 'document_srl', 'free']
+    
     def __init__(self):
         super().__init__('fmkorea')
         self.base_url = 'https://www.fmkorea.com'
@@ -575,79 +467,7 @@ class MobileFmkoreaCrawler(MobileCrawler):
             if not page_source:
                 return posts
             
-            # BeautifulSoup으로 파싱
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            post_list = []
-            seen_titles = set()
-            
-            # 에펨코리아 모바일 버전 게시물 파싱
-            selectors = [
-                'a.hx',
-                'a[href*="/best/"]',
-                '.li.li_best a',
-                'a[href*="document_srl"]',
-                '.title a',
-                '.bd_lst a',
-                'li a'
-            ]
-            
-            print(f"📱 에펨코리아 모바일 페이지 분석 중... (페이지 크기: {len(page_source)} 문자)")
-            
-            for selector in selectors:
-                elements = soup.select(selector)
-                print(f"📱 {selector} 선택자로 {len(elements)}개 요소 발견")
-                
-                if len(elements) > 5:
-                    # 제한 없이 모든 요소 처리 (페이지 끝까지)
-                    for element in elements:
-                        try:
-                            title = element.get_text(strip=True)
-                            if not title or len(title) < 5:
-                                continue
-                            
-                            if title in seen_titles:
-                                continue
-                            
-                            if self.should_exclude_post(title):
-                                continue
-                            
-                            seen_titles.add(title)
-                            
-                            # URL 구성
-                            href = element.get('href', '')
-                            if href.startswith('/'):
-                                post_url = self.base_url + href
-                            elif href.startswith('http'):
-                                post_url = href
-                            else:
-                                post_url = f"{self.base_url}/{href}"
-                            
-                            # 게시물인지 확인
-                            if not any(pattern in href for pattern in ['best', 'document_srl', 'free']):
-                                continue
-                            
-                            post_data = {
-                                'title': title,
-                                'url': post_url,
-                                'site': self.site_name,
-                                'category': '인기',
-                                'author': '에펨코리아',
-                                'views': 0,
-                                'likes': 1,
-                                'comments': 0,
-                                'popularity_score': 1
-                            }
-                            
-                            post_list.append(post_data)
-                            
-                        except Exception as e:
-                            continue
-                    
-                    if post_list:
-                        break
-            
-            posts = post_list
+            posts = self.parse_posts(page_source)
             
             if not posts:
                 print(f"⚠️  에펨코리아 모바일에서 게시물을 찾지 못했습니다.")
@@ -666,9 +486,10 @@ class MobileFmkoreaCrawler(MobileCrawler):
     
     def get_mobile_page_source_with_antibot(self, url: str) -> str:
         """봇 탐지 우회가 강화된 페이지 소스 가져오기"""
-        if not self.setup_mobile_browser():
-            return None
-        
+        return self.run_with_mobile_page(self._fetch_page_source_with_antibot, url)
+    
+    def _fetch_page_source_with_antibot(self, url: str) -> str:
+        """사람처럼 행동한 뒤 소스 반환 (브라우저 풀 워커에서 실행)"""
         try:
             # 봇 탐지 우회를 위한 추가 헤더 설정
             self.page.set_extra_http_headers({
@@ -685,10 +506,7 @@ class MobileFmkoreaCrawler(MobileCrawler):
             print(f"🌐 {self.site_name} 페이지 접속 중... (봇 탐지 우회 모드)")
             
             # 천천히 페이지 로드
-            response = self.page.goto(url, wait_until='networkidle', timeout=30000)
-            
-            if response.status != 200:
-                print(f"❌ {self.site_name} HTTP 상태: {response.status}")
+            if not self.open_page(url):
                 return None
             
             # 사람처럼 행동하기
@@ -726,10 +544,8 @@ class MobileFmkoreaCrawler(MobileCrawler):
             self.page.evaluate("window.scrollTo(0, 0)")
             time.sleep(2)
             
-            # 스크린샷 촬영
-            screenshot_path = f"mobile_screenshot_{self.site_name}_{int(time.time())}.png"
-            self.page.screenshot(path=screenshot_path, full_page=True)
-            print(f"📸 {self.site_name} 모바일 스크린샷 저장: {screenshot_path}")
+            # 디버그 스크린샷 (설정 시에만)
+            self.save_debug_screenshot()
             
             # 페이지 소스 가져오기
             page_source = self.page.content()
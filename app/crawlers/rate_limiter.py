@@ -0,0 +1,132 @@
+"""호스트별 토큰 버킷 요청 속도 제한기 (모든 크롤러가 공유)"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlsplit
+
+import httpx
+from requests.adapters import HTTPAdapter
+
+from config import Config
+
+
+class TokenBucket:
+    """초당 rate개씩 토큰이 차고 최대 burst개까지 쌓이는 버킷"""
+
+    def __init__(self, rate: float, burst: int = 1, jitter: float = 0.0):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.jitter = jitter
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고 기다려야 하는 시간(초)을 반환"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+            # 토큰이 음수가 되면 앞선 예약들이 모두 소비된 뒤의 시점까지 대기
+            self.tokens -= 1
+            wait = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+        # 대기가 필요할 때만 지터를 더해 요청 간격이 일정하지 않게 함
+        if wait > 0 and self.jitter:
+            wait += random.uniform(0, self.jitter)
+        return wait
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 관리 - 서로 다른 호스트는 서로를 막지 않음"""
+
+    def __init__(self, limits: Dict[str, Dict] = None):
+        self.limits = limits if limits is not None else Config.CRAWL_RATE_LIMITS
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _limit_key(self, host: str) -> str:
+        """호스트에 적용할 설정 키 (www.fmkorea.com, m.fmkorea.com → fmkorea.com)"""
+        parts = host.split('.')
+        for i in range(len(parts) - 1):
+            candidate = '.'.join(parts[i:])
+            if candidate in self.limits:
+                return candidate
+        return host
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        """URL의 호스트에 해당하는 버킷 반환 (없으면 생성)"""
+        host = (urlsplit(url).hostname or '').lower()
+        key = self._limit_key(host)
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                settings = self.limits.get(key, self.limits.get('default', {}))
+                bucket = TokenBucket(
+                    rate=settings.get('rate', 1.0),
+                    burst=settings.get('burst', 1),
+                    jitter=settings.get('jitter', 0.0)
+                )
+                self._buckets[key] = bucket
+            return bucket
+
+    def wait(self, url: str) -> float:
+        """해당 호스트의 예산이 허락할 때까지 대기 (동기)"""
+        delay = self.bucket_for(url).reserve()
+        if delay > 0:
+            print(f"요청 간격 조절: {urlsplit(url).hostname} {delay:.1f}초 대기")
+            time.sleep(delay)
+        return delay
+
+    async def wait_async(self, url: str) -> float:
+        """해당 호스트의 예산이 허락할 때까지 대기 (비동기)"""
+        delay = self.bucket_for(url).reserve()
+        if delay > 0:
+            print(f"요청 간격 조절: {urlsplit(url).hostname} {delay:.1f}초 대기")
+            await asyncio.sleep(delay)
+        return delay
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """requests 세션의 모든 요청(리다이렉트 포함)을 속도 제한기에 통과시키는 어댑터"""
+
+    def __init__(self, limiter: HostRateLimiter = None, **kwargs):
+        self.limiter = limiter or get_rate_limiter()
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.limiter.wait(request.url)
+        return super().send(request, **kwargs)
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """httpx 비동기 클라이언트의 모든 요청(리다이렉트 포함)을 속도 제한기에 통과시키는 전송 계층"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: HostRateLimiter = None):
+        self.transport = transport
+        self.limiter = limiter or get_rate_limiter()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self.limiter.wait_async(str(request.url))
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+# 전역 속도 제한기 인스턴스
+rate_limiter_instance = None
+_instance_lock = threading.Lock()
+
+def get_rate_limiter() -> HostRateLimiter:
+    """속도 제한기 인스턴스 반환"""
+    global rate_limiter_instance
+    with _instance_lock:
+        if rate_limiter_instance is None:
+            rate_limiter_instance = HostRateLimiter()
+    return rate_limiter_instance
@@ -0,0 +1,116 @@
+"""Playwright 요청 가로채기 - 광고/분석/미디어/폰트 요청을 규칙에 따라 차단
+
+프로필(Config.RESOURCE_BLOCK_PROFILES)마다 차단할 리소스 유형과 호스트를 정한다.
+- types: 출처와 관계없이 차단할 리소스 유형 (image, media, font 등)
+- third_party_types: 페이지와 다른 사이트에서 올 때만 차단할 리소스 유형
+- hosts: 차단할 호스트 목록 이름 (Config.RESOURCE_BLOCK_HOSTS의 키)
+- allow_hosts: 위 규칙과 관계없이 항상 허용할 호스트
+호스트는 도메인 접미사로 매칭한다 (ads.example.com → example.com).
+"""
+
+import threading
+from collections import defaultdict
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+
+from config import Config
+
+
+def _host_matches(host: str, suffixes: Iterable[str]) -> bool:
+    """host가 suffixes 중 하나와 같거나 그 하위 도메인인지 확인"""
+    return any(host == suffix or host.endswith('.' + suffix) for suffix in suffixes)
+
+
+def _site_of(host: str) -> str:
+    """호스트의 사이트 단위 도메인 (www.fmkorea.com, m.fmkorea.com → fmkorea.com, *.co.kr은 3단계)"""
+    parts = host.split('.')
+    size = 3 if len(parts) >= 3 and parts[-2] in ('co', 'or', 'go', 'ne', 'ac') else 2
+    return '.'.join(parts[-size:])
+
+
+class ResourceBlocker:
+    """프로필 규칙으로 요청의 차단 여부를 판단하고 차단 통계를 모으는 클래스"""
+
+    def __init__(self, profile: str, allow_hosts: Iterable[str] = ()):
+        rules = Config.RESOURCE_BLOCK_PROFILES[profile]
+        self.profile = profile
+        self.types = set(rules.get('types', ()))
+        self.third_party_types = set(rules.get('third_party_types', ()))
+        self.allow_hosts = list(rules.get('allow_hosts', ())) + list(allow_hosts)
+        self.block_hosts = [host for name in rules.get('hosts', ())
+                            for host in Config.RESOURCE_BLOCK_HOSTS[name]]
+        self.stats = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def should_block(self, url: str, resource_type: str, page_url: Optional[str] = None) -> Optional[str]:
+        """차단해야 하면 차단 사유(리소스 유형 또는 'host'), 아니면 None 반환"""
+        host = (urlsplit(url).hostname or '').lower()
+        if not host or _host_matches(host, self.allow_hosts):
+            return None
+
+        if _host_matches(host, self.block_hosts):
+            return 'host'
+        if resource_type in self.types:
+            return resource_type
+        if resource_type in self.third_party_types and page_url:
+            page_host = (urlsplit(page_url).hostname or '').lower()
+            if page_host and _site_of(host) != _site_of(page_host):
+                return resource_type
+        return None
+
+    def _check(self, request) -> bool:
+        """요청을 검사하고 결과를 통계에 기록"""
+        page_url = None
+        try:
+            frame = request.frame
+            page_url = frame.page.url if frame else None
+        except Exception:
+            pass
+
+        reason = self.should_block(request.url, request.resource_type, page_url)
+        with self._lock:
+            self.stats[f"blocked_{reason}" if reason else 'allowed'] += 1
+        return reason is not None
+
+    def handle(self, route):
+        """동기 API용 라우트 핸들러"""
+        if self._check(route.request):
+            route.abort()
+        else:
+            route.continue_()
+
+    async def handle_async(self, route):
+        """비동기 API용 라우트 핸들러"""
+        if self._check(route.request):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def summary(self) -> str:
+        """'허용 N / 차단 M (image 3, host 5)' 형식 요약"""
+        with self._lock:
+            blocked = {key[len('blocked_'):]: count for key, count in self.stats.items()
+                       if key.startswith('blocked_')}
+            allowed = self.stats.get('allowed', 0)
+        detail = ', '.join(f"{reason} {count}" for reason, count in sorted(blocked.items()))
+        return f"허용 {allowed} / 차단 {sum(blocked.values())}" + (f" ({detail})" if detail else '')
+
+
+def install_resource_blocking(context, profile: str) -> Optional[ResourceBlocker]:
+    """동기 Playwright 컨텍스트에 차단 규칙 등록 (비활성화 상태면 None)"""
+    if not Config.RESOURCE_BLOCKING_ENABLED or not profile:
+        return None
+    blocker = ResourceBlocker(profile)
+    context.route('**/*', blocker.handle)
+    return blocker
+
+
+async def install_resource_blocking_async(context, profile: str,
+                                          allow_hosts: Iterable[str] = ()) -> Optional[ResourceBlocker]:
+    """비동기 Playwright 컨텍스트에 차단 규칙 등록 (allow_hosts: 프로필 외에 추가로 허용할 호스트, 비활성화 상태면 None)"""
+    if not Config.RESOURCE_BLOCKING_ENABLED or not profile:
+        return None
+    blocker = ResourceBlocker(profile, allow_hosts)
+    await context.route('**/*', blocker.handle_async)
+    return blocker
+
@@ -1,6 +1,11 @@
 from .base_crawler import BaseCrawler
+from .rate_limiter import get_rate_limiter
+from .browser_pool import get_browser_pool
 from bs4 import BeautifulSoup
+from config import Config
 from typing import List, Dict
+import json
+import os
 import time
 import re
 import requests
@@ -23,113 +28,122 @@ class PpomppuCrawler(BaseCrawler):
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            if self.is_not_modified(response) or self.is_unchanged(response.content):
+                return posts
             
-            post_list = []
-            seen_titles = set()  # 중복 제목 방지
-            
-            # 뽐뿌의 테이블 구조를 이용해 정확히 파싱
-            tables = soup.find_all('table')
-            
-            for table in tables:
-                rows = table.find_all('tr')
-                
-                for row in rows:
-                    tds = row.find_all('td')
-                    if len(tds) < 6:  # 충분한 셀이 없으면 제외
-                        continue
-                    
-                    # 제목 셀 (3번째 셀, 인덱스 2)
-                    title_cell = tds[2]
-                    title_link = title_cell.find('a', href=lambda x: x and 'view.php' in x)
-                    
-                    if not title_link:
-                        continue
-                    
-                    href = title_link.get('href', '')
-                    full_title = title_cell.get_text(strip=True)
-                    
-                    # 빈 제목이나 너무 짧은 제목 제외
-                    if not full_title or len(full_title) < 5:
-                        continue
-                    
-                    # 중복 제목 체크
-                    if full_title in seen_titles:
-                        continue
-                    seen_titles.add(full_title)
-                    
-                    # 광고/제휴 제외
-                    if any(word in full_title.lower() for word in ['광고', '홍보', '스폰서', '협찬', 'ad', '제휴']):
-                        print(f"뽐뿌 게시물 제외: {full_title[:30]}...")
-                        continue
-                    
-                    # URL 구성
-                    if href.startswith('/'):
-                        post_url = f"{self.base_url}{href}"
-                    elif not href.startswith('http'):
-                        post_url = f"{self.base_url}/{href}"
-                    else:
-                        post_url = href
-                    
-                    # TR 구조: ['카테고리', '아이콘', '제목+댓글수', '작성자', '시간', '추천-비추천', '조회수']
-                    
-                    # 작성자 (4번째 셀, 인덱스 3)
-                    author = tds[3].get_text(strip=True) if len(tds) > 3 else "뽐뿌"
-                    
-                    # 조회수 (7번째 셀, 인덱스 6)
-                    views = 0
-                    if len(tds) > 6:
-                        views_text = tds[6].get_text(strip=True)
-                        if views_text.isdigit():
-                            views = int(views_text)
-                    
-                    # 추천수 (6번째 셀, 인덱스 5) - "9 - 0" 형태에서 첫 번째 숫자
-                    likes = 0
-                    if len(tds) > 5:
-                        likes_text = tds[5].get_text(strip=True)
-                        likes_match = re.search(r'^(\d+)', likes_text)
-                        if likes_match:
-                            likes = int(likes_match.group(1))
-                    
-                    # 댓글수 (제목 끝의 숫자)
-                    comments = 0
-                    title_end_number = re.search(r'(\d+)$', full_title)
-                    if title_end_number:
-                        comments = int(title_end_number.group(1))
-                        # 제목에서 댓글수 제거
-                        title = re.sub(r'\d+$', '', full_title).strip()
-                    else:
-                        title = full_title
-                    
-                    # 인기도 점수 계산
-                    popularity_score = views + (likes * 2) + (comments * 3)
-                    
-                    post_data = {
-                        'title': title,
-                        'url': post_url,
-                        'author': author,
-                        'site': self.site_name,
-                        'category': '인기',
-                        'views': views,
-                        'likes': likes,
-                        'comments': comments,
-                        'popularity_score': popularity_score
-                    }
-                    
-                    post_list.append(post_data)
-            
-            # 인기도 순으로 정렬하고 상위 10개만 선택
-            post_list.sort(key=lambda x: x['popularity_score'], reverse=True)
-            posts = post_list[:10]
-            
-            for post in posts:
-                print(f"뽐뿌 게시물 추가: {post['title'][:50]}... (조회:{post['views']}, 추천:{post['likes']}, 댓글:{post['comments']})")
+            posts = self.parse_posts(response.content)
                     
         except Exception as e:
             print(f"뽐뿌 크롤링 오류: {e}")
         
         return posts
 
+    def parse_posts(self, content) -> List[Dict]:
+        """뽐뿌 목록 페이지 HTML에서 인기 게시물 추출"""
+        soup = BeautifulSoup(content, 'html.parser')
+
+        post_list = []
+        seen_titles = set()  # 중복 제목 방지
+        
+        # 뽐뿌의 테이블 구조를 이용해 정확히 파싱
+        tables = soup.find_all('table')
+        
+        for table in tables:
+            rows = table.find_all('tr')
+            
+            for row in rows:
+                tds = row.find_all('td')
+                if len(tds) < 6:  # 충분한 셀이 없으면 제외
+                    continue
+                
+                # 제목 셀 (3번째 셀, 인덱스 2)
+                title_cell = tds[2]
+                title_link = title_cell.find('a', href=lambda x: x and 'view.php' in x)
+                
+                if not title_link:
+                    continue
+                
+                href = title_link.get('href', '')
+                full_title = title_cell.get_text(strip=True)
+                
+                # 빈 제목이나 너무 짧은 제목 제외
+                if not full_title or len(full_title) < 5:
+                    continue
+                
+                # 중복 제목 체크
+                if full_title in seen_titles:
+                    continue
+                seen_titles.add(full_title)
+                
+                # 광고/제휴 제외
+                if any(word in full_title.lower() for word in ['광고', '홍보', '스폰서', '협찬', 'ad', '제휴']):
+                    print(f"뽐뿌 게시물 제외: {full_title[:30]}...")
+                    continue
+                
+                # URL 구성
+                if href.startswith('/'):
+                    post_url = f"{self.base_url}{href}"
+                elif not href.startswith('http'):
+                    post_url = f"{self.base_url}/{href}"
+                else:
+                    post_url = href
+                
+                # TR 구조: ['카테고리', '아이콘', '제목+댓글수', '작성자', '시간', '추천-비추천', '조회수']
+                
+                # 작성자 (4번째 셀, 인덱스 3)
+                author = tds[3].get_text(strip=True) if len(tds) > 3 else "뽐뿌"
+                
+                # 조회수 (7번째 셀, 인덱스 6)
+                views = 0
+                if len(tds) > 6:
+                    views_text = tds[6].get_text(strip=True)
+                    if views_text.isdigit():
+                        views = int(views_text)
+                
+                # 추천수 (6번째 셀, 인덱스 5) - "9 - 0" 형태에서 첫 번째 숫자
+                likes = 0
+                if len(tds) > 5:
+                    likes_text = tds[5].get_text(strip=True)
+                    likes_match = re.search(r'^(\d+)', likes_text)
+                    if likes_match:
+                        likes = int(likes_match.group(1))
+                
+                # 댓글수 (제목 끝의 숫자)
+                comments = 0
+                title_end_number = re.search(r'(\d+)$', full_title)
+                if title_end_number:
+                    comments = int(title_end_number.group(1))
+                    # 제목에서 댓글수 제거
+                    title = re.sub(r'\d+$', '', full_title).strip()
+                else:
+                    title = full_title
+                
+                # 인기도 점수 계산
+                popularity_score = views + (likes * 2) + (comments * 3)
+                
+                post_data = {
+                    'title': title,
+                    'url': post_url,
+                    'author': author,
+                    'site': self.site_name,
+                    'category': '인기',
+                    'views': views,
+                    'likes': likes,
+                    'comments': comments,
+                    'popularity_score': popularity_score
+                }
+                
+                post_list.append(post_data)
+        
+        # 인기도 순으로 정렬하고 상위 10개만 선택
+        post_list.sort(key=lambda x: x['popularity_score'], reverse=True)
+        posts = post_list[:10]
+        
+        for post in posts:
+            print(f"뽐뿌 게시물 추가: {post['title'][:50]}... (조회:{post['views']}, 추천:{post['likes']}, 댓글:{post['comments']})")
+
+        return posts
+
 
 class FmkoreaCrawler(BaseCrawler):
     """fmkorea 크롤러 - 강화된 버전"""
@@ -159,10 +173,46 @@ class FmkoreaCrawler(BaseCrawler):
         self.session.cookies.set('_ga', 'GA1.2.1234567890.1234567890', domain='.fmkorea.com')
         self.session.cookies.set('_gid', 'GA1.2.9876543210.1234567890', domain='.fmkorea.com')
         
-        # 요청 간격을 더 늘리고 타임아웃 설정
-        import time
-        self._last_request_time = 0
-        self.request_delay = 3  # 3초 간격
+        # 요청 간격은 공유 속도 제한기의 fmkorea.com 설정(CRAWL_RATE_LIMITS)을 따름
+        self.rate_limiter = get_rate_limiter()
+    
+    def fetch_page(self, url: str, use_session: bool = False):
+        """목록 페이지 요청 - 어느 경로든 요청 한 번에 속도 제한 토큰 하나만 사용
+
+        기본은 헤더를 최소화한 urllib 요청(여기서 직접 대기)이고,
+        use_session이면 세션으로 요청해 세션 어댑터(RateLimitedAdapter)가 대기한다.
+        """
+        if use_session:
+            response = self.session.get(url, timeout=15, allow_redirects=True)
+            if response.status_code != 304:
+                response.raise_for_status()
+            return response
+        
+        # 요청 간격 조절 (Rate Limiting 방지)
+        self.rate_limiter.wait(url)
+        
+        import urllib.request
+        
+        req = urllib.request.Request(
+            url,
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                'Accept': 'text/html,application/xhtml+xml',
+                'Accept-Language': 'ko-KR,ko;q=0.8'
+            }
+        )
+        
+        with urllib.request.urlopen(req, timeout=15) as response_raw:
+            content = response_raw.read()
+        
+        # requests Response 객체처럼 만들기
+        class SimpleResponse:
+            def __init__(self, content):
+                self.content = content
+                self.text = content.decode('utf-8', errors='ignore')
+                self.status_code = 200
+        
+        return SimpleResponse(content)
     
     def crawl_popular_posts(self) -> List[Dict]:
         """fmkorea 인기 게시물 크롤링 (강화된 봇 우회)"""
@@ -187,63 +237,24 @@ class FmkoreaCrawler(BaseCrawler):
             try:
                 print(f"에펨코리아 크롤링 시도 {attempt}: {url}")
                 
-                # 요청 간격 조절 (Rate Limiting 방지)
-                import time
-                current_time = time.time()
-                if current_time - self._last_request_time < self.request_delay:
-                    sleep_time = self.request_delay - (current_time - self._last_request_time)
-                    print(f"요청 간격 조절: {sleep_time:.1f}초 대기")
-                    time.sleep(sleep_time)
-                
-                # urllib을 사용한 더 간단한 요청 방식 시도
+                # urllib을 사용한 더 간단한 요청 방식 시도 (마지막 재시도는 기존 requests 세션으로 폴백)
                 response = None
                 for retry in range(3):
                     try:
-                        # urllib 사용으로 헤더 최소화
-                        import urllib.request
-                        import urllib.error
-                        
-                        req = urllib.request.Request(
-                            url,
-                            headers={
-                                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                                'Accept': 'text/html,application/xhtml+xml',
-                                'Accept-Language': 'ko-KR,ko;q=0.8'
-                            }
-                        )
-                        
-                        with urllib.request.urlopen(req, timeout=15) as response_raw:
-                            content = response_raw.read()
-                            
-                        # requests Response 객체처럼 만들기
-                        class SimpleResponse:
-                            def __init__(self, content):
-                                self.content = content
-                                self.text = content.decode('utf-8', errors='ignore')
-                                self.status_code = 200
-                        
-                        response = SimpleResponse(content)
+                        response = self.fetch_page(url, use_session=(retry == 2))
                         print(f"에펨코리아 응답 상태: {response.status_code}")
-                        self._last_request_time = time.time()
                         break
-                        
                     except Exception as e:
                         print(f"에펨코리아 요청 실패 (재시도 {retry+1}/3): {e}")
                         if retry == 2:
-                            # urllib 실패시 기존 requests 방식으로 폴백
-                            try:
-                                response = self.session.get(url, timeout=15, allow_redirects=True)
-                                response.raise_for_status()
-                                self._last_request_time = time.time()
-                                break
-                            except:
-                                raise e
-                        time.sleep(2)
+                            raise
                 
                 if not response:
                     continue
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
+                if self.is_not_modified(response) or self.is_unchanged(response.content):
+                    break
+                
                 print(f"에펨코리아 HTML 길이: {len(response.content)}")
                 
                 # Cloudflare 차단 확인
@@ -251,98 +262,7 @@ class FmkoreaCrawler(BaseCrawler):
                     print("에펨코리아 Cloudflare 차단 감지")
                     continue
                 
-                # 게시물 목록 파싱 (여러 셀렉터 시도)
-                article_list = soup.select('.fm_best_widget li')
-                
-                # 대체 셀렉터들 시도
-                if not article_list:
-                    article_list = soup.select('.best-list li')
-                if not article_list:
-                    article_list = soup.select('.widget li')
-                if not article_list:
-                    article_list = soup.select('.fm_best li')
-                if not article_list:
-                    article_list = soup.select('article')
-                
-                # 더 넓은 범위로 찾기
-                if not article_list:
-                    article_list = soup.select('li a')
-                if not article_list:
-                    article_list = soup.select('a')
-                    
-                print(f"에펨코리아 게시물 찾음: {len(article_list)}개")
-                
-                post_list = []
-                for article in article_list[:50]:  # 처음 50개만 처리
-                    try:
-                        # 제목 링크 찾기
-                        if article.name == 'a':
-                            title_links = [article]
-                        else:
-                            title_links = article.find_all('a')
-                        
-                        main_link = None
-                        title = ""
-                        
-                        # 가장 긴 텍스트를 가진 링크를 제목으로 사용
-                        for link in title_links:
-                            link_text = link.get_text(strip=True)
-                            if len(link_text) > len(title) and len(link_text) > 5:
-                                title = link_text
-                                main_link = link
-                        
-                        if not main_link or not title:
-                            continue
-                        
-                        # 제외 단어 필터링
-                        if self.should_exclude_post(title):
-                            continue
-                        
-                        # URL 구성
-                        href = main_link.get('href', '')
-                        if href.startswith('/'):
-                            post_url = self.base_url + href
-                        elif href.startswith('http'):
-                            post_url = href
-                        else:
-                            post_url = f"{self.base_url}/{href}"
-                        
-                        # 작성자 정보
-                        author = 'fmkorea'
-                        if article.name != 'a':
-                            author_elem = article.find('span', class_='author')
-                            if author_elem:
-                                author = author_elem.get_text(strip=True).replace('/', '').strip()
-                        
-                        # 추천수, 댓글수 등 기본값
-                        likes = 0
-                        comments = 0
-                        views = 0
-                        
-                        # 인기도 점수 계산
-                        popularity_score = views + (likes * 2) + (comments * 3)
-                        
-                        post_data = {
-                            'title': title,
-                            'url': post_url,
-                            'site': self.site_name,
-                            'category': '인기',
-                            'author': author,
-                            'views': views,
-                            'likes': likes,
-                            'comments': comments,
-                            'popularity_score': popularity_score
-                        }
-                        
-                        post_list.append(post_data)
-                        
-                        # 충분히 모았으면 중단
-                        if len(post_list) >= 10:
-                            break
-                        
-                    except Exception as e:
-                        print(f"에펨코리아 게시물 파싱 오류: {e}")
-                        continue
+                post_list = self.parse_posts(response.content)
                 
                 # 게시물을 찾았으면 더 이상 다른 URL 시도하지 않음
                 if post_list:
@@ -362,13 +282,115 @@ class FmkoreaCrawler(BaseCrawler):
         
         return posts
 
+    def parse_posts(self, content) -> List[Dict]:
+        """fmkorea 목록 페이지 HTML에서 게시물 추출 (최대 10개)"""
+        soup = BeautifulSoup(content, 'html.parser')
+
+        # 게시물 목록 파싱 (여러 셀렉터 시도)
+        article_list = soup.select('.fm_best_widget li')
+        
+        # 대체 셀렉터들 시도
+        if not article_list:
+            article_list = soup.select('.best-list li')
+        if not article_list:
+            article_list = soup.select('.widget li')
+        if not article_list:
+            article_list = soup.select('.fm_best li')
+        if not article_list:
+            article_list = soup.select('article')
+        
+        # 더 넓은 범위로 찾기
+        if not article_list:
+            article_list = soup.select('li a')
+        if not article_list:
+            article_list = soup.select('a')
+            
+        print(f"에펨코리아 게시물 찾음: {len(article_list)}개")
+        
+        post_list = []
+        for article in article_list[:50]:  # 처음 50개만 처리
+            try:
+                # 제목 링크 찾기
+                if article.name == 'a':
+                    title_links = [article]
+                else:
+                    title_links = article.find_all('a')
+                
+                main_link = None
+                title = ""
+                
+                # 가장 긴 텍스트를 가진 링크를 제목으로 사용
+                for link in title_links:
+                    link_text = link.get_text(strip=True)
+                    if len(link_text) > len(title) and len(link_text) > 5:
+                        title = link_text
+                        main_link = link
+                
+                if not main_link or not title:
+                    continue
+                
+                # 제외 단어 필터링
+                if self.should_exclude_post(title):
+                    continue
+                
+                # URL 구성
+                href = main_link.get('href', '')
+                if href.startswith('/'):
+                    post_url = self.base_url + href
+                elif href.startswith('http'):
+                    post_url = href
+                else:
+                    post_url = f"{self.base_url}/{href}"
+                
+                # 작성자 정보
+                author = 'fmkorea'
+                if article.name != 'a':
+                    author_elem = article.find('span', class_='author')
+                    if author_elem:
+                        author = author_elem.get_text(strip=True).replace('/', '').strip()
+                
+                # 추천수, 댓글수 등 기본값
+                likes = 0
+                comments = 0
+                views = 0
+                
+                # 인기도 점수 계산
+                popularity_score = views + (likes * 2) + (comments * 3)
+                
+                post_data = {
+                    'title': title,
+                    'url': post_url,
+                    'site': self.site_name,
+                    'category': '인기',
+                    'author': author,
+                    'views': views,
+                    'likes': likes,
+                    'comments': comments,
+                    'popularity_score': popularity_score
+                }
+                
+                post_list.append(post_data)
+                
+                # 충분히 모았으면 중단
+                if len(post_list) >= 10:
+                    break
+                
+            except Exception as e:
+                print(f"에펨코리아 게시물 파싱 오류: {e}")
+                continue
+        
+        return post_list
+
 
 class BobaeCrawler(BaseCrawler):
     """보배드림 크롤러"""
     
+    fingerprint_markers = (b'listSub', b'</table>')
+    
     def __init__(self):
         super().__init__('bobae')
         self.base_url = 'https://www.bobaedream.co.kr'
+        self.cookie_file = Config.BOBAE_COOKIE_FILE
     
     def crawl_popular_posts(self) -> List[Dict]:
         """보배드림 인기 게시물 크롤링 (정치글 제외)"""
@@ -380,367 +402,483 @@ class BobaeCrawler(BaseCrawler):
             
             print(f"보배드림 크롤링: {url}")
             
-            # Playwright를 사용하여 정치 토글 버튼 클릭
-            try:
-                from playwright.sync_api import sync_playwright
-                import time
-                
-                with sync_playwright() as p:
-                    # Chromium 브라우저 시작 (헤드리스 모드)
-                    browser = p.chromium.launch(
-                        headless=True,
-                        args=[
-                            '--no-sandbox',
-                            '--disable-dev-shm-usage',
-                            '--disable-web-security'
-                        ]
-                    )
-                    
-                    # 새 페이지 생성
-                    context = browser.new_context(
-                        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                    )
-                    page = context.new_page()
-                    
-                    print("보배드림 페이지 로딩 중...")
-                    page.goto(url, wait_until='domcontentloaded', timeout=30000)
-                    
-                    print("정치 토글 버튼 찾는 중...")
-                    
-                    # 정치 토글 버튼 클릭 시도
-                    button_clicked = False
-                    try:
-                        # 여러 셀렉터로 정치 토글 버튼 찾기
-                        politic_selectors = [
-                            "button[onclick*='politic_cookie']",
-                            "button:has-text('정치 X')",
-                            "span:has-text('정치 X')",
-                            "img[src*='politics']"
-                        ]
-                        
-                        for selector in politic_selectors:
-                            try:
-                                element = page.wait_for_selector(selector, timeout=5000)
-                                if element and element.is_visible():
-                                    element.click()
-                                    print("✅ 정치 토글 버튼 클릭 완료")
-                                    button_clicked = True
-                                    page.wait_for_timeout(2000)  # 2초 대기
-                                    break
-                            except Exception as e:
-                                continue
-                        
-                        if not button_clicked:
-                            print("⚠️ 정치 토글 버튼을 찾을 수 없음, JavaScript로 직접 실행 시도")
-                            # JavaScript로 직접 함수 호출
-                            page.evaluate("if(typeof politic_cookie === 'function') { politic_cookie(); }")
-                            page.wait_for_timeout(2000)
-                            print("✅ JavaScript로 정치 필터 적용 완료")
-                        
-                    except Exception as e:
-                        print(f"⚠️ 정치 토글 실패, 기본 상태로 진행: {e}")
-                    
-                    # 페이지 내용 가져오기
-                    page_content = page.content()
-                    browser.close()
-                    
-                    # BeautifulSoup으로 파싱
-                    soup = BeautifulSoup(page_content, 'html.parser')
-                
-            except Exception as playwright_error:
-                print(f"⚠️ Playwright 사용 실패, 기본 requests로 대체: {playwright_error}")
-                # Playwright 실패시 기본 requests 사용
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 게시물 목록 파싱 (보배드림 베스트 게시판 구조에 맞게)
-            post_items = soup.select('tr.listSub')
-            
-            # 대체 셀렉터들 시도
-            if not post_items:
-                post_items = soup.select('.listSub')
-            if not post_items:
-                post_items = soup.select('table tr')
-            if not post_items:
-                post_items = soup.select('tr')
-            
-            print(f"보배드림 게시물 {len(post_items)}개 발견")
-            
-            post_list = []
-            for item in post_items[:30]:  # 처음 30개 처리하여 20개 선별
-                try:
-                    # 테이블 셀들 가져오기
-                    cells = item.find_all('td')
-                    
-                    if len(cells) < 6:  # 충분한 셀이 없으면 스킵
-                        continue
-                    
-                    # 보배드림 실제 구조: [카테고리, 제목, 작성자, 시간, 추천, 조회]
-                    # 제목은 셀[1]에 있고, 링크는 별도로 찾아야 함
-                    title_cell = cells[1] if len(cells) > 1 else None
-                    if not title_cell:
-                        continue
-                    
-                    # 제목 텍스트 (링크 없이도 가능)
-                    title = title_cell.get_text(strip=True)
-                    
-                    if not title or len(title) < 5:
-                        continue
-                    
-                    # URL 찾기 - 제목 셀이나 다른 셀에서 링크 찾기
-                    post_url = ""
-                    title_link = title_cell.find('a')
-                    if title_link:
-                        href = title_link.get('href', '')
-                        if href.startswith('/'):
-                            post_url = self.base_url + href
-                        else:
-                            post_url = href
-                    else:
-                        # 다른 셀에서 링크 찾기 시도
-                        for cell in cells:
-                            link = cell.find('a')
-                            if link and link.get('href'):
-                                href = link.get('href', '')
-                                if 'view.php' in href or 'board' in href:  # 게시물 링크로 보이는 것
-                                    if href.startswith('/'):
-                                        post_url = self.base_url + href
-                                    else:
-                                        post_url = href
-                                    break
-                    
-                    # URL이 없으면 스킵
-                    if not post_url:
-                        print(f"보배드림 디버그: URL을 찾을 수 없음 - {title[:30]}")
-                        continue
-                    
-                    # 정치 관련 키워드 필터링
-                    political_keywords = ['정치', '대통령', '국회', '의원', '선거', '정당', '민주당', '국민의힘', '조국', '윤석열', '문재인']
-                    if any(keyword in title for keyword in political_keywords):
-                        print(f"보배드림 정치글 제외: {title[:30]}...")
-                        continue
-                    
-                    # 기본 제외 단어 필터링
-                    if self.should_exclude_post(title):
-                        print(f"보배드림 게시물 제외: {title[:30]}...")
-                        continue
-                    
-                    # 기본값 설정
-                    author = '보배드림'
-                    views = 0
-                    likes = 0
-                    comments = 0
-                    
-                    # 작성자 (셀[2])
-                    if len(cells) > 2:
-                        author_text = cells[2].get_text(strip=True)
-                        if author_text and len(author_text) < 20:
-                            author = author_text
-                    
-                    # 추천수 (셀[4])
-                    if len(cells) > 4:
-                        likes_text = cells[4].get_text(strip=True).replace(',', '')
-                        if likes_text.isdigit():
-                            likes = int(likes_text)
-                    
-                    # 조회수 (셀[5])
-                    if len(cells) > 5:
-                        views_text = cells[5].get_text(strip=True).replace(',', '')
-                        if views_text.isdigit():
-                            views = int(views_text)
-                    
-                    # 댓글수 제목에서 추출
-                    comment_patterns = [
-                        r'\((\d+)\)',  # (숫자) 패턴
-                        r'\[(\d+)\]',  # [숫자] 패턴
-                    ]
-                    
-                    for pattern in comment_patterns:
-                        comment_match = re.search(pattern, title)
-                        if comment_match:
-                            comments = int(comment_match.group(1))
-                            title = re.sub(pattern, '', title).strip()
-                            break
-                    
-                    # 조회수가 0이면 기본값 설정 (파싱 실패한 경우)
-                    if views == 0:
-                        views = 1
-                    
-                    post_data = {
-                        'title': title,
-                        'url': post_url,
-                        'site': self.site_name,
-                        'category': '인기',
-                        'author': author,
-                        'views': views,
-                        'likes': likes,
-                        'comments': comments,
-                        'popularity_score': views + (likes * 2) + (comments * 3)
-                    }
-                    
-                    post_list.append(post_data)
-                    print(f"보배드림 게시물 추가 성공: {title[:30]}... (조회:{views}, 추천:{likes})")
-                    
-                except Exception as e:
-                    print(f"보배드림 게시물 파싱 오류: {e}")
-                    import traceback
-                    print(f"보배드림 디버그 스택트레이스: {traceback.format_exc()}")
-                    continue
+            # 저장된 정치 필터 쿠키가 있으면 브라우저 없이 요청 한 번으로 처리
+            content = self.fetch_with_saved_cookies(url)
+            if content is None:
+                content = self.fetch_with_browser(url)
             
-            # 조회수 기준으로 정렬하고 상위 20개 선택
-            post_list.sort(key=lambda x: x['views'], reverse=True)
-            posts = post_list[:20]
+            if self.unchanged:
+                return posts
             
-            for post in posts:
-                print(f"보배드림 게시물 추가: {post['title'][:50]}... (조회:{post['views']}, 추천:{post['likes']}, 댓글:{post['comments']})")
+            posts = self.parse_posts(content)
                 
         except Exception as e:
             print(f"보배드림 크롤링 오류: {e}")
         
         return posts
-
-
-class DcinsideCrawler(BaseCrawler):
-    """디시인사이드 크롤러"""
-    
-    def __init__(self):
-        super().__init__('dcinside')
-        self.base_url = 'https://gall.dcinside.com'
     
-    def crawl_popular_posts(self) -> List[Dict]:
-        """디시인사이드 인기 게시물 크롤링"""
-        posts = []
+    def fetch_with_saved_cookies(self, url: str):
+        """저장된 정치 필터 쿠키로 requests 요청 (쿠키가 없거나 거부되면 None)"""
+        cookies = self.load_saved_cookies()
+        if not cookies:
+            return None
+        
+        for cookie in cookies:
+            self.session.cookies.set(cookie['name'], cookie['value'],
+                                     domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
         
         try:
-            # 실시간 베스트 게시판
-            url = f"{self.base_url}/board/lists/?id=dcbest"
-            
-            # 브라우저처럼 보이게 헤더 추가
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = self.session.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 게시물 목록 찾기 (더 정확한 선택자 사용)
-            post_rows = soup.select('tr.ub-content')
-            
-            post_list = []
-            for row in post_rows:  # 모든 게시물 처리
+        except Exception as e:
+            print(f"⚠️ 보배드림 쿠키 요청 실패, 브라우저로 대체: {e}")
+            return None
+        
+        if self.is_not_modified(response):
+            return response.content
+        
+        # 서버가 쿠키를 바꾸거나 지웠거나 목록이 없으면 거부된 것으로 보고 다시 발급
+        saved_values = {cookie['name']: cookie['value'] for cookie in cookies}
+        reset = [name for name, value in response.cookies.items()
+                 if name in saved_values and saved_values[name] != value]
+        if reset or b'listSub' not in response.content:
+            print(f"⚠️ 보배드림 정치 필터 쿠키가 거부됨, 브라우저로 다시 발급 {reset}")
+            self.clear_saved_cookies()
+            for name in saved_values:
+                self.session.cookies.pop(name, None)
+            return None
+        
+        print("✅ 보배드림 저장된 정치 필터 쿠키로 요청 완료")
+        self.is_unchanged(response.content)
+        return response.content
+    
+    def fetch_with_browser(self, url: str):
+        """공유 브라우저 풀(Playwright)에서 정치 토글 버튼을 누르고 페이지와 새 쿠키 가져오기"""
+        try:
+            def load_page(context):
+                # 새 페이지 생성
+                page = context.new_page()
+                
+                print("보배드림 페이지 로딩 중...")
+                get_rate_limiter().wait(url)
+                page.goto(url, wait_until='domcontentloaded', timeout=30000)
+                
+                # 토글 전 쿠키 (토글로 새로 생기거나 바뀐 쿠키만 저장)
+                before = {(c['name'], c['domain'], c['path']): c['value'] for c in context.cookies()}
+                
+                print("정치 토글 버튼 찾는 중...")
+                
+                # 정치 토글 버튼 클릭 시도
+                button_clicked = False
                 try:
-                    # 제목 링크 찾기
-                    title_cell = row.find('td', class_='gall_tit')
-                    if not title_cell:
-                        continue
-                    
-                    title_link = title_cell.find('a')
-                    if not title_link:
-                        continue
-                    
-                    title = title_link.get_text(strip=True)
-                    if not title or len(title) < 5:
-                        continue
-                    
-                    # 제외 단어 필터링
-                    if self.should_exclude_post(title):
-                        print(f"디시인사이드 게시물 제외: {title[:30]}...")
-                        continue
-                    
-                    # URL 구성
-                    href = title_link.get('href', '')
-                    if href.startswith('/'):
-                        post_url = self.base_url + href
-                    else:
-                        post_url = href
-                    
-                    # 작성자
-                    author_cell = row.find('td', class_='gall_writer')
-                    author = author_cell.get_text(strip=True) if author_cell else '디시'
+                    # 여러 셀렉터로 정치 토글 버튼 찾기 (onclick/텍스트 요소 우선, 이미지 아이콘은 마지막)
+                    politic_selectors = [
+                        "button[onclick*='politic_cookie']",
+                        "a[onclick*='politic_cookie']",
+                        "[onclick*='politic_cookie']",
+                        "button:has-text('정치 X')",
+                        "span:has-text('정치 X')",
+                        "img[src*='politics']"
+                    ]
                     
-                    # 조회수 찾기
-                    views = 0
-                    count_cell = row.find('td', class_='gall_count')
-                    if count_cell:
+                    for selector in politic_selectors:
                         try:
-                            views = int(count_cell.get_text(strip=True))
-                        except:
-                            views = 0
+                            element = page.wait_for_selector(selector, timeout=5000)
+                            if element and element.is_visible():
+                                element.click()
+                                print("✅ 정치 토글 버튼 클릭 완료")
+                                button_clicked = True
+                                page.wait_for_timeout(2000)  # 2초 대기
+                                break
+                        except Exception as e:
+                            continue
                     
-                    # 추천수 찾기
-                    likes = 0
-                    recommend_cell = row.find('td', class_='gall_recommend')
-                    if recommend_cell:
-                        try:
-                            likes = int(recommend_cell.get_text(strip=True))
-                        except:
-                            likes = 0
-                    
-                    # 댓글수 (span.reply_num에서 추출)
-                    comments = 0
-                    
-                    # 먼저 reply_num 클래스에서 찾기
-                    reply_elem = title_cell.find('span', class_='reply_num')
-                    if reply_elem:
-                        reply_text = reply_elem.get_text(strip=True)
-                        # [숫자/숫자] 또는 [숫자] 형태에서 첫 번째 숫자 추출
-                        comment_match = re.search(r'\[(\d+)', reply_text)
-                        if comment_match:
-                            comments = int(comment_match.group(1))
-                    
-                    # reply_num이 없으면 제목에서 직접 찾기
-                    if comments == 0:
-                        comment_patterns = [
-                            r'\[(\d+)/\d+\]',  # [숫자/숫자] 패턴
-                            r'\[(\d+)\]',      # [숫자] 패턴
-                        ]
-                        
-                        for pattern in comment_patterns:
-                            comment_match = re.search(pattern, title)
-                            if comment_match:
-                                comments = int(comment_match.group(1))
-                                break
-                    
-                    # 인기도 점수 계산 (조회수 + 추천수*2 + 댓글수*3)
-                    popularity_score = views + (likes * 2) + (comments * 3)
-                    
-                    post_data = {
-                        'title': title,
-                        'url': post_url,
-                        'site': self.site_name,
-                        'category': '인기',
-                        'author': author,
-                        'views': views,
-                        'likes': likes,
-                        'comments': comments,
-                        'popularity_score': popularity_score
-                    }
-                    
-                    post_list.append(post_data)
+                    if not button_clicked:
+                        print("⚠️ 정치 토글 버튼을 찾을 수 없음, JavaScript로 직접 실행 시도")
+                        # JavaScript로 직접 함수 호출
+                        page.evaluate("if(typeof politic_cookie === 'function') { politic_cookie(); }")
+                        page.wait_for_timeout(2000)
+                        print("✅ JavaScript로 정치 필터 적용 완료")
                     
                 except Exception as e:
-                    print(f"디시인사이드 게시물 파싱 오류: {e}")
+                    print(f"⚠️ 정치 토글 실패, 기본 상태로 진행: {e}")
+                
+                # 페이지 내용과 토글로 생긴 정치 필터 쿠키 가져오기 (세션/추적 쿠키는 저장하지 않음)
+                toggled = [c for c in context.cookies()
+                           if before.get((c['name'], c['domain'], c['path'])) != c['value']
+                           and self.is_politics_cookie(c['name'])]
+                return page.content(), toggled
+            
+            page_content, toggled = get_browser_pool().run(load_page, context_options={
+                'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            }, block_profile='interactive')
+            
+            if toggled:
+                self.save_cookies(toggled)
+            else:
+                print("⚠️ 보배드림 정치 토글로 생긴 쿠키가 없어 저장하지 않음")
+            
+            self.is_unchanged(page_content)
+            return page_content
+            
+        except Exception as playwright_error:
+            print(f"⚠️ Playwright 사용 실패, 기본 requests로 대체: {playwright_error}")
+            # Playwright 실패시 기본 requests 사용
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+            if not self.is_not_modified(response):
+                self.is_unchanged(response.content)
+            return response.content
+    
+    def load_saved_cookies(self) -> List[Dict]:
+        """저장된 정치 필터 쿠키 (만료됐거나 곧 만료되면 빈 목록 - 브라우저로 갱신)"""
+        try:
+            with open(self.cookie_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return []
+        
+        # 예전에 함께 저장된 세션/추적 쿠키는 쓰지 않음
+        cookies = [cookie for cookie in saved.get('cookies', []) if self.is_politics_cookie(cookie.get('name', ''))]
+        
+        # 쿠키 자체 만료 시각과 최대 보관 기간 중 이른 쪽에서 갱신 여유만큼 앞당겨 만료
+        expires_at = saved.get('saved_at', 0) + Config.BOBAE_COOKIE_MAX_AGE
+        for cookie in cookies:
+            if (cookie.get('expires') or -1) > 0:
+                expires_at = min(expires_at, cookie['expires'])
+        
+        if time.time() >= expires_at - Config.BOBAE_COOKIE_REFRESH_BEFORE:
+            return []
+        return cookies
+    
+    @staticmethod
+    def is_politics_cookie(name: str) -> bool:
+        """정치 필터 쿠키인지 이름으로 확인"""
+        name = name.lower()
+        return any(pattern in name for pattern in Config.BOBAE_POLITICS_COOKIE_NAMES)
+    
+    def save_cookies(self, cookies: List[Dict]):
+        """정치 토글로 생긴 쿠키 저장"""
+        saved = {
+            'cookies': [{key: cookie.get(key) for key in ('name', 'value', 'domain', 'path', 'expires')}
+                        for cookie in cookies],
+            'saved_at': time.time()
+        }
+        os.makedirs(os.path.dirname(self.cookie_file), exist_ok=True)
+        tmp_path = f"{self.cookie_file}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(saved, f, ensure_ascii=False)
+        os.replace(tmp_path, self.cookie_file)
+        print(f"✅ 보배드림 정치 필터 쿠키 {len(cookies)}개 저장")
+    
+    def clear_saved_cookies(self):
+        """거부된 쿠키 삭제"""
+        try:
+            os.remove(self.cookie_file)
+        except OSError:
+            pass
+
+    def parse_posts(self, content) -> List[Dict]:
+        """보배드림 목록 페이지 HTML에서 인기 게시물 추출 (정치글 제외)"""
+        soup = BeautifulSoup(content, 'html.parser')
+
+        # 게시물 목록 파싱 (보배드림 베스트 게시판 구조에 맞게)
+        post_items = soup.select('tr.listSub')
+        
+        # 대체 셀렉터들 시도
+        if not post_items:
+            post_items = soup.select('.listSub')
+        if not post_items:
+            post_items = soup.select('table tr')
+        if not post_items:
+            post_items = soup.select('tr')
+        
+        print(f"보배드림 게시물 {len(post_items)}개 발견")
+        
+        post_list = []
+        for item in post_items[:30]:  # 처음 30개 처리하여 20개 선별
+            try:
+                # 테이블 셀들 가져오기
+                cells = item.find_all('td')
+                
+                if len(cells) < 6:  # 충분한 셀이 없으면 스킵
+                    continue
+                
+                # 보배드림 실제 구조: [카테고리, 제목, 작성자, 시간, 추천, 조회]
+                # 제목은 셀[1]에 있고, 링크는 별도로 찾아야 함
+                title_cell = cells[1] if len(cells) > 1 else None
+                if not title_cell:
+                    continue
+                
+                # 제목 텍스트 (링크 없이도 가능)
+                title = title_cell.get_text(strip=True)
+                
+                if not title or len(title) < 5:
                     continue
+                
+                # URL 찾기 - 제목 셀이나 다른 셀에서 링크 찾기
+                post_url = ""
+                title_link = title_cell.find('a')
+                if title_link:
+                    href = title_link.get('href', '')
+                    if href.startswith('/'):
+                        post_url = self.base_url + href
+                    else:
+                        post_url = href
+                else:
+                    # 다른 셀에서 링크 찾기 시도
+                    for cell in cells:
+                        link = cell.find('a')
+                        if link and link.get('href'):
+                            href = link.get('href', '')
+                            if 'view.php' in href or 'board' in href:  # 게시물 링크로 보이는 것
+                                if href.startswith('/'):
+                                    post_url = self.base_url + href
+                                else:
+                                    post_url = href
+                                break
+                
+                # URL이 없으면 스킵
+                if not post_url:
+                    print(f"보배드림 디버그: URL을 찾을 수 없음 - {title[:30]}")
+                    continue
+                
+                # 정치 관련 키워드 필터링
+                political_keywords = ['정치', '대통령', '국회', '의원', '선거', '정당', '민주당', '국민의힘', '조국', '윤석열', '문재인']
+                if any(keyword in title for keyword in political_keywords):
+                    print(f"보배드림 정치글 제외: {title[:30]}...")
+                    continue
+                
+                # 기본 제외 단어 필터링
+                if self.should_exclude_post(title):
+                    print(f"보배드림 게시물 제외: {title[:30]}...")
+                    continue
+                
+                # 기본값 설정
+                author = '보배드림'
+                views = 0
+                likes = 0
+                comments = 0
+                
+                # 작성자 (셀[2])
+                if len(cells) > 2:
+                    author_text = cells[2].get_text(strip=True)
+                    if author_text and len(author_text) < 20:
+                        author = author_text
+                
+                # 추천수 (셀[4])
+                if len(cells) > 4:
+                    likes_text = cells[4].get_text(strip=True).replace(',', '')
+                    if likes_text.isdigit():
+                        likes = int(likes_text)
+                
+                # 조회수 (셀[5])
+                if len(cells) > 5:
+                    views_text = cells[5].get_text(strip=True).replace(',', '')
+                    if views_text.isdigit():
+                        views = int(views_text)
+                
+                # 댓글수 제목에서 추출
+                comment_patterns = [
+                    r'\((\d+)\)',  # (숫자) 패턴
+                    r'\[(\d+)\]',  # [숫자] 패턴
+                ]
+                
+                for pattern in comment_patterns:
+                    comment_match = re.search(pattern, title)
+                    if comment_match:
+                        comments = int(comment_match.group(1))
+                        title = re.sub(pattern, '', title).strip()
+                        break
+                
+                # 조회수가 0이면 기본값 설정 (파싱 실패한 경우)
+                if views == 0:
+                    views = 1
+                
+                post_data = {
+                    'title': title,
+                    'url': post_url,
+                    'site': self.site_name,
+                    'category': '인기',
+                    'author': author,
+                    'views': views,
+                    'likes': likes,
+                    'comments': comments,
+                    'popularity_score': views + (likes * 2) + (comments * 3)
+                }
+                
+                post_list.append(post_data)
+                print(f"보배드림 게시물 추가 성공: {title[:30]}... (조회:{views}, 추천:{likes})")
+                
+            except Exception as e:
+                print(f"보배드림 게시물 파싱 오류: {e}")
+                import traceback
+                print(f"보배드림 디버그 스택트레이스: {traceback.format_exc()}")
+                continue
+        
+        # 조회수 기준으로 정렬하고 상위 20개 선택
+        post_list.sort(key=lambda x: x['views'], reverse=True)
+        posts = post_list[:20]
+        
+        for post in posts:
+            print(f"보배드림 게시물 추가: {post['title'][:50]}... (조회:{post['views']}, 추천:{post['likes']}, 댓글:{post['comments']})")
+
+        return posts
+
+
+class DcinsideCrawler(BaseCrawler):
+    """디시인사이드 크롤러"""
+    
+    fingerprint_markers = (b'class="gall_list', b'</table>')
+    
+    def __init__(self):
+        super().__init__('dcinside')
+        self.base_url = 'https://gall.dcinside.com'
+    
+    def crawl_popular_posts(self) -> List[Dict]:
+        """디시인사이드 인기 게시물 크롤링"""
+        posts = []
+        
+        try:
+            # 실시간 베스트 게시판
+            url = f"{self.base_url}/board/lists/?id=dcbest"
+            
+            # 브라우저처럼 보이게 헤더 추가
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            }
+            
+            response = self.session.get(url, headers=headers, timeout=10)
+            response.raise_for_status()
             
-            # 인기도 순으로 정렬하고 상위 10개만 선택
-            post_list.sort(key=lambda x: x['popularity_score'], reverse=True)
-            posts = post_list[:10]
+            if self.is_not_modified(response) or self.is_unchanged(response.content):
+                return posts
             
-            for post in posts:
-                print(f"디시인사이드 게시물 추가: {post['title'][:50]}... (조회:{post['views']}, 추천:{post['likes']}, 댓글:{post['comments']})")
+            posts = self.parse_posts(response.content)
                 
         except Exception as e:
             print(f"디시인사이드 크롤링 오류: {e}")
         
         return posts
 
+    def parse_posts(self, content) -> List[Dict]:
+        """디시인사이드 목록 페이지 HTML에서 인기 게시물 추출"""
+        soup = BeautifulSoup(content, 'html.parser')
+
+        # 게시물 목록 찾기 (더 정확한 선택자 사용)
+        post_rows = soup.select('tr.ub-content')
+        
+        post_list = []
+        for row in post_rows:  # 모든 게시물 처리
+            try:
+                # 제목 링크 찾기
+                title_cell = row.find('td', class_='gall_tit')
+                if not title_cell:
+                    continue
+                
+                title_link = title_cell.find('a')
+                if not title_link:
+                    continue
+                
+                title = title_link.get_text(strip=True)
+                if not title or len(title) < 5:
+                    continue
+                
+                # 제외 단어 필터링
+                if self.should_exclude_post(title):
+                    print(f"디시인사이드 게시물 제외: {title[:30]}...")
+                    continue
+                
+                # URL 구성
+                href = title_link.get('href', '')
+                if href.startswith('/'):
+                    post_url = self.base_url + href
+                else:
+                    post_url = href
+                
+                # 작성자
+                author_cell = row.find('td', class_='gall_writer')
+                author = author_cell.get_text(strip=True) if author_cell else '디시'
+                
+                # 조회수 찾기
+                views = 0
+                count_cell = row.find('td', class_='gall_count')
+                if count_cell:
+                    try:
+                        views = int(count_cell.get_text(strip=True))
+                    except:
+                        views = 0
+                
+                # 추천수 찾기
+                likes = 0
+                recommend_cell = row.find('td', class_='gall_recommend')
+                if recommend_cell:
+                    try:
+                        likes = int(recommend_cell.get_text(strip=True))
+                    except:
+                        likes = 0
+                
+                # 댓글수 (span.reply_num에서 추출)
+                comments = 0
+                
+                # 먼저 reply_num 클래스에서 찾기
+                reply_elem = title_cell.find('span', class_='reply_num')
+                if reply_elem:
+                    reply_text = reply_elem.get_text(strip=True)
+                    # [숫자/숫자] 또는 [숫자] 형태에서 첫 번째 숫자 추출
+                    comment_match = re.search(r'\[(\d+)', reply_text)
+                    if comment_match:
+                        comments = int(comment_match.group(1))
+                
+                # reply_num이 없으면 제목에서 직접 찾기
+                if comments == 0:
+                    comment_patterns = [
+                        r'\[(\d+)/\d+\]',  # [숫자/숫자] 패턴
+                        r'\[(\d+)\]',      # [숫자] 패턴
+                    ]
+                    
+                    for pattern in comment_patterns:
+                        comment_match = re.search(pattern, title)
+                        if comment_match:
+                            comments = int(comment_match.group(1))
+                            break
+                
+                # 인기도 점수 계산 (조회수 + 추천수*2 + 댓글수*3)
+                popularity_score = views + (likes * 2) + (comments * 3)
+                
+                post_data = {
+                    'title': title,
+                    'url': post_url,
+                    'site': self.site_name,
+                    'category': '인기',
+                    'author': author,
+                    'views': views,
+                    'likes': likes,
+                    'comments': comments,
+                    'popularity_score': popularity_score
+                }
+                
+                post_list.append(post_data)
+                
+            except Exception as e:
+                print(f"디시인사이드 게시물 파싱 오류: {e}")
+                continue
+        
+        # 인기도 순으로 정렬하고 상위 10개만 선택
+        post_list.sort(key=lambda x: x['popularity_score'], reverse=True)
+        posts = post_list[:10]
+        
+        for post in posts:
+            print(f"디시인사이드 게시물 추가: {post['title'][:50]}... (조회:{post['views']}, 추천:{post['likes']}, 댓글:{post['comments']})")
+
+        return posts
+
 
 class RuliwebCrawler(BaseCrawler):
     """루리웹 크롤러 (유머게시판 베스트)"""
     
+    fingerprint_markers = (b'board_list_table', b'</table>')
+    
     def __init__(self):
         super().__init__('ruliweb')
         self.base_url = 'https://bbs.ruliweb.com'
@@ -755,162 +893,171 @@ class RuliwebCrawler(BaseCrawler):
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 게시물 목록 파싱 (루리웹 베스트 게시판 구조)
-            post_items = soup.select('tr.table_body')
-            
-            # 대체 선택자들 시도
-            if not post_items:
-                post_items = soup.select('.board_list_wrapper tr')
-            if not post_items:
-                post_items = soup.select('tbody tr')
-            if not post_items:
-                post_items = soup.select('table tr')
+            if self.is_not_modified(response) or self.is_unchanged(response.content):
+                return posts
             
-            post_list = []
-            for row in post_items[:20]:  # 처음 20개만 처리하여 10개 선별
+            posts = self.parse_posts(response.content)
+                
+        except Exception as e:
+            print(f"루리웹 크롤링 오류: {e}")
+        
+        return posts
+
+    def parse_posts(self, content) -> List[Dict]:
+        """루리웹 목록 페이지 HTML에서 인기 게시물 추출"""
+        soup = BeautifulSoup(content, 'html.parser')
+
+        # 게시물 목록 파싱 (루리웹 베스트 게시판 구조)
+        post_items = soup.select('tr.table_body')
+        
+        # 대체 선택자들 시도
+        if not post_items:
+            post_items = soup.select('.board_list_wrapper tr')
+        if not post_items:
+            post_items = soup.select('tbody tr')
+        if not post_items:
+            post_items = soup.select('table tr')
+        
+        post_list = []
+        for row in post_items[:20]:  # 처음 20개만 처리하여 10개 선별
+            try:
+                # 테이블 구조에서 각 셀 찾기
+                cells = row.find_all('td')
+                if len(cells) < 4:  # 충분한 셀이 없으면 스킵
+                    continue
+                
+                # 제목 셀에서 링크 찾기 (보통 2번째 또는 3번째 셀)
+                title_cell = None
+                title_link = None
+                
+                for cell in cells:
+                    link = cell.find('a', class_='deco')
+                    if not link:
+                        link = cell.find('a')
+                    if link and link.get_text(strip=True) and len(link.get_text(strip=True)) > 5:
+                        title_cell = cell
+                        title_link = link
+                        break
+                
+                if not title_link:
+                    continue
+                
+                title = title_link.get_text(strip=True)
+                if not title or len(title) < 5:
+                    continue
+                
+                # 제외 단어 필터링
+                if self.should_exclude_post(title):
+                    print(f"루리웹 게시물 제외: {title[:30]}...")
+                    continue
+                
+                # URL 구성
+                href = title_link.get('href', '')
+                if href.startswith('/'):
+                    post_url = f"https://bbs.ruliweb.com{href}"
+                elif href.startswith('http'):
+                    post_url = href
+                else:
+                    post_url = f"https://bbs.ruliweb.com/{href}"
+                
+                # 루리웹 테이블 구조: [분류, 제목, 작성자, 날짜, 추천, 조회]
+                # 기본값 설정
+                views = 0
+                likes = 0
+                comments = 0
+                author = '루리웹'
+                author_found = False
+                
+                # 루리웹 테이블 구조에 따른 정확한 파싱
+                # 셀[0]:ID, 셀[1]:제목, 셀[2]:작성자, 셀[3]:추천수, 셀[4]:조회수, 셀[5]:시간
                 try:
-                    # 테이블 구조에서 각 셀 찾기
-                    cells = row.find_all('td')
-                    if len(cells) < 4:  # 충분한 셀이 없으면 스킵
-                        continue
-                    
-                    # 제목 셀에서 링크 찾기 (보통 2번째 또는 3번째 셀)
-                    title_cell = None
-                    title_link = None
-                    
-                    for cell in cells:
-                        link = cell.find('a', class_='deco')
-                        if not link:
-                            link = cell.find('a')
-                        if link and link.get_text(strip=True) and len(link.get_text(strip=True)) > 5:
-                            title_cell = cell
-                            title_link = link
-                            break
-                    
-                    if not title_link:
-                        continue
-                    
-                    title = title_link.get_text(strip=True)
-                    if not title or len(title) < 5:
-                        continue
-                    
-                    # 제외 단어 필터링
-                    if self.should_exclude_post(title):
-                        print(f"루리웹 게시물 제외: {title[:30]}...")
-                        continue
-                    
-                    # URL 구성
-                    href = title_link.get('href', '')
-                    if href.startswith('/'):
-                        post_url = f"https://bbs.ruliweb.com{href}"
-                    elif href.startswith('http'):
-                        post_url = href
-                    else:
-                        post_url = f"https://bbs.ruliweb.com/{href}"
-                    
-                    # 루리웹 테이블 구조: [분류, 제목, 작성자, 날짜, 추천, 조회]
-                    # 기본값 설정
-                    views = 0
-                    likes = 0
-                    comments = 0
-                    author = '루리웹'
-                    author_found = False
-                    
-                    # 루리웹 테이블 구조에 따른 정확한 파싱
-                    # 셀[0]:ID, 셀[1]:제목, 셀[2]:작성자, 셀[3]:추천수, 셀[4]:조회수, 셀[5]:시간
-                    try:
-                        if len(cells) >= 6:
-                            # 작성자 (셀[2])
-                            nick_elem = cells[2].find('span', class_='nick')
-                            if nick_elem:
-                                author = nick_elem.get_text(strip=True)
+                    if len(cells) >= 6:
+                        # 작성자 (셀[2])
+                        nick_elem = cells[2].find('span', class_='nick')
+                        if nick_elem:
+                            author = nick_elem.get_text(strip=True)
+                        
+                        # 추천수 (셀[3])
+                        likes_text = cells[3].get_text(strip=True)
+                        if likes_text.isdigit():
+                            likes = int(likes_text)
+                        
+                        # 조회수 (셀[4])
+                        views_text = cells[4].get_text(strip=True)
+                        if views_text.isdigit():
+                            views = int(views_text)
                             
-                            # 추천수 (셀[3])
-                            likes_text = cells[3].get_text(strip=True)
-                            if likes_text.isdigit():
-                                likes = int(likes_text)
+                    elif len(cells) >= 4:
+                        # 셀이 적은 경우 fallback 로직
+                        for i, cell in enumerate(cells):
+                            cell_text = cell.get_text(strip=True)
                             
-                            # 조회수 (셀[4])
-                            views_text = cells[4].get_text(strip=True)
-                            if views_text.isdigit():
-                                views = int(views_text)
-                                
-                        elif len(cells) >= 4:
-                            # 셀이 적은 경우 fallback 로직
-                            for i, cell in enumerate(cells):
-                                cell_text = cell.get_text(strip=True)
-                                
-                                # 작성자 찾기
-                                if i <= 2:
-                                    nick_elem = cell.find('span', class_='nick')
-                                    if nick_elem and not author_found:
-                                        author = nick_elem.get_text(strip=True)
-                                        author_found = True
+                            # 작성자 찾기
+                            if i <= 2:
+                                nick_elem = cell.find('span', class_='nick')
+                                if nick_elem and not author_found:
+                                    author = nick_elem.get_text(strip=True)
+                                    author_found = True
+                            
+                            # 숫자 셀 처리 - ID 제외하고 처리
+                            if cell_text.isdigit() and i > 0:  # 첫번째 셀(ID) 제외
+                                cell_num = int(cell_text)
                                 
-                                # 숫자 셀 처리 - ID 제외하고 처리
-                                if cell_text.isdigit() and i > 0:  # 첫번째 셀(ID) 제외
-                                    cell_num = int(cell_text)
-                                    
-                                    if cell_num > 1000 and views == 0:
-                                        views = cell_num
-                                    elif cell_num < 1000 and likes == 0:
-                                        likes = cell_num
-                    except Exception as e:
-                        print(f"루리웹 셀 파싱 오류: {e}")
-                    
-                    # 작성자가 없으면 기본값
-                    author_found = False
-                    if not author:
-                        author = '루리웹'
-                    
-                    # 댓글수는 제목에서 추출 시도 - 여러 패턴 시도
-                    comment_patterns = [
-                        r'\((\d+)\)',  # (숫자) 패턴
-                        r'\[(\d+)\]',  # [숫자] 패턴  
-                        r'(\d+)$'      # 끝에 숫자
-                    ]
-                    
-                    for pattern in comment_patterns:
-                        comment_match = re.search(pattern, title)
-                        if comment_match:
-                            comments = int(comment_match.group(1))
-                            # 제목에서 댓글수 제거
-                            title = re.sub(pattern, '', title).strip()
-                            break
-                    
-                    # 인기도 점수 계산 (조회수 + 추천수*2 + 댓글수*3)
-                    popularity_score = views + (likes * 2) + (comments * 3)
-                    
-                    post_data = {
-                        'title': title,
-                        'url': post_url,
-                        'site': self.site_name,
-                        'category': '인기',
-                        'author': author,
-                        'views': views,
-                        'likes': likes,
-                        'comments': comments,
-                        'popularity_score': popularity_score
-                    }
-                    
-                    post_list.append(post_data)
-                    
+                                if cell_num > 1000 and views == 0:
+                                    views = cell_num
+                                elif cell_num < 1000 and likes == 0:
+                                    likes = cell_num
                 except Exception as e:
-                    print(f"루리웹 게시물 파싱 오류: {e}")
-                    continue
-            
-            # 인기도 순으로 정렬하고 상위 10개만 선택
-            post_list.sort(key=lambda x: x['popularity_score'], reverse=True)
-            posts = post_list[:10]
-            
-            for post in posts:
-                print(f"루리웹 게시물 추가: {post['title'][:50]}... (조회:{post['views']}, 추천:{post['likes']}, 댓글:{post['comments']})")
+                    print(f"루리웹 셀 파싱 오류: {e}")
                 
-        except Exception as e:
-            print(f"루리웹 크롤링 오류: {e}")
+                # 작성자가 없으면 기본값
+                author_found = False
+                if not author:
+                    author = '루리웹'
+                
+                # 댓글수는 제목에서 추출 시도 - 여러 패턴 시도
+                comment_patterns = [
+                    r'\((\d+)\)',  # (숫자) 패턴
+                    r'\[(\d+)\]',  # [숫자] 패턴  
+                    r'(\d+)$'      # 끝에 숫자
+                ]
+                
+                for pattern in comment_patterns:
+                    comment_match = re.search(pattern, title)
+                    if comment_match:
+                        comments = int(comment_match.group(1))
+                        # 제목에서 댓글수 제거
+                        title = re.sub(pattern, '', title).strip()
+                        break
+                
+                # 인기도 점수 계산 (조회수 + 추천수*2 + 댓글수*3)
+                popularity_score = views + (likes * 2) + (comments * 3)
+                
+                post_data = {
+                    'title': title,
+                    'url': post_url,
+                    'site': self.site_name,
+                    'category': '인기',
+                    'author': author,
+                    'views': views,
+                    'likes': likes,
+                    'comments': comments,
+                    'popularity_score': popularity_score
+                }
+                
+                post_list.append(post_data)
+                
+            except Exception as e:
+                print(f"루리웹 게시물 파싱 오류: {e}")
+                continue
+        
+        # 인기도 순으로 정렬하고 상위 10개만 선택
+        post_list.sort(key=lambda x: x['popularity_score'], reverse=True)
+        posts = post_list[:10]
         
+        for post in posts:
+            print(f"루리웹 게시물 추가: {post['title'][:50]}... (조회:{post['views']}, 추천:{post['likes']}, 댓글:{post['comments']})")
+
         return posts
     
 class DogdripCrawler(BaseCrawler):
@@ -919,34 +1066,35 @@ class DogdripCrawler(BaseCrawler):
     def __init__(self):
         super().__init__('dogdrip')
         self.base_url = 'https://www.dogdrip.net'
+        
+        # 실제 브라우저처럼 완전히 위장된 헤더
+        self.browser_headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+            'Accept-Encoding': 'gzip, deflate, br, zstd',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'none',
+            'Sec-Fetch-User': '?1',
+            'Sec-Ch-Ua': '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
+            'Sec-Ch-Ua-Mobile': '?0',
+            'Sec-Ch-Ua-Platform': '"Windows"',
+            'Cache-Control': 'max-age=0',
+            'DNT': '1'
+        }
 
     def crawl_popular_posts(self) -> List[Dict]:
         """개드립 인기 게시물 크롤링 (강화된 User-Agent 및 헤더)"""
         posts = []
         try:
-            # 실제 브라우저처럼 완전히 위장된 헤더
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Accept-Encoding': 'gzip, deflate, br, zstd',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-                'Sec-Ch-Ua': '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
-                'Sec-Ch-Ua-Mobile': '?0',
-                'Sec-Ch-Ua-Platform': '"Windows"',
-                'Cache-Control': 'max-age=0',
-                'DNT': '1'
-            }
+            headers = dict(self.browser_headers)
             
             # 먼저 메인 페이지 방문으로 세션 쿠키 얻기
             print("개드립 메인 페이지 방문 중...")
             self.session.get(self.base_url, headers=headers, timeout=10)
-            time.sleep(1)  # 잠시 대기
             
             # 인기글 페이지 접속
             url = f"{self.base_url}/?mid=dogdrip&sort_index=popular"
@@ -955,169 +1103,178 @@ class DogdripCrawler(BaseCrawler):
             response = self.session.get(url, headers=headers, timeout=15, allow_redirects=True)
             response.raise_for_status()
             
+            if self.is_not_modified(response) or self.is_unchanged(response.content):
+                return posts
+            
             print(f"개드립 응답 상태: {response.status_code}, 길이: {len(response.content)}")
-            soup = BeautifulSoup(response.content, 'html.parser')
+            posts = self.parse_posts(response.content)
+        except Exception as e:
+            print(f"개드립 크롤링 오류: {e}")
 
-            post_list = []
-            seen_titles = set()
-            
-            # 여러 셀렉터 시도
-            rows = soup.select('article.fdb_lst_itm')  # article 기반
-            print(f"개드립 article.fdb_lst_itm: {len(rows)}개")
-            
-            if not rows:
-                rows = soup.select('div.ed.ed_lst_doc')  # div 기반
-                print(f"개드립 div.ed.ed_lst_doc: {len(rows)}개")
-            
-            if not rows:
-                rows = soup.select('tr[class^="ed"]')  # tr 기반
-                print(f"개드립 tr[class^='ed']: {len(rows)}개")
-            
-            if not rows:
-                # a 태그로 직접 게시물 찾기 - dogdrip 게시물만
-                links = soup.find_all('a', href=True)
-                rows = [link for link in links if ('document_srl=' in link.get('href', '') or '/dogdrip/' in link.get('href', '')) and len(link.get_text(strip=True)) > 10]
-                print(f"개드립 링크 기반: {len(rows)}개")
-            
-            print(f"개드립 최종 게시물 요소: {len(rows)}개")
+        return posts
 
-            for row in rows[:30]:
-                try:
-                    # article이나 div인 경우
-                    if row.name in ['article', 'div']:
-                        title_link = row.find('a', class_='ed_link_doc') or row.find('a', href=lambda x: x and 'document_srl=' in x)
-                        if not title_link:
-                            continue
-                        
-                        title = title_link.get_text(strip=True)
-                        if not title or len(title) < 5 or title in seen_titles:
-                            continue
-                        seen_titles.add(title)
-                        
-                        href = title_link.get('href', '')
-                        if href.startswith('/'):
-                            post_url = self.base_url + href
-                        elif href.startswith('http'):
-                            post_url = href
-                        else:
-                            post_url = f"{self.base_url}/{href}"
-                        
-                        # 작성자, 조회수, 추천수 등 파싱
-                        author = '개드립'
-                        author_elem = row.find(class_='ed_lst_nik') or row.find('span', class_='member')
-                        if author_elem:
-                            author = author_elem.get_text(strip=True)
-                        
-                        views = 0
-                        views_elem = row.find(class_='ed_lst_view') or row.find(text=re.compile(r'조회'))
-                        if views_elem:
-                            views_text = views_elem if isinstance(views_elem, str) else views_elem.get_text(strip=True)
-                            views_match = re.search(r'(\d+)', views_text.replace(',', ''))
-                            if views_match:
-                                views = int(views_match.group(1))
-                        
-                        likes = 0
-                        likes_elem = row.find(class_='ed_lst_vote') or row.find(text=re.compile(r'추천'))
-                        if likes_elem:
-                            likes_text = likes_elem if isinstance(likes_elem, str) else likes_elem.get_text(strip=True)
-                            likes_match = re.search(r'(\d+)', likes_text.replace(',', ''))
-                            if likes_match:
-                                likes = int(likes_match.group(1))
-                        
-                        comments = 0
-                        comment_elem = row.find(class_='ed_lst_rp')
-                        if comment_elem:
-                            comment_text = comment_elem.get_text(strip=True)
-                            comment_match = re.search(r'(\d+)', comment_text.replace(',', ''))
-                            if comment_match:
-                                comments = int(comment_match.group(1))
-                        
-                        # 제목에서 댓글수 추출
-                        if comments == 0:
-                            comment_match = re.search(r'\[(\d+)\]', title)
-                            if comment_match:
-                                comments = int(comment_match.group(1))
-                                title = re.sub(r'\[(\d+)\]', '', title).strip()
+    def parse_posts(self, content) -> List[Dict]:
+        """개드립 목록 페이지 HTML에서 인기 게시물 추출"""
+        soup = BeautifulSoup(content, 'html.parser')
+
+        post_list = []
+        seen_titles = set()
+        
+        # 여러 셀렉터 시도
+        rows = soup.select('article.fdb_lst_itm')  # article 기반
+        print(f"개드립 article.fdb_lst_itm: {len(rows)}개")
+        
+        if not rows:
+            rows = soup.select('div.ed.ed_lst_doc')  # div 기반
+            print(f"개드립 div.ed.ed_lst_doc: {len(rows)}개")
+        
+        if not rows:
+            rows = soup.select('tr[class^="ed"]')  # tr 기반
+            print(f"개드립 tr[class^='ed']: {len(rows)}개")
+        
+        if not rows:
+            # a 태그로 직접 게시물 찾기 - dogdrip 게시물만
+            links = soup.find_all('a', href=True)
+            rows = [link for link in links if ('document_srl=' in link.get('href', '') or '/dogdrip/' in link.get('href', '')) and len(link.get_text(strip=True)) > 10]
+            print(f"개드립 링크 기반: {len(rows)}개")
+        
+        print(f"개드립 최종 게시물 요소: {len(rows)}개")
+
+        for row in rows[:30]:
+            try:
+                # article이나 div인 경우
+                if row.name in ['article', 'div']:
+                    title_link = row.find('a', class_='ed_link_doc') or row.find('a', href=lambda x: x and 'document_srl=' in x)
+                    if not title_link:
+                        continue
                     
-                    # tr이나 a 태그인 경우 (기존 로직)
+                    title = title_link.get_text(strip=True)
+                    if not title or len(title) < 5 or title in seen_titles:
+                        continue
+                    seen_titles.add(title)
+                    
+                    href = title_link.get('href', '')
+                    if href.startswith('/'):
+                        post_url = self.base_url + href
+                    elif href.startswith('http'):
+                        post_url = href
                     else:
-                        if row.name == 'a':
-                            title_link = row
-                        else:
-                            title_cell = row.find('td', class_='title')
-                            if not title_cell:
-                                continue
-                            title_link = title_cell.find('a')
-                        
-                        if not title_link:
-                            continue
-                        
-                        title = title_link.get_text(strip=True)
-                        if not title or len(title) < 5 or title in seen_titles:
-                            continue
-                        seen_titles.add(title)
-                        
-                        href = title_link.get('href', '')
-                        if href.startswith('/'):
-                            post_url = self.base_url + href
-                        elif href.startswith('http'):
-                            post_url = href
-                        else:
-                            post_url = f"{self.base_url}/{href}"
-
-                        author = '개드립'
-                        if row.name != 'a':
-                            author_cell = row.find('td', class_='author')
-                            if author_cell:
-                                author = author_cell.get_text(strip=True)
-                        
-                        views = 0
-                        if row.name != 'a':
-                            views_cell = row.find('td', class_='ed')
-                            if views_cell:
-                                try:
-                                    views = int(views_cell.get_text(strip=True).replace(',', ''))
-                                except:
-                                    views = 0
-                        
-                        likes = 0
-                        if row.name != 'a':
-                            likes_cell = row.find('td', class_='vote')
-                            if likes_cell:
-                                try:
-                                    likes = int(likes_cell.get_text(strip=True).replace(',', ''))
-                                except:
-                                    likes = 0
-                        
-                        comments = 0
+                        post_url = f"{self.base_url}/{href}"
+                    
+                    # 작성자, 조회수, 추천수 등 파싱
+                    author = '개드립'
+                    author_elem = row.find(class_='ed_lst_nik') or row.find('span', class_='member')
+                    if author_elem:
+                        author = author_elem.get_text(strip=True)
+                    
+                    views = 0
+                    views_elem = row.find(class_='ed_lst_view') or row.find(text=re.compile(r'조회'))
+                    if views_elem:
+                        views_text = views_elem if isinstance(views_elem, str) else views_elem.get_text(strip=True)
+                        views_match = re.search(r'(\d+)', views_text.replace(',', ''))
+                        if views_match:
+                            views = int(views_match.group(1))
+                    
+                    likes = 0
+                    likes_elem = row.find(class_='ed_lst_vote') or row.find(text=re.compile(r'추천'))
+                    if likes_elem:
+                        likes_text = likes_elem if isinstance(likes_elem, str) else likes_elem.get_text(strip=True)
+                        likes_match = re.search(r'(\d+)', likes_text.replace(',', ''))
+                        if likes_match:
+                            likes = int(likes_match.group(1))
+                    
+                    comments = 0
+                    comment_elem = row.find(class_='ed_lst_rp')
+                    if comment_elem:
+                        comment_text = comment_elem.get_text(strip=True)
+                        comment_match = re.search(r'(\d+)', comment_text.replace(',', ''))
+                        if comment_match:
+                            comments = int(comment_match.group(1))
+                    
+                    # 제목에서 댓글수 추출
+                    if comments == 0:
                         comment_match = re.search(r'\[(\d+)\]', title)
                         if comment_match:
                             comments = int(comment_match.group(1))
                             title = re.sub(r'\[(\d+)\]', '', title).strip()
+                
+                # tr이나 a 태그인 경우 (기존 로직)
+                else:
+                    if row.name == 'a':
+                        title_link = row
+                    else:
+                        title_cell = row.find('td', class_='title')
+                        if not title_cell:
+                            continue
+                        title_link = title_cell.find('a')
+                    
+                    if not title_link:
+                        continue
+                    
+                    title = title_link.get_text(strip=True)
+                    if not title or len(title) < 5 or title in seen_titles:
+                        continue
+                    seen_titles.add(title)
+                    
+                    href = title_link.get('href', '')
+                    if href.startswith('/'):
+                        post_url = self.base_url + href
+                    elif href.startswith('http'):
+                        post_url = href
+                    else:
+                        post_url = f"{self.base_url}/{href}"
 
-                    popularity_score = views + (likes * 2) + (comments * 3)
-                    post_data = {
-                        'title': title,
-                        'url': post_url,
-                        'author': author,
-                        'site': self.site_name,
-                        'category': '인기',
-                        'views': views,
-                        'likes': likes,
-                        'comments': comments,
-                        'popularity_score': popularity_score
-                    }
-                    post_list.append(post_data)
+                    author = '개드립'
+                    if row.name != 'a':
+                        author_cell = row.find('td', class_='author')
+                        if author_cell:
+                            author = author_cell.get_text(strip=True)
                     
-                except Exception as e:
-                    print(f"개드립 게시물 파싱 오류: {e}")
-                    continue
+                    views = 0
+                    if row.name != 'a':
+                        views_cell = row.find('td', class_='ed')
+                        if views_cell:
+                            try:
+                                views = int(views_cell.get_text(strip=True).replace(',', ''))
+                            except:
+                                views = 0
+                    
+                    likes = 0
+                    if row.name != 'a':
+                        likes_cell = row.find('td', class_='vote')
+                        if likes_cell:
+                            try:
+                                likes = int(likes_cell.get_text(strip=True).replace(',', ''))
+                            except:
+                                likes = 0
+                    
+                    comments = 0
+                    comment_match = re.search(r'\[(\d+)\]', title)
+                    if comment_match:
+                        comments = int(comment_match.group(1))
+                        title = re.sub(r'\[(\d+)\]', '', title).strip()
 
-            post_list.sort(key=lambda x: x['popularity_score'], reverse=True)
-            posts = post_list[:10]
-            for post in posts:
-                print(f"개드립 게시물 추가: {post['title'][:50]}... (조회:{post['views']}, 추천:{post['likes']}, 댓글:{post['comments']})")
-        except Exception as e:
-            print(f"개드립 크롤링 오류: {e}")
+                popularity_score = views + (likes * 2) + (comments * 3)
+                post_data = {
+                    'title': title,
+                    'url': post_url,
+                    'author': author,
+                    'site': self.site_name,
+                    'category': '인기',
+                    'views': views,
+                    'likes': likes,
+                    'comments': comments,
+                    'popularity_score': popularity_score
+                }
+                post_list.append(post_data)
+                
+            except Exception as e:
+                print(f"개드립 게시물 파싱 오류: {e}")
+                continue
+
+        post_list.sort(key=lambda x: x['popularity_score'], reverse=True)
+        posts = post_list[:10]
+        for post in posts:
+            print(f"개드립 게시물 추가: {post['title'][:50]}... (조회:{post['views']}, 추천:{post['likes']}, 댓글:{post['comments']})")
 
         return posts
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""게시물 데이터 버전 - DB의 DataVersion 행으로 모든 워커가 공유
+
+크롤링을 실행한 리더 프로세스는 게시물 저장과 같은 트랜잭션에서 버전을 올리고,
+다른 워커는 짧은 TTL마다 버전을 다시 읽어 응답/통계 캐시를 새 버전 기준으로 바꾼다.
+"""
+
+import threading
+import time
+from datetime import datetime
+
+from app.models import DataVersion, db
+from config import Config
+
+POSTS_VERSION = 'posts'
+
+
+def bump_data_version(session=None):
+    """현재 트랜잭션에서 게시물 데이터 버전 증가 (커밋은 호출한 쪽에서)"""
+    session = session or db.session
+    updated = session.execute(
+        db.update(DataVersion)
+        .where(DataVersion.name == POSTS_VERSION)
+        .values(version=DataVersion.version + 1, updated_at=datetime.utcnow())
+    ).rowcount
+    if not updated:
+        session.add(DataVersion(name=POSTS_VERSION, version=1, updated_at=datetime.utcnow()))
+
+
+class DataVersionReader:
+    """데이터 버전을 TTL 동안 프로세스에 보관하는 조회기"""
+
+    def __init__(self, ttl: float = None):
+        self.ttl = Config.DATA_VERSION_TTL if ttl is None else ttl
+        self._version = None
+        self._read_at = 0.0
+        self._lock = threading.Lock()
+
+    def current(self) -> int:
+        """현재 데이터 버전 (TTL이 지났으면 DB에서 다시 읽음, 앱 컨텍스트 필요)"""
+        with self._lock:
+            if self._version is not None and time.monotonic() - self._read_at < self.ttl:
+                return self._version
+
+        version = db.session.query(DataVersion.version).filter_by(name=POSTS_VERSION).scalar() or 0
+        with self._lock:
+            self._version = version
+            self._read_at = time.monotonic()
+        return version
+
+    def expire(self):
+        """이 프로세스가 버전을 올린 뒤 호출 - 다음 조회에서 바로 다시 읽음"""
+        with self._lock:
+            self._version = None
+
+
+# 전역 데이터 버전 조회기 인스턴스
+data_version_instance = None
+_instance_lock = threading.Lock()
+
+def get_data_version() -> DataVersionReader:
+    """데이터 버전 조회기 인스턴스 반환"""
+    global data_version_instance
+    with _instance_lock:
+        if data_version_instance is None:
+            data_version_instance = DataVersionReader()
+    return data_version_instance
@@ -0,0 +1,174 @@
+"""여러 웹 워커 중 한 프로세스만 크롤링 스케줄을 맡도록 하는 DB 임대(lease) 기반 리더 선출
+
+리더는 heartbeat마다 임대 만료 시각을 연장하고, 리더 프로세스가 죽어 임대가 만료되면
+다른 워커가 다음 heartbeat에서 임대를 가져가 스케줄러를 시작한다.
+같은 임대 테이블을 사이트별 크롤링 실행 잠금과 수동 크롤링 작업 중복 방지에도 사용한다
+(acquire_lease / release_lease).
+"""
+
+import atexit
+import os
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy.exc import IntegrityError
+
+from app.models import SchedulerLease, db
+from config import Config
+
+# 이 프로세스를 나타내는 임대 소유자 id (호스트:PID:임의값)
+PROCESS_OWNER = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def acquire_lease(name: str, owner: str, ttl: float) -> bool:
+    """임대 획득 또는 연장 (내 임대이거나 만료된 임대만 가져옴, 앱 컨텍스트 필요)
+
+    조건부 UPDATE라 여러 워커가 동시에 시도해도 하나만 성공한다. DB 오류는 호출한 쪽에서 처리.
+    """
+    now = datetime.utcnow()
+    expires_at = now + timedelta(seconds=ttl)
+
+    try:
+        updated = db.session.execute(
+            db.update(SchedulerLease)
+            .where(SchedulerLease.name == name)
+            .where(db.or_(SchedulerLease.owner == owner, SchedulerLease.expires_at < now))
+            .values(owner=owner, expires_at=expires_at, heartbeat_at=now)
+        ).rowcount
+
+        if not updated and db.session.get(SchedulerLease, name) is None:
+            db.session.add(SchedulerLease(name=name, owner=owner, expires_at=expires_at, heartbeat_at=now))
+            updated = 1
+        db.session.commit()
+    except IntegrityError:
+        # 다른 워커가 먼저 임대 행을 만듦
+        db.session.rollback()
+        return False
+    except Exception:
+        db.session.rollback()
+        raise
+    return bool(updated)
+
+
+def release_lease(name: str, owner: str):
+    """내 임대를 즉시 만료시켜 다른 워커가 바로 가져갈 수 있게 함 (앱 컨텍스트 필요)"""
+    try:
+        db.session.execute(
+            db.update(SchedulerLease)
+            .where(SchedulerLease.name == name, SchedulerLease.owner == owner)
+            .values(expires_at=datetime.utcnow())
+        )
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"임대 반납 오류 ({name}): {e}")
+
+
+def current_lease_owner(name: str):
+    """만료되지 않은 임대의 소유자 (없으면 None, 앱 컨텍스트 필요)"""
+    return db.session.execute(
+        db.select(SchedulerLease.owner)
+        .where(SchedulerLease.name == name, SchedulerLease.expires_at >= datetime.utcnow())
+    ).scalar()
+
+
+class LeaderElector:
+    """임대 행 하나를 두고 경쟁하는 리더 선출기"""
+
+    def __init__(self, name: str = 'crawl_scheduler', lease_ttl: int = None, heartbeat: int = None):
+        self.name = name
+        self.lease_ttl = lease_ttl or Config.LEADER_LEASE_TTL
+        self.heartbeat = heartbeat or Config.LEADER_HEARTBEAT
+        self.owner_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self.lease_expires_at = None   # 마지막으로 확보한 임대의 만료 시각
+        self.app = None
+        self.on_elected = None
+        self.on_lost = None
+        self._stop_event = threading.Event()
+        self.thread = None
+
+    def try_acquire(self) -> bool:
+        """임대 획득 또는 연장 시도 (앱 컨텍스트 필요)"""
+        expires_at = datetime.utcnow() + timedelta(seconds=self.lease_ttl)
+
+        try:
+            acquired = acquire_lease(self.name, self.owner_id, self.lease_ttl)
+        except Exception as e:
+            print(f"리더 임대 갱신 오류: {e}")
+            # 일시적인 DB 오류에는 확보해 둔 임대가 만료되기 전까지 리더 유지
+            return self.is_leader and self.lease_expires_at is not None and self.lease_expires_at > datetime.utcnow()
+
+        if acquired:
+            self.lease_expires_at = expires_at
+        return acquired
+
+    def release(self):
+        """내 임대를 즉시 만료시켜 다른 워커가 바로 이어받게 함 (앱 컨텍스트 필요)"""
+        release_lease(self.name, self.owner_id)
+
+    def start(self, app, on_elected, on_lost=None):
+        """첫 선출을 바로 시도하고 heartbeat 스레드 시작"""
+        if self.thread is not None:
+            return
+
+        self.app = app
+        self.on_elected = on_elected
+        self.on_lost = on_lost
+        self._stop_event.clear()
+
+        self._tick()
+        if not self.is_leader:
+            print(f"다른 워커가 크롤링 스케줄러를 실행 중입니다 (대기: {self.owner_id})")
+
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        """heartbeat 중지 후 리더였다면 임대 반납"""
+        self._stop_event.set()
+        if self.is_leader:
+            self._set_leader(False)
+            with self.app.app_context():
+                self.release()
+
+    def _run(self):
+        """heartbeat마다 임대 갱신"""
+        while not self._stop_event.wait(self.heartbeat):
+            self._tick()
+
+    def _tick(self):
+        with self.app.app_context():
+            acquired = self.try_acquire()
+        if acquired != self.is_leader:
+            self._set_leader(acquired)
+
+    def _set_leader(self, leader: bool):
+        """리더 상태가 바뀌면 콜백 호출"""
+        self.is_leader = leader
+        try:
+            if leader:
+                print(f"크롤링 스케줄러 리더로 선출되었습니다 ({self.owner_id})")
+                self.on_elected()
+            else:
+                print(f"크롤링 스케줄러 리더 자격을 잃었습니다 ({self.owner_id})")
+                if self.on_lost:
+                    self.on_lost()
+        except Exception as e:
+            print(f"리더 상태 변경 처리 오류: {e}")
+
+
+# 전역 리더 선출기 인스턴스
+leader_elector_instance = None
+_instance_lock = threading.Lock()
+
+def get_leader_elector() -> LeaderElector:
+    """리더 선출기 인스턴스 반환"""
+    global leader_elector_instance
+    with _instance_lock:
+        if leader_elector_instance is None:
+            leader_elector_instance = LeaderElector()
+    return leader_elector_instance
@@ -0,0 +1,159 @@
+"""데이터베이스 스키마 업그레이드 (기존 데이터 유지)
+
+db.create_all()은 이미 있는 테이블에 인덱스나 컬럼을 추가하지 않으므로,
+기존 community_aggregator.db는 여기의 단계들을 순서대로 적용해 최신 스키마로 맞춘다.
+모든 단계는 여러 번 실행해도 안전하다. 여러 워커가 동시에 시작해도 DB 임대(schema_migration)를
+가진 프로세스 하나만 적용하고, 나머지는 임대가 풀릴 때까지 기다린 뒤 남은 단계만 확인한다.
+"""
+
+import time
+from datetime import datetime
+from typing import List
+from sqlalchemy import inspect, text
+from app.leader import PROCESS_OWNER, acquire_lease, release_lease
+from app.models import db, Post, ScheduledJobState
+from config import Config
+
+MIGRATION_LEASE = 'schema_migration'
+
+
+def index_names(conn, table: str) -> set:
+    """테이블의 인덱스 이름 (SQLite는 식 인덱스를 리플렉션하지 않으므로 sqlite_master에서 읽음)"""
+    if conn.dialect.name == 'sqlite':
+        return set(conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table"), {'table': table}
+        ).scalars())
+    return {index['name'] for index in inspect(conn).get_indexes(table)}
+
+
+def dedupe_post_urls(conn) -> str:
+    """URL 고유 인덱스를 만들기 전에 중복 게시물 정리 (가장 먼저 저장된 행 유지)
+
+    인덱스가 이미 있으면 중복이 있을 수 없으므로 테이블 전체 DELETE를 건너뛴다
+    (인덱스가 없는 동안 한 번만 실행되고, 이어서 create_missing_indexes가 인덱스를 만든다).
+    """
+    table = Post.__table__.name
+    existing = index_names(conn, table)
+    if 'ux_post_url' in existing:
+        return None
+
+    result = conn.execute(text(
+        f"DELETE FROM {table} WHERE id NOT IN (SELECT MIN(id) FROM {table} GROUP BY url)"
+    ))
+    if result.rowcount:
+        return f"중복 URL 게시물 {result.rowcount}개 삭제"
+    return None
+
+
+def add_site_rank_column(conn) -> str:
+    """정렬용 site_rank 컬럼 추가"""
+    table = Post.__table__.name
+    columns = {column['name'] for column in inspect(conn).get_columns(table)}
+    if 'site_rank' in columns:
+        return None
+    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN site_rank INTEGER"))
+    return "site_rank 컬럼 추가"
+
+
+def backfill_site_rank(conn) -> str:
+    """site_rank를 현재 Config.SITE_PRIORITY에 맞춤 (비어 있거나 우선순위가 바뀐 행)"""
+    rank = Post.site_rank_case()
+    result = conn.execute(
+        db.update(Post.__table__)
+        .where(db.or_(Post.site_rank.is_(None), Post.site_rank != rank))
+        .values(site_rank=rank)
+    )
+    if result.rowcount:
+        return f"site_rank 갱신 {result.rowcount}개"
+    return None
+
+
+def add_job_interval_column(conn) -> str:
+    """스케줄러 작업 상태에 적응형 주기 컬럼 추가"""
+    table = ScheduledJobState.__table__.name
+    inspector = inspect(conn)
+    if not inspector.has_table(table):
+        return None
+    columns = {column['name'] for column in inspector.get_columns(table)}
+    if 'interval_seconds' in columns:
+        return None
+    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN interval_seconds INTEGER"))
+    return "interval_seconds 컬럼 추가"
+
+
+def fill_null_crawled_at(conn) -> str:
+    """수집 시각 NULL을 작성 시각(없으면 현재 시각)으로 채워 커서 페이지에서 빠지지 않게 함"""
+    result = conn.execute(
+        db.update(Post.__table__).where(Post.crawled_at.is_(None))
+        .values(crawled_at=db.func.coalesce(Post.created_at, datetime.utcnow()))
+    )
+    if result.rowcount:
+        return f"수집 시각 NULL 채움 {result.rowcount}개"
+    return None
+
+
+def drop_replaced_indexes(conn) -> str:
+    """이름을 바꿔 다시 만드는 인덱스의 이전 버전 삭제
+
+    ix_post_feed(조회수 그대로)는 NULL 조회수를 0으로 보는 ix_post_ranked로 대체됨.
+    """
+    existing = index_names(conn, Post.__table__.name)
+    dropped = []
+    for name in ('ix_post_feed',):
+        if name in existing:
+            conn.execute(text(f"DROP INDEX {name}"))
+            dropped.append(name)
+    if dropped:
+        return f"인덱스 삭제: {', '.join(dropped)}"
+    return None
+
+
+def create_missing_indexes(conn) -> str:
+    """모델에 정의된 인덱스 중 없는 것 생성"""
+    existing = index_names(conn, Post.__table__.name)
+    created = []
+    for index in Post.__table__.indexes:
+        if index.name not in existing:
+            index.create(bind=conn)
+            created.append(index.name)
+    if created:
+        return f"인덱스 생성: {', '.join(created)}"
+    return None
+
+
+# 적용 순서대로 나열
+MIGRATIONS = [
+    dedupe_post_urls,
+    add_site_rank_column,
+    backfill_site_rank,
+    fill_null_crawled_at,
+    add_job_interval_column,
+    drop_replaced_indexes,
+    create_missing_indexes,
+]
+
+
+def upgrade_database() -> List[str]:
+    """기존 데이터베이스에 마이그레이션 단계 적용 후 적용 내역 반환 (앱 컨텍스트 필요)
+
+    다른 워커가 적용 중이면 끝날 때까지 기다린다 (MIGRATION_LEASE_TTL을 넘기면 RuntimeError).
+    """
+    deadline = time.monotonic() + Config.MIGRATION_LEASE_TTL
+    while not acquire_lease(MIGRATION_LEASE, PROCESS_OWNER, Config.MIGRATION_LEASE_TTL):
+        if time.monotonic() > deadline:
+            raise RuntimeError("다른 프로세스의 스키마 마이그레이션이 끝나지 않음")
+        time.sleep(1)
+
+    applied = []
+    try:
+        # 하나의 트랜잭션으로 처리해 중간에 실패하면 전부 되돌림
+        with db.engine.begin() as conn:
+            for migration in MIGRATIONS:
+                message = migration(conn)
+                if message:
+                    print(f"마이그레이션: {message}")
+                    applied.append(message)
+    finally:
+        release_lease(MIGRATION_LEASE, PROCESS_OWNER)
+
+    return applied
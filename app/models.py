@@ -1,9 +1,26 @@
+import json
 from datetime import datetime
 from flask_sqlalchemy import SQLAlchemy
+from config import Config
 
 db = SQLAlchemy()
 
+def site_rank_for(site):
+    """사이트 우선순위 값 (Config.SITE_PRIORITY, 없는 사이트는 99)"""
+    return Config.SITE_PRIORITY.get(site, 99)
+
+def _default_site_rank(context):
+    """INSERT 시 site 값으로 site_rank 기본값 계산"""
+    return site_rank_for(context.get_current_parameters().get('site'))
+
 class Post(db.Model):
+    __table_args__ = (
+        db.Index('ux_post_url', 'url', unique=True),                # 중복 체크 키 (save_posts)
+        db.Index('ix_post_site_views', 'site', 'views'),            # 사이트별 조회수 정렬
+        db.Index('ix_post_site_crawled_at', 'site', 'crawled_at'),  # 사이트별 최신순 조회
+        db.Index('ix_post_category', 'category'),                   # 카테고리 필터
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(500), nullable=False)
     url = db.Column(db.String(1000), nullable=False)
@@ -15,10 +32,58 @@ class Post(db.Model):
     comments = db.Column(db.Integer, default=0)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     crawled_at = db.Column(db.DateTime, default=datetime.utcnow)
+    site_rank = db.Column(db.Integer, default=_default_site_rank)  # 목록 정렬용 사이트 우선순위 (인덱스 사용)
     
     def __repr__(self):
         return f'<Post {self.title}>'
     
+    @classmethod
+    def site_rank_case(cls):
+        """site 컬럼으로 우선순위를 계산하는 SQL 식 (site_rank 백필용)"""
+        return db.case(Config.SITE_PRIORITY, value=cls.site, else_=99)
+    
+    @classmethod
+    def views_key(cls):
+        """정렬용 조회수 SQL 식 (NULL은 0으로 취급 - 값은 바꾸지 않고 순서만 기존 목록과 같게 함)"""
+        return db.func.coalesce(cls.views, 0)
+    
+    @classmethod
+    def ranked(cls, query=None):
+        """사이트 우선순위 -> 조회수 -> 최신 수집순으로 정렬한 쿼리 (ix_post_ranked 순서와 동일)"""
+        query = query if query is not None else cls.query
+        return query.order_by(
+            cls.site_rank,
+            cls.views_key().desc(),
+            cls.crawled_at.desc(),
+            cls.id
+        )
+    
+    @classmethod
+    def ranked_after(cls, query, key):
+        """ranked() 순서에서 key(사이트 순위, 조회수, 수집 시각, id) 다음 행부터 조회하는 키셋 조건
+        
+        선행 조건 site_rank >= 값으로 인덱스 범위 탐색 시작점을 정한다.
+        """
+        site_rank, views, crawled_at, post_id = key
+        views_key = cls.views_key()
+        return cls.ranked(query).filter(
+            cls.site_rank >= site_rank,
+            db.or_(
+                cls.site_rank > site_rank,
+                db.and_(cls.site_rank == site_rank, db.or_(
+                    views_key < views,
+                    db.and_(views_key == views, db.or_(
+                        cls.crawled_at < crawled_at,
+                        db.and_(cls.crawled_at == crawled_at, cls.id > post_id)
+                    ))
+                ))
+            )
+        )
+    
+    def rank_key(self):
+        """ranked() 정렬 키 (페이지 커서 생성용)"""
+        return (self.site_rank, self.views or 0, self.crawled_at, self.id)
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -34,6 +99,9 @@ class Post(db.Model):
             'crawled_at': self.crawled_at.isoformat() if self.crawled_at else None
         }
 
+# 목록 API 정렬 순서 그대로의 인덱스 - 커서 페이지를 인덱스 범위 탐색으로 처리
+db.Index('ix_post_ranked', Post.site_rank, Post.views_key().desc(), Post.crawled_at.desc(), Post.id)
+
 class SiteVisit(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     visit_date = db.Column(db.Date, default=lambda: datetime.utcnow().date())
@@ -41,4 +109,75 @@ class SiteVisit(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     def __repr__(self):
-        return f'<SiteVisit {self.visit_date}: {self.visit_count}>'
\ No newline at end of file
+        return f'<SiteVisit {self.visit_date}: {self.visit_count}>'
+
+class ScheduledJobState(db.Model):
+    """스케줄러 작업별 마지막/다음 실행 기록"""
+    job_id = db.Column(db.String(191), primary_key=True)
+    last_run_at = db.Column(db.DateTime)         # 마지막 실행 종료 시각 (UTC)
+    last_scheduled_at = db.Column(db.DateTime)   # 마지막 실행의 예정 시각 (UTC)
+    last_status = db.Column(db.String(20))       # success, error, missed
+    last_result = db.Column(db.Integer)          # 저장한 새 게시물 수
+    last_error = db.Column(db.Text)
+    next_run_at = db.Column(db.DateTime)         # 다음 실행 예정 시각 (UTC)
+    interval_seconds = db.Column(db.Integer)     # 적응형 크롤링 주기 (초)
+
+    def __repr__(self):
+        return f'<ScheduledJobState {self.job_id}: {self.last_status}>'
+
+    def to_dict(self):
+        return {
+            'job_id': self.job_id,
+            'last_run_at': self.last_run_at.isoformat() if self.last_run_at else None,
+            'last_scheduled_at': self.last_scheduled_at.isoformat() if self.last_scheduled_at else None,
+            'last_status': self.last_status,
+            'last_result': self.last_result,
+            'last_error': self.last_error,
+            'next_run_at': self.next_run_at.isoformat() if self.next_run_at else None,
+            'interval_seconds': self.interval_seconds
+        }
+
+class SchedulerLease(db.Model):
+    """DB 임대 - 스케줄러 리더(crawl_scheduler), 사이트별 크롤링 잠금(crawl_site:<사이트>), 수동 크롤링 작업(crawl_job), 스키마 마이그레이션(schema_migration)"""
+    name = db.Column(db.String(100), primary_key=True)
+    owner = db.Column(db.String(200), nullable=False)   # 호스트:PID:임의값 (수동 크롤링 작업은 작업 id)
+    expires_at = db.Column(db.DateTime, nullable=False)  # 임대 만료 시각 (UTC)
+    heartbeat_at = db.Column(db.DateTime)                # 마지막 갱신 시각 (UTC)
+
+    def __repr__(self):
+        return f'<SchedulerLease {self.name}: {self.owner}>'
+class DataVersion(db.Model):
+    """게시물 데이터 버전 (게시물을 저장하는 트랜잭션에서 함께 증가 - 모든 워커의 응답/통계 캐시 키)"""
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<DataVersion {self.name}: {self.version}>'
+
+class CrawlJob(db.Model):
+    """수동 크롤링 작업 (어느 워커에서든 상태 조회 가능하도록 DB에 보관)"""
+    job_id = db.Column(db.String(32), primary_key=True)
+    status = db.Column(db.String(20), nullable=False, default='queued')  # queued, running, done, error
+    owner = db.Column(db.String(200))            # 작업을 실행하는 프로세스
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+    new_posts = db.Column(db.Integer)
+    error = db.Column(db.Text)
+    sites = db.Column(db.Text)                   # 사이트별 진행 상황 (JSON)
+
+    def __repr__(self):
+        return f'<CrawlJob {self.job_id}: {self.status}>'
+
+    def to_dict(self):
+        return {
+            'job_id': self.job_id,
+            'status': self.status,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'new_posts': self.new_posts,
+            'error': self.error,
+            'sites': json.loads(self.sites) if self.sites else {}
+        }
@@ -1,31 +1,49 @@
-from flask import Blueprint, render_template, jsonify, request
-from app.models import Post, SiteVisit, db
-from app.crawlers.crawler_manager import CrawlerManager
+from flask import Blueprint, render_template, jsonify, request, current_app
+from app.models import Post
+from app.crawl_jobs import get_crawl_job_queue
+from app.stats import get_stats_service
+from app.cache import cached_response, get_response_cache
+from app.visits import get_visit_counter
 from config import Config
 from datetime import datetime
+import base64
+import json
 
 main = Blueprint('main', __name__)
 
+def encode_cursor(post):
+    """마지막 게시물의 정렬 키를 불투명한 커서 문자열로 변환"""
+    site_rank, views, crawled_at, post_id = post.rank_key()
+    payload = [site_rank, views, crawled_at.isoformat() if crawled_at else None, post_id]
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor):
+    """커서 문자열을 정렬 키로 변환 (형식이 잘못되면 ValueError)
+
+    수집 시각이 없는 커서(NULL 백필 전에 발급)는 가장 이른 시각으로 보고 다음 조회수 구간부터 이어간다.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        site_rank, views, crawled_at, post_id = json.loads(raw)
+        crawled_at = datetime.fromisoformat(crawled_at) if crawled_at is not None else datetime.min
+        return (int(site_rank), int(views), crawled_at, int(post_id))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f'잘못된 커서: {cursor}') from e
+
 @main.route('/')
 def index():
     """메인 페이지"""
-    # 방문자 수 증가
-    today = datetime.utcnow().date()
-    visit = SiteVisit.query.filter_by(visit_date=today).first()
-    if visit:
-        visit.visit_count += 1
-    else:
-        visit = SiteVisit(visit_date=today, visit_count=1)
-        db.session.add(visit)
-    
-    try:
-        db.session.commit()
-    except:
-        db.session.rollback()
+    # 방문자 수 증가 (메모리에서 세고 주기적으로 SiteVisit에 반영)
+    get_visit_counter().record()
     
+    # 방문 기록은 매번 남기고, 페이지는 데이터 버전별로 캐시된 것을 사용
+    return get_response_cache().serve(render_index)
+
+def render_index():
+    """메인 페이지 렌더링 (캐시 미스일 때만 호출)"""
     # 통계 계산
-    total_visitors = db.session.query(db.func.sum(SiteVisit.visit_count)).scalar() or 0
-    today_visitors = visit.visit_count if visit else 0
+    total_visitors, today_visitors = get_visit_counter().get_counts()
     
     categories = Config.CATEGORIES
     sites = Config.SUPPORTED_SITES
@@ -38,11 +56,14 @@ def index():
                          last_updated=datetime.now().strftime('%Y-%m-%d %H:%M'))
 
 @main.route('/api/posts')
+@cached_response
 def get_posts():
     """게시물 API"""
     category = request.args.get('category', 'all')
     site = request.args.get('site', 'all')
-    limit = request.args.get('limit', 50, type=int)
+    # 음수나 너무 큰 값으로 테이블 전체를 읽지 않도록 제한
+    limit = max(1, min(request.args.get('limit', 50, type=int), Config.POSTS_API_MAX_LIMIT))
+    cursor = request.args.get('cursor')
     
     query = Post.query
     
@@ -52,56 +73,72 @@ def get_posts():
     if site != 'all':
         query = query.filter(Post.site == site)
     
-    # 모든 게시물 가져와서 Python으로 정렬
-    all_posts = query.order_by(Post.crawled_at.desc()).all()
-    
     # 사이트 우선순위: 보배 -> 루리웹 -> 개드립 -> 뽐뿌 -> 디시 -> 에펨 순
-    # 각 사이트 내에서는 조회수 순으로 정렬
-    site_priority = {'bobae': 0, 'ruliweb': 1, 'dogdrip': 2, 'ppomppu': 3, 'dcinside': 4, 'fmkorea': 5}
+    # 각 사이트 내에서는 조회수 순으로 정렬 (필요한 행만 SQL에서 정렬/제한)
+    if cursor is None:
+        # cursor 인자가 없으면 기존 응답 형식 그대로 (커서 페이지는 첫 페이지도 cursor= 로 요청)
+        posts = Post.ranked(query).limit(limit).all()
+        return jsonify({
+            'posts': [post.to_dict() for post in posts],
+            'total': len(posts)
+        })
+    
+    if cursor:
+        try:
+            query = Post.ranked_after(query, decode_cursor(cursor))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+    else:
+        query = Post.ranked(query)
     
-    posts = sorted(all_posts, key=lambda x: (site_priority.get(x.site, 99), -(x.views or 0)))[:limit]
+    # 한 개 더 읽어서 다음 페이지가 있는지 확인
+    posts = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(posts) > limit:
+        posts = posts[:limit]
+        next_cursor = encode_cursor(posts[-1])
     
     return jsonify({
         'posts': [post.to_dict() for post in posts],
-        'total': len(posts)
+        'total': len(posts),
+        'next_cursor': next_cursor
     })
 
-@main.route('/api/crawl')
+@main.route('/api/crawl', methods=['GET', 'POST'])
 def manual_crawl():
-    """수동 크롤링 실행"""
+    """수동 크롤링 작업 등록 (이미 실행 중이면 그 작업 id 반환)"""
     try:
-        crawler_manager = CrawlerManager()
-        result = crawler_manager.crawl_all_sites()
+        job, created = get_crawl_job_queue().submit(current_app._get_current_object())
         return jsonify({
             'success': True,
-            'message': f'{result} 개의 게시물을 수집했습니다.'
-        })
+            'job_id': job['job_id'],
+            'status': job['status'],
+            'message': '크롤링을 시작했습니다.' if created else '이미 크롤링이 진행 중입니다.'
+        }), 202
     except Exception as e:
         return jsonify({
             'success': False,
             'message': f'크롤링 중 오류가 발생했습니다: {str(e)}'
         }), 500
 
+@main.route('/api/crawl/<job_id>')
+def crawl_status(job_id):
+    """수동 크롤링 작업 상태 (사이트별 진행 상황과 소요 시간)"""
+    job = get_crawl_job_queue().get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'message': '작업을 찾을 수 없습니다.'
+        }), 404
+    
+    return jsonify(dict(job, success=True))
+
 @main.route('/api/stats')
+@cached_response
 def get_stats():
     """통계 정보"""
-    total_posts = Post.query.count()
-    
-    stats_by_category = {}
-    for category_key in Config.CATEGORIES:
-        count = Post.query.filter(Post.category == category_key).count()
-        stats_by_category[category_key] = count
-    
-    stats_by_site = {}
-    for site_key in Config.SUPPORTED_SITES:
-        count = Post.query.filter(Post.site == site_key).count()
-        stats_by_site[site_key] = count
-    
-    return jsonify({
-        'total_posts': total_posts,
-        'by_category': stats_by_category,
-        'by_site': stats_by_site
-    })
+    # 한 번의 집계 쿼리 결과를 새 게시물이 저장될 때까지 재사용
+    return jsonify(get_stats_service().get_stats())
 
 @main.route('/generate-static')
 def generate_static():
@@ -109,25 +146,15 @@ def generate_static():
     import os
     
     try:
-        # 최신 게시물 가져오기 (사이트 우선순위 적용)
-        all_posts = Post.query.order_by(Post.crawled_at.desc()).all()
-        
-        # Python으로 사이트 우선순위 정렬: 보배 -> 루리웹 -> 개드립 -> 뽐뿌 -> 디시 -> 에펨 순
+        # 최신 게시물 가져오기 (사이트 우선순위 적용: 보배 -> 루리웹 -> 개드립 -> 뽐뿌 -> 디시 -> 에펨 순)
         # 각 사이트 내에서는 조회수 순으로 정렬
-        site_priority = {'bobae': 0, 'ruliweb': 1, 'dogdrip': 2, 'ppomppu': 3, 'dcinside': 4, 'fmkorea': 5}
-        posts = sorted(all_posts, key=lambda x: (site_priority.get(x.site, 99), -(x.views or 0)))[:50]
+        posts = Post.ranked().limit(50).all()
         
         # 사이트별 통계
-        site_stats = {}
-        for site_key in Config.SUPPORTED_SITES:
-            count = Post.query.filter(Post.site == site_key).count()
-            site_stats[site_key] = count
+        site_stats = get_stats_service().get_stats()['by_site']
         
         # 방문자 통계
-        total_visitors = db.session.query(db.func.sum(SiteVisit.visit_count)).scalar() or 0
-        today = datetime.utcnow().date()
-        today_visit = SiteVisit.query.filter_by(visit_date=today).first()
-        today_visitors = today_visit.visit_count if today_visit else 0
+        total_visitors, today_visitors = get_visit_counter().get_counts()
         
         # 정적 HTML 생성
         html_content = generate_static_html(posts, site_stats, total_visitors, today_visitors)
@@ -1,70 +1,214 @@
-import schedule
-import time
 import threading
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.triggers.interval import IntervalTrigger
+from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED
 from app.crawlers.crawler_manager import CrawlerManager
+from app.models import ScheduledJobState, db
+from config import Config
+
+SITE_JOB_PREFIX = 'crawl_'
+
+def run_site_crawl(site_name):
+    """사이트별 크롤링 작업 (잡 저장소에는 이 함수의 경로가 저장됨)"""
+    return get_scheduler().run_crawling(site_name)
+
+def _to_utc_naive(value):
+    """APScheduler의 시간대 포함 시각을 DB 저장용 UTC 시각으로 변환"""
+    if value is None:
+        return None
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
 
 class Scheduler:
-    """크롤링 스케줄러"""
+    """크롤링 스케줄러 (APScheduler + DB 잡 저장소)
+    
+    사이트마다 별도 작업을 두고, 같은 작업은 겹쳐 실행하지 않으며(max_instances=1)
+    밀린 실행은 한 번으로 합친다(coalesce). 작업별 마지막/다음 실행 시각은 ScheduledJobState에 기록한다.
+    사이트별 주기는 크롤링마다 나온 새/변경 게시물 수에 따라 설정 범위 안에서 조정된다.
+    """
     
     def __init__(self):
         self.crawler_manager = CrawlerManager()
+        self.app = None
+        self.scheduler = None
         self.running = False
-        self.thread = None
     
-    def start_scheduler(self):
+    def start_scheduler(self, app):
         """스케줄러 시작"""
         if self.running:
             return
         
-        # 매 시간마다 크롤링 실행
-        schedule.every().hour.do(self.run_crawling)
+        self.app = app
+        with app.app_context():
+            engine = db.engine
         
-        # 매일 오전 9시에 전체 크롤링
-        schedule.every().day.at("09:00").do(self.run_full_crawling)
+        self.scheduler = BackgroundScheduler(
+            jobstores={'default': SQLAlchemyJobStore(engine=engine, tablename=Config.SCHEDULER_JOB_TABLE)},
+            executors={'default': ThreadPoolExecutor(Config.CRAWL_MAX_WORKERS)},
+            job_defaults={
+                'coalesce': True,                                    # 밀린 실행은 한 번만
+                'max_instances': 1,                                  # 같은 작업 중복 실행 금지
+                'misfire_grace_time': Config.SCHEDULER_MISFIRE_GRACE  # 이 시간 안에 늦은 실행은 허용
+            }
+        )
+        self.scheduler.add_listener(self._on_job_event, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED)
         
-        self.running = True
-        self.thread = threading.Thread(target=self._run_schedule, daemon=True)
-        self.thread.start()
+        # 잡 저장소를 읽은 뒤 작업을 맞추고 실행 시작
+        self.scheduler.start(paused=True)
+        self._sync_jobs()
+        self.scheduler.resume()
+        self._record_next_runs()
         
+        self.running = True
         print("크롤링 스케줄러가 시작되었습니다.")
     
     def stop_scheduler(self):
         """스케줄러 중지"""
+        if self.scheduler is not None and self.running:
+            self.scheduler.shutdown(wait=False)
         self.running = False
-        schedule.clear()
         print("크롤링 스케줄러가 중지되었습니다.")
     
-    def _run_schedule(self):
-        """스케줄 실행 루프"""
-        while self.running:
-            schedule.run_pending()
-            time.sleep(60)  # 1분마다 스케줄 체크
+    def _sync_jobs(self):
+        """설정에 맞게 작업 추가/변경/삭제 (저장된 다음 실행 시각과 적응형 주기는 유지)"""
+        site_names = [site_name for site_name in self.crawler_manager.crawlers
+                      if Config.SUPPORTED_SITES.get(site_name, {}).get('enabled', True)]
+        job_ids = {f"{SITE_JOB_PREFIX}{site_name}" for site_name in site_names}
+        now = datetime.now(timezone.utc)
+        
+        # 비활성화되었거나 없어진 사이트 작업과 예전 전체 크롤링 작업 삭제
+        for job in self.scheduler.get_jobs():
+            if job.id not in job_ids:
+                self.scheduler.remove_job(job.id)
+        
+        # 새 작업은 한 주기 뒤부터 실행하고, 사이트마다 시작 시각을 조금씩 어긋나게 해 한꺼번에 몰리지 않게 함
+        with self.app.app_context():
+            for index, site_name in enumerate(site_names):
+                job_id = f"{SITE_JOB_PREFIX}{site_name}"
+                interval = timedelta(seconds=self._stored_interval(site_name))
+                job = self.scheduler.get_job(job_id)
+                if job is None:
+                    start_date = now + interval + timedelta(seconds=index * Config.SCHEDULER_SITE_STAGGER)
+                    self.scheduler.add_job(run_site_crawl, IntervalTrigger(seconds=interval.total_seconds(), start_date=start_date),
+                                           args=[site_name], id=job_id, name=f"{site_name} 크롤링")
+                elif getattr(job.trigger, 'interval', None) != interval:
+                    self.scheduler.reschedule_job(job_id, trigger=IntervalTrigger(seconds=interval.total_seconds()))
+    
+    def _interval_bounds(self, site_name):
+        """사이트의 (최소, 최대) 크롤링 주기 (초)"""
+        bounds = Config.CRAWL_INTERVAL_BOUNDS.get(site_name, Config.CRAWL_INTERVAL_BOUNDS['default'])
+        return bounds['min'], bounds['max']
     
-    def run_crawling(self):
-        """일반 크롤링 실행"""
+    def _stored_interval(self, site_name):
+        """저장된 적응형 주기 (없으면 기본 주기), 현재 설정 범위로 보정 (앱 컨텍스트 필요)"""
+        state = db.session.get(ScheduledJobState, f"{SITE_JOB_PREFIX}{site_name}")
+        interval = state.interval_seconds if state and state.interval_seconds else Config.CRAWL_INTERVAL_HOURS * 3600
+        if not Config.CRAWL_ADAPTIVE:
+            return int(Config.CRAWL_INTERVAL_HOURS * 3600)
+        min_interval, max_interval = self._interval_bounds(site_name)
+        return int(min(max_interval, max(min_interval, interval)))
+    
+    def _adapt_interval(self, site_name, report):
+        """이번 크롤링 결과(report)의 새/변경 게시물 수로 다음 주기 조정 (앱 컨텍스트 필요)
+        
+        기대치(CRAWL_TARGET_YIELD)보다 많이 나오면 최대 절반까지 줄이고,
+        적게 나오거나 목록이 그대로면 최대 두 배까지 늘린다.
+        """
+        if not report or report['status'] not in ('success', 'unchanged'):
+            return
+        
+        score = report.get('new_posts', 0) + report.get('changed_posts', 0) * Config.CRAWL_CHANGED_WEIGHT
+        factor = min(2.0, max(0.5, Config.CRAWL_TARGET_YIELD / max(score, 0.5)))
+        
+        current = self._stored_interval(site_name)
+        min_interval, max_interval = self._interval_bounds(site_name)
+        interval = int(min(max_interval, max(min_interval, current * factor)))
+        
+        job_id = f"{SITE_JOB_PREFIX}{site_name}"
+        state = self._get_state(job_id)
+        state.interval_seconds = interval
+        db.session.commit()
+        
+        # 10% 미만의 변화는 무시해 매번 재예약하지 않음
+        if abs(interval - current) >= current * 0.1 and self.scheduler.get_job(job_id):
+            self.scheduler.reschedule_job(job_id, trigger=IntervalTrigger(seconds=interval))
+            print(f"{site_name} 크롤링 주기 조정: {current // 60}분 -> {interval // 60}분 (점수 {score:.1f})")
+    
+    def _on_job_event(self, event):
+        """작업 실행 결과와 다음 실행 시각 기록"""
+        if event.code == EVENT_JOB_EXECUTED:
+            status, result, error = 'success', event.retval, None
+        elif event.code == EVENT_JOB_ERROR:
+            status, result, error = 'error', None, str(event.exception)
+        else:
+            status, result, error = 'missed', None, None
+        
         try:
-            print(f"[{datetime.now()}] 크롤링 시작...")
-            result = self.crawler_manager.crawl_all_sites()
-            print(f"[{datetime.now()}] 크롤링 완료: {result}개 게시물")
+            with self.app.app_context():
+                state = self._get_state(event.job_id)
+                state.last_run_at = datetime.utcnow()
+                state.last_scheduled_at = _to_utc_naive(event.scheduled_run_time)
+                state.last_status = status
+                state.last_result = result if isinstance(result, int) else None
+                state.last_error = error
+                job = self.scheduler.get_job(event.job_id)
+                state.next_run_at = _to_utc_naive(job.next_run_time) if job else None
+                db.session.commit()
         except Exception as e:
-            print(f"[{datetime.now()}] 크롤링 오류: {e}")
+            print(f"작업 상태 기록 오류 ({event.job_id}): {e}")
     
-    def run_full_crawling(self):
-        """전체 크롤링 실행"""
+    def _record_next_runs(self):
+        """시작 시 모든 작업의 다음 실행 시각 기록"""
         try:
-            print(f"[{datetime.now()}] 전체 크롤링 시작...")
-            result = self.crawler_manager.crawl_all_sites()
-            print(f"[{datetime.now()}] 전체 크롤링 완료: {result}개 게시물")
+            with self.app.app_context():
+                for job in self.scheduler.get_jobs():
+                    self._get_state(job.id).next_run_at = _to_utc_naive(job.next_run_time)
+                db.session.commit()
         except Exception as e:
-            print(f"[{datetime.now()}] 전체 크롤링 오류: {e}")
+            print(f"작업 상태 기록 오류: {e}")
+    
+    def _get_state(self, job_id):
+        """작업 상태 행 반환 (없으면 생성)"""
+        state = db.session.get(ScheduledJobState, job_id)
+        if state is None:
+            state = ScheduledJobState(job_id=job_id)
+            db.session.add(state)
+        return state
+    
+    def get_job_states(self):
+        """작업별 마지막/다음 실행 정보"""
+        return {state.job_id: state.to_dict() for state in ScheduledJobState.query.all()}
+    
+    def run_crawling(self, site_name=None):
+        """일반 크롤링 실행 (site_name이 없으면 전체)"""
+        target = site_name or '전체'
+        with self.app.app_context():
+            try:
+                print(f"[{datetime.now()}] {target} 크롤링 시작...")
+                if site_name:
+                    # 다른 크롤링이 last_crawl_report를 바꿀 수 있으므로 이번 실행의 결과를 직접 받음
+                    report = self.crawler_manager.crawl_site_with_report(site_name)
+                    result = report['new_posts']
+                    if Config.CRAWL_ADAPTIVE:
+                        self._adapt_interval(site_name, report)
+                else:
+                    result = self.crawler_manager.crawl_all_sites()
+                print(f"[{datetime.now()}] {target} 크롤링 완료: {result}개 게시물")
+                return result
+            except Exception as e:
+                print(f"[{datetime.now()}] {target} 크롤링 오류: {e}")
+                raise
 
 # 전역 스케줄러 인스턴스
 scheduler_instance = None
+_instance_lock = threading.Lock()
 
 def get_scheduler():
     """스케줄러 인스턴스 반환"""
     global scheduler_instance
-    if scheduler_instance is None:
-        scheduler_instance = Scheduler()
-    return scheduler_instance
\ No newline at end of file
+    with _instance_lock:
+        if scheduler_instance is None:
+            scheduler_instance = Scheduler()
+    return scheduler_instance
@@ -4,6 +4,9 @@ class CommunityAggregator {
         this.filteredPosts = [];
         this.currentPage = 1;
         this.postsPerPage = 20;
+        this.fetchSize = 50;        // 서버에서 한 번에 받아오는 게시물 수
+        this.nextCursor = null;     // 서버 다음 페이지 커서 (없으면 마지막 페이지)
+        this.isFetchingMore = false;
         this.currentFilters = {
             site: 'all',
             sort: 'latest',
@@ -57,16 +60,28 @@ class CommunityAggregator {
                 this.applyFilters();
             }
         });
+        
+        // 스크롤로 더 보기 버튼이 보이면 자동으로 다음 게시물 로드
+        if ('IntersectionObserver' in window) {
+            const observer = new IntersectionObserver((entries) => {
+                if (entries.some(entry => entry.isIntersecting)) {
+                    this.loadMorePosts();
+                }
+            }, { rootMargin: '200px' });
+            observer.observe(document.getElementById('loadMoreBtn'));
+        }
     }
     
     async loadPosts() {
         try {
             this.showLoading(true);
             
-            const response = await fetch('/api/posts?limit=100');
+            // 빈 cursor로 첫 페이지 요청 (응답에 다음 페이지 커서 포함)
+            const response = await fetch(`/api/posts?limit=${this.fetchSize}&cursor=`);
             const data = await response.json();
             
             this.posts = data.posts;
+            this.nextCursor = data.next_cursor;
             this.applyFilters();
             this.updateLastUpdate();
             
@@ -78,6 +93,30 @@ class CommunityAggregator {
         }
     }
     
+    async fetchNextPage() {
+        // 커서로 다음 페이지를 받아 기존 목록 뒤에 추가
+        if (!this.nextCursor || this.isFetchingMore) {
+            return;
+        }
+        
+        try {
+            this.isFetchingMore = true;
+            
+            const cursor = encodeURIComponent(this.nextCursor);
+            const response = await fetch(`/api/posts?limit=${this.fetchSize}&cursor=${cursor}`);
+            const data = await response.json();
+            
+            this.posts = this.posts.concat(data.posts);
+            this.nextCursor = data.next_cursor;
+            this.applyFilters(true);
+            
+        } catch (error) {
+            console.error('게시물 추가 로딩 오류:', error);
+        } finally {
+            this.isFetchingMore = false;
+        }
+    }
+    
     async loadStats() {
         try {
             const response = await fetch('/api/stats');
@@ -91,31 +130,63 @@ class CommunityAggregator {
     }
     
     async refreshData() {
+        const refreshBtn = document.getElementById('refreshBtn');
+        if (refreshBtn.disabled) {
+            return;
+        }
+        
         try {
-            this.showLoading(true);
+            refreshBtn.disabled = true;
             
-            // 수동 크롤링 실행
-            const crawlResponse = await fetch('/api/crawl');
+            // 수동 크롤링 작업 등록 (백그라운드에서 실행)
+            const crawlResponse = await fetch('/api/crawl', { method: 'POST' });
             const crawlData = await crawlResponse.json();
             
-            if (crawlData.success) {
+            if (!crawlData.success) {
+                this.showError(crawlData.message);
+                return;
+            }
+            
+            // 작업이 끝날 때까지 상태를 주기적으로 확인
+            const job = await this.waitForCrawlJob(crawlData.job_id, refreshBtn);
+            
+            if (job.status === 'done') {
                 // 새로운 데이터 로드
                 await this.loadPosts();
                 await this.loadStats();
-                this.showSuccess(crawlData.message);
+                this.showSuccess(`${job.new_posts} 개의 게시물을 수집했습니다.`);
             } else {
-                this.showError(crawlData.message);
+                this.showError(job.error || job.message || '크롤링 중 오류가 발생했습니다.');
             }
             
         } catch (error) {
             console.error('데이터 새로고침 오류:', error);
             this.showError('데이터 새로고침에 실패했습니다.');
         } finally {
-            this.showLoading(false);
+            refreshBtn.disabled = false;
+            refreshBtn.innerHTML = '<i class="fas fa-sync-alt"></i> 새로고침';
+        }
+    }
+    
+    async waitForCrawlJob(jobId, refreshBtn) {
+        while (true) {
+            const response = await fetch(`/api/crawl/${jobId}`);
+            const job = await response.json();
+            
+            if (!job.success || job.status === 'done' || job.status === 'error') {
+                return job;
+            }
+            
+            // 버튼에 완료된 사이트 수 표시
+            const sites = Object.values(job.sites || {});
+            const finished = sites.filter(site => site.status !== 'running' && site.status !== 'pending').length;
+            refreshBtn.innerHTML = `<i class="fas fa-sync-alt fa-spin"></i> 수집 중 (${finished}/${sites.length})`;
+            
+            await new Promise(resolve => setTimeout(resolve, 2000));
         }
     }
     
-    applyFilters() {
+    applyFilters(keepPage = false) {
         let filtered = [...this.posts];
         
         // 사이트 필터
@@ -135,11 +206,14 @@ class CommunityAggregator {
         this.sortPosts(filtered);
         
         this.filteredPosts = filtered;
-        this.currentPage = 1;
+        if (!keepPage) {
+            this.currentPage = 1;
+        }
         this.renderPosts();
     }
     
     sortPosts(posts) {
+        // 지금까지 받은 페이지 안에서만 정렬 (서버 페이지는 사이트 우선순위 순이므로 더 보기 후 순서가 바뀔 수 있음)
         switch (this.currentFilters.sort) {
             case 'views':
                 posts.sort((a, b) => (b.views || 0) - (a.views || 0));
@@ -163,7 +237,11 @@ class CommunityAggregator {
         
         if (postsToShow.length === 0) {
             container.innerHTML = '<div class="no-posts">검색 결과가 없습니다.</div>';
-            this.hideLoadMoreButton();
+            if (this.nextCursor) {
+                this.showLoadMoreButton();
+            } else {
+                this.hideLoadMoreButton();
+            }
             return;
         }
         
@@ -171,8 +249,8 @@ class CommunityAggregator {
             container.appendChild(this.createPostCard(post));
         });
         
-        // 더 보기 버튼 표시/숨김
-        if (endIndex < this.filteredPosts.length) {
+        // 더 보기 버튼 표시/숨김 (서버에 남은 페이지가 있어도 표시)
+        if (endIndex < this.filteredPosts.length || this.nextCursor) {
             this.showLoadMoreButton();
         } else {
             this.hideLoadMoreButton();
@@ -215,7 +293,16 @@ class CommunityAggregator {
     }
     
     loadMorePosts() {
+        if (this.isFetchingMore) {
+            return;
+        }
+        
+        // 받아 둔 게시물이 모자라면 서버에서 다음 페이지를 받은 뒤 렌더링
         this.currentPage++;
+        if (this.currentPage * this.postsPerPage > this.filteredPosts.length && this.nextCursor) {
+            this.fetchNextPage();
+            return;
+        }
         this.renderPosts();
     }
     
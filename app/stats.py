@@ -0,0 +1,63 @@
+"""게시물 통계 서비스 - 한 번의 GROUP BY 쿼리로 집계하고 데이터 버전(DataVersion)이 바뀔 때까지 캐시"""
+
+import copy
+import threading
+from typing import Dict
+
+from app.data_version import get_data_version
+from app.models import Post, db
+from config import Config
+
+
+class StatsService:
+    """전체/사이트별/카테고리별 게시물 수 집계"""
+
+    def __init__(self):
+        self._cache = None
+        self._cache_version = None
+        self._lock = threading.Lock()
+
+    def get_stats(self) -> Dict:
+        """통계 반환 (모든 워커가 공유하는 데이터 버전이 바뀌었을 때만 DB 집계)"""
+        version = get_data_version().current()
+        with self._lock:
+            if self._cache is None or self._cache_version != version:
+                self._cache = self._compute()
+                self._cache_version = version
+            return copy.deepcopy(self._cache)
+
+    def _compute(self) -> Dict:
+        """(사이트, 카테고리)별 개수를 한 번에 조회해 합산"""
+        rows = db.session.query(Post.site, Post.category, db.func.count(Post.id)) \
+            .group_by(Post.site, Post.category) \
+            .all()
+
+        by_category = {category_key: 0 for category_key in Config.CATEGORIES}
+        by_site = {site_key: 0 for site_key in Config.SUPPORTED_SITES}
+        total_posts = 0
+
+        for site, category, count in rows:
+            total_posts += count
+            if category in by_category:
+                by_category[category] += count
+            if site in by_site:
+                by_site[site] += count
+
+        return {
+            'total_posts': total_posts,
+            'by_category': by_category,
+            'by_site': by_site
+        }
+
+
+# 전역 통계 서비스 인스턴스
+stats_service_instance = None
+_instance_lock = threading.Lock()
+
+def get_stats_service() -> StatsService:
+    """통계 서비스 인스턴스 반환"""
+    global stats_service_instance
+    with _instance_lock:
+        if stats_service_instance is None:
+            stats_service_instance = StatsService()
+    return stats_service_instance
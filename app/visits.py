@@ -0,0 +1,132 @@
+"""방문자 수 카운터 - 요청마다 메모리에서만 증가시키고 주기적으로 SiteVisit에 일괄 반영"""
+
+import atexit
+import threading
+from collections import defaultdict
+from datetime import datetime
+from typing import Tuple
+
+from app.models import SiteVisit, db
+from config import Config
+
+
+class VisitCounter:
+    """날짜별 미반영 방문 수와 누적 방문자 수(총합/오늘)를 메모리에 보관"""
+
+    def __init__(self, flush_interval: int = None):
+        self.flush_interval = flush_interval or Config.VISIT_FLUSH_INTERVAL
+        self._pending = defaultdict(int)   # 날짜 -> 아직 DB에 쓰지 않은 방문 수
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stored_total = None          # DB에 반영된 총 방문자 수
+        self._stored_today = (None, 0)     # (날짜, DB에 반영된 그날 방문자 수)
+        self._stop_event = threading.Event()
+        self.app = None
+        self.thread = None
+
+    def record(self):
+        """방문 1회 기록 (DB 접근 없음)"""
+        today = datetime.utcnow().date()
+        with self._lock:
+            self._pending[today] += 1
+
+    def get_counts(self) -> Tuple[int, int]:
+        """(총 방문자 수, 오늘 방문자 수) - 최초 한 번만 DB에서 읽고 이후엔 메모리 값 사용"""
+        today = datetime.utcnow().date()
+        self._load(today)
+
+        with self._lock:
+            pending_total = sum(self._pending.values())
+            stored_date, stored_today = self._stored_today
+            today_count = (stored_today if stored_date == today else 0) + self._pending.get(today, 0)
+            return self._stored_total + pending_total, today_count
+
+    def _load(self, today):
+        """DB에 반영된 총합과 오늘 방문자 수 읽기 (앱 컨텍스트 필요)"""
+        with self._lock:
+            loaded = self._stored_total is not None and self._stored_today[0] == today
+        if loaded:
+            return
+
+        # 반영 중에 읽으면 같은 방문이 두 번 더해지므로 반영과 겹치지 않게 함
+        with self._flush_lock:
+            total = db.session.query(db.func.sum(SiteVisit.visit_count)).scalar() or 0
+            visit = SiteVisit.query.filter_by(visit_date=today).first()
+            with self._lock:
+                self._stored_total = total
+                self._stored_today = (today, visit.visit_count if visit else 0)
+
+    def flush(self) -> int:
+        """미반영 방문 수를 한 트랜잭션으로 SiteVisit에 반영 (앱 컨텍스트 필요)"""
+        with self._flush_lock:
+            with self._lock:
+                pending = dict(self._pending)
+                self._pending.clear()
+            if not pending:
+                return 0
+
+            try:
+                for visit_date, count in pending.items():
+                    # 여러 워커가 동시에 반영해도 합이 유지되도록 DB에서 직접 더함 (행이 없을 때만 추가)
+                    updated = db.session.execute(
+                        db.update(SiteVisit)
+                        .where(SiteVisit.visit_date == visit_date)
+                        .values(visit_count=SiteVisit.visit_count + count)
+                    ).rowcount
+                    if not updated:
+                        db.session.add(SiteVisit(visit_date=visit_date, visit_count=count))
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                # 실패한 방문 수는 다음 반영 때 다시 시도
+                with self._lock:
+                    for visit_date, count in pending.items():
+                        self._pending[visit_date] += count
+                print(f"방문자 수 저장 오류: {e}")
+                return 0
+
+            flushed = sum(pending.values())
+            with self._lock:
+                if self._stored_total is not None:
+                    self._stored_total += flushed
+                stored_date, stored_today = self._stored_today
+                if stored_date in pending:
+                    self._stored_today = (stored_date, stored_today + pending[stored_date])
+            return flushed
+
+    def start(self, app):
+        """주기적 반영 스레드 시작 (프로세스 종료 시에도 한 번 반영)"""
+        if self.thread is not None:
+            return
+
+        self.app = app
+        self._stop_event.clear()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        """반영 스레드 중지 후 남은 방문 수 반영"""
+        self._stop_event.set()
+        if self.app is not None:
+            with self.app.app_context():
+                self.flush()
+
+    def _run(self):
+        """flush_interval초마다 반영"""
+        while not self._stop_event.wait(self.flush_interval):
+            with self.app.app_context():
+                self.flush()
+
+
+# 전역 방문자 카운터 인스턴스
+visit_counter_instance = None
+_instance_lock = threading.Lock()
+
+def get_visit_counter() -> VisitCounter:
+    """방문자 카운터 인스턴스 반환"""
+    global visit_counter_instance
+    with _instance_lock:
+        if visit_counter_instance is None:
+            visit_counter_instance = VisitCounter()
+    return visit_counter_instance
@@ -8,18 +8,112 @@ Playwright를 사용하여 각 사이트별 상위 2개 게시물을 모바일 
 import sys
 import os
 import asyncio
+import hashlib
+import io
+import json
 from datetime import datetime
 from pathlib import Path
 from playwright.async_api import async_playwright
 import time
 
+try:
+    from PIL import Image
+except ImportError:  # 선택 의존성 - 없으면 구간별 스크롤 캡처 사용
+    Image = None
+
 # 앱 모듈을 위한 path 추가
 sys.path.append('.')
 from app import create_app
 from app.models import Post
+from app.crawlers.resource_blocking import install_resource_blocking_async
+from capture_prep import apply_prep_profile, font_allow_hosts, get_profile
+from config import Config
+
+def post_fingerprint(post) -> str:
+    """캡처 내용이 바뀌었는지 판단하는 게시물 지문 (제목과 댓글 수)"""
+    return hashlib.sha1(f"{post.title}\n{post.comments or 0}".encode('utf-8')).hexdigest()
+
+
+def crop_parts_from_chunks(chunks, parts, scale: float):
+    """덩어리 스크린샷에서 구간 이미지를 잘라 PNG로 저장하고 파일 경로 목록 반환 (별도 스레드에서 실행)
+
+    chunks: [(CSS 시작 위치, CSS 높이, PNG 바이트)], parts: [(CSS 시작, CSS 끝, 저장 경로)]
+    전체 페이지를 한 장으로 합치지 않고, 현재 구간에 걸친 덩어리(많아야 두 개)만 디코딩해 둔다.
+    """
+    decoded = {}
+    saved = []
+    try:
+        for top, bottom, filepath in parts:
+            part_top, part_bottom = round(top * scale), round(bottom * scale)
+            needed = [index for index, (chunk_top, chunk_height, _) in enumerate(chunks)
+                      if chunk_top < bottom and chunk_top + chunk_height > top]
+            
+            for index in [index for index in decoded if index not in needed]:
+                decoded.pop(index).close()
+            for index in needed:
+                if index not in decoded:
+                    decoded[index] = Image.open(io.BytesIO(chunks[index][2]))
+            
+            width = decoded[needed[0]].width
+            part = Image.new('RGB', (width, part_bottom - part_top))
+            for index in needed:
+                chunk = decoded[index]
+                chunk_top = round(chunks[index][0] * scale)
+                start = max(part_top, chunk_top)
+                end = min(part_bottom, chunk_top + chunk.height)
+                if end > start:
+                    part.paste(chunk.crop((0, start - chunk_top, width, end - chunk_top)), (0, start - part_top))
+            
+            part.save(filepath, format='PNG')
+            part.close()
+            saved.append(filepath)
+    finally:
+        for chunk in decoded.values():
+            chunk.close()
+    return saved
+
+
+class CaptureIndex:
+    """이미 캡처한 게시물을 URL별로 기록하는 색인 (지문, 캡처 시각, 파일 목록)"""
+    
+    def __init__(self, path: str = None):
+        self.path = Path(path or Config.CAPTURE_INDEX_FILE)
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+    
+    def is_captured(self, post) -> bool:
+        """같은 내용으로 캡처한 파일이 아직 남아 있으면 True"""
+        entry = self.entries.get(post.url)
+        if not entry or entry['fingerprint'] != post_fingerprint(post):
+            return False
+        return all(Path(filepath).exists() for filepath in entry['files'])
+    
+    def record(self, post, files):
+        """캡처 결과 기록 (save()를 호출해야 파일에 반영)"""
+        self.entries[post.url] = {
+            'fingerprint': post_fingerprint(post),
+            'site': post.site,
+            'post_id': post.id,
+            'captured_at': datetime.now().isoformat(timespec='seconds'),
+            'files': [os.path.abspath(filepath) for filepath in files]
+        }
+    
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
 
 class CommunityScreenshotCapture:
-    def __init__(self):
+    def __init__(self, force: bool = False):
+        # force: 이미 캡처한 게시물도 다시 캡처
+        self.force = force
+        self.capture_index = CaptureIndex()
         self.base_dir = Path("capture")
         self.today = datetime.now().strftime("%Y-%m-%d")
         # 날짜별 기본 디렉토리 (사이트별 하위 폴더는 나중에 생성)
@@ -54,34 +148,12 @@ class CommunityScreenshotCapture:
                 'scroll_delay': 1  # 1초
             }
         }
+
     
     async def apply_nickname_blur(self, page, site):
         """댓글 닉네임에 모자이크(블러) 처리 적용"""
         try:
-            # 사이트별 닉네임 셀렉터 (더 많은 셀렉터 추가)
-            nickname_selectors = {
-                'bobae': [
-                    'span.data4', '.data4'
-                ],
-                'ruliweb': [
-                    '.nick', 'strong.nick', 'span.p_nick'
-                ],
-                'fmkorea': [
-                    '.nick', '.nickname', '.username', '.user_name',
-                    '.member', '.writer', '.author_nick', '.author',
-                    'span.nickname', 'span.member', '.member_nick',
-                    '.xe_content .nick', 'strong.nick', 'b.nick',
-                    '.comment_nick', '.reply_nick'
-                ],
-                'dcinside': [
-                    '.nick', 'a.nick'
-                ],
-                'ppomppu': [
-                    'span.com_name_writer'
-                ]
-            }
-            
-            selectors = nickname_selectors.get(site, ['.nick', '.nickname', '.writer'])
+            selectors = get_profile(site)['blur_selectors']
             
             # JavaScript로 모자이크 처리
             await page.evaluate(f"""
@@ -141,9 +213,15 @@ class CommunityScreenshotCapture:
                 }
             )
             
+            # 동영상, 외부 폰트, 광고/분석 요청 차단 (본문 이미지와 스타일은 유지, 번들 폰트가 없으면 Google Fonts 허용)
+            blocker = await install_resource_blocking_async(context, 'capture', font_allow_hosts())
+            
+            # 폰트/닉네임 블러/팝업 제거를 문서 시작 시점에 한 번에 적용 (사이트 준비 프로필)
+            await apply_prep_profile(context, post.site)
+            
             page = await context.new_page()
             
-            print(f"  🎭 닉네임 모자이크: 기본 셀렉터 사용")
+            print(f"  🎭 닉네임 모자이크: 준비 프로필 스타일 적용")
             
             print(f"  🌐 페이지 이동 중: {post.url}")
             
@@ -166,122 +244,32 @@ class CommunityScreenshotCapture:
             if post.site == 'ppomppu':
                 await self.handle_ppomppu_mobile_popup(page)
             
-            # 페이지 인코딩 및 폰트 강제 설정
-            await page.evaluate("""
-                // 페이지 인코딩 UTF-8로 강제 설정
-                if (document.querySelector('meta[charset]')) {
-                    document.querySelector('meta[charset]').setAttribute('charset', 'UTF-8');
-                } else {
-                    var meta = document.createElement('meta');
-                    meta.setAttribute('charset', 'UTF-8');
-                    document.head.appendChild(meta);
-                }
-                
-                // 웹폰트 로드
-                const link = document.createElement('link');
-                link.href = 'https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;500;700&display=swap';
-                link.rel = 'stylesheet';
-                document.head.appendChild(link);
-                
-                // 폰트 강제 적용
-                const applyFont = () => {
-                    const elements = document.querySelectorAll('*');
-                    elements.forEach(el => {
-                        if (el.style) {
-                            el.style.fontFamily = 'Noto Sans KR, Malgun Gothic, 맑은 고딕, Apple SD Gothic Neo, sans-serif';
-                        }
-                    });
-                };
-                
-                // 즉시 적용
-                applyFont();
-                
-                // 폰트 로드 후 다시 적용
-                setTimeout(applyFont, 2000);
-            """)
-            
-            # 추가 로딩 대기
-            await asyncio.sleep(2)
-            
-            # 주요 요소 로딩 대기 (선택적)
+            # 본문 요소 중 하나라도 나타나면 바로 진행 (고정 대기 없음)
             print(f"  🔍 요소 대기 중: {site_config['wait_selectors']}")
-            element_found = False
-            for selector in site_config['wait_selectors']:
-                try:
-                    await page.wait_for_selector(selector, timeout=5000)
-                    print(f"    ✅ 요소 발견: {selector}")
-                    element_found = True
-                    break  # 하나라도 찾으면 충분
-                except Exception as e:
-                    print(f"    ⚠️ 요소 없음: {selector}")
-                    continue
-            
-            if not element_found:
+            try:
+                await page.wait_for_selector(', '.join(site_config['wait_selectors']), timeout=10000)
+                print(f"    ✅ 본문 요소 발견")
+            except Exception:
                 print(f"    ℹ️ 주요 요소 없지만 계속 진행: {post.site}")
             
-            # 디시인사이드 팝업 닫기
+            # 디시인사이드 이미지 순서 안내 팝업은 준비 프로필이 제거, 남아 있으면 닫기 버튼 클릭
             if post.site == 'dcinside':
-                print(f"  🔘 디시인사이드 팝업 닫기...")
                 try:
-                    # 페이지 로딩 대기
-                    await asyncio.sleep(1)
-                    
-                    # 특정 텍스트가 있는 p 태그 클릭
-                    try:
-                        # 해당 텍스트를 포함한 p.txt 요소 찾아서 클릭
-                        popup_element = await page.wait_for_selector('p.txt', timeout=3000)
-                        if popup_element:
-                            text_content = await popup_element.text_content()
-                            if '전체 서비스 설정에서 이미지 순서를' in text_content:
-                                print(f"  🎯 팝업 텍스트 발견, 클릭 시도...")
-                                await popup_element.click()
-                                await asyncio.sleep(0.5)
-                                print(f"  ✅ 팝업 텍스트 클릭 완료")
-                            else:
-                                print(f"  ℹ️ 다른 텍스트 발견: {text_content[:50]}...")
-                    except Exception as click_error:
-                        print(f"  ⚠️ 텍스트 클릭 실패, 대체 방법 시도: {click_error}")
-                        
-                        # 대체 방법: JavaScript로 팝업 제거
-                        await page.evaluate("""
-                            // 팝업, 알림, 공지 등 제거
-                            const popupSelectors = [
-                                '.layer', '.popup', '.alert', '.notice',
-                                '[class*="popup"]', '[class*="layer"]', '[class*="modal"]',
-                                'div[style*="position: fixed"]', 'div[style*="z-index"]'
-                            ];
-                            
-                            popupSelectors.forEach(selector => {
-                                document.querySelectorAll(selector).forEach(el => {
-                                    const text = el.textContent;
-                                    if (text && text.includes('이미지 순서')) {
-                                        el.remove();
-                                    }
-                                });
-                            });
-                        """)
-                    
-                    # ESC 키로 닫기 시도 (추가 안전장치)
-                    await page.keyboard.press('Escape')
-                    await asyncio.sleep(0.5)
-                    
-                    print(f"  ✅ 팝업 처리 완료")
+                    popup_element = await page.query_selector('p.txt:has-text("전체 서비스 설정에서 이미지 순서를")')
+                    if popup_element:
+                        await popup_element.click()
+                        print(f"  ✅ 디시인사이드 팝업 텍스트 클릭 완료")
                 except Exception as e:
                     print(f"  ⚠️ 팝업 닫기 실패: {e}")
             
-            # 한글 폰트 강제 적용을 위한 CSS 주입
-            await page.add_style_tag(content="""
-                @import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;500;700&display=swap');
-                * {
-                    font-family: 'Noto Sans KR', 'Malgun Gothic', sans-serif !important;
-                }
-            """)
-            
             # 댓글까지 스크롤하여 모든 컨텐츠 로드
             print(f"  📜 페이지 스크롤 시작: {post.site}")
             await self.scroll_to_load_content(page, site_config['scroll_delay'])
             print(f"  ✅ 스크롤 완료: {post.site}")
             
+            # 번들 폰트 로딩 완료 확인
+            await page.evaluate('document.fonts.ready.then(() => document.fonts.size)')
+            
             # 파일명 생성 (한글 인코딩 안전 처리)
             try:
                 # 한글을 영문으로 변환하거나 제거
@@ -313,11 +301,26 @@ class CommunityScreenshotCapture:
             
             # 갤럭시 S25 사이즈로 분할 캡처
             print(f"  📸 캡처 시작: {post.site}")
-            captured_files = await self.capture_in_segments(page, post, safe_title, post_dir)
+            if Config.CAPTURE_MODE == 'stitched':
+                captured_files = await self.capture_stitched(page, post, safe_title, post_dir)
+            else:
+                captured_files = await self.capture_in_segments(page, post, safe_title, post_dir)
             print(f"  ✅ 캡처 완료: {post.site} - {len(captured_files) if captured_files else 0}개 파일")
+            if blocker is not None:
+                print(f"  🚫 요청 차단: {blocker.summary()}")
             
             await context.close()
             return captured_files
+        
+        except asyncio.CancelledError:
+            # 제한 시간 초과로 취소되면 컨텍스트를 닫고 취소를 그대로 전달
+            print(f"⏱️ 캡처 중단 - {post.site} - {post.title[:30]}")
+            if 'context' in locals():
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+            raise
             
         except Exception as e:
             print(f"❌ 캡처 실패 - {post.site} - {post.title[:30]}")
@@ -333,6 +336,137 @@ class CommunityScreenshotCapture:
                     pass
             return None
     
+    async def capture_post_with_limits(self, browser, post, site_config, playwright_instance,
+                                       global_slots, site_slots, progress):
+        """전체/사이트별 동시 실행 수 안에서 제한 시간과 재시도를 적용해 게시물 하나 캡처"""
+        async with site_slots:
+            async with global_slots:
+                progress['started'] += 1
+                print(f"\n[{progress['started']}/{progress['total']}] {site_config['name']} 캡처 시작")
+                
+                post_files = None
+                for attempt in range(Config.CAPTURE_RETRIES + 1):
+                    if attempt:
+                        print(f"  🔁 {site_config['name']} 재시도 {attempt}/{Config.CAPTURE_RETRIES}: {post.title[:30]}")
+                    try:
+                        post_files = await asyncio.wait_for(
+                            self.capture_post(browser, post, site_config, playwright_instance),
+                            timeout=Config.CAPTURE_POST_TIMEOUT
+                        )
+                    except asyncio.TimeoutError:
+                        print(f"  ⏱️ {site_config['name']} 캡처 시간 초과 ({Config.CAPTURE_POST_TIMEOUT}초)")
+                        post_files = None
+                    except Exception as e:
+                        print(f"  ❌ {site_config['name']} 예외 발생: {str(e)}")
+                        post_files = None
+                    if post_files:
+                        break
+                
+                if post_files:
+                    print(f"  ✅ {site_config['name']} 성공: {len(post_files) if isinstance(post_files, list) else 1}개 파일 생성")
+                else:
+                    print(f"  ❌ {site_config['name']} 실패: 파일 생성되지 않음")
+            
+            # 사이트 부하 방지를 위한 딜레이 (사이트 슬롯을 잡은 채 대기)
+            await asyncio.sleep(Config.CAPTURE_SITE_DELAY)
+        
+        return post_files
+    
+    async def capture_stitched(self, page, post, safe_title, post_dir):
+        """페이지를 큰 덩어리로 나눠 찍은 뒤 덩어리에서 구간별 이미지를 잘라 저장 (기존 구간 캡처와 같은 구간 수와 크기)"""
+        if Image is None:
+            print("  ℹ️ Pillow가 없어 구간별 스크롤 캡처 사용")
+            return await self.capture_in_segments(page, post, safe_title, post_dir)
+        
+        try:
+            # 닉네임 블러는 준비 프로필(init script)의 스타일시트로 이미 적용됨
+            total_height = await page.evaluate('document.body.scrollHeight')
+            viewport = page.viewport_size
+            viewport_width, viewport_height = viewport['width'], viewport['height']
+            
+            # 기존 구간 캡처는 항상 뷰포트 높이로 찍었으므로 뷰포트보다 짧은 페이지도 뷰포트 높이까지 찍음
+            page_height = max(total_height, viewport_height)
+            
+            # 너무 긴 페이지는 한 장으로 렌더링되지 않으므로 일정 높이씩 나눠 찍음 (PNG 바이트로만 보관)
+            chunk_height = Config.CAPTURE_STITCH_CHUNK_HEIGHT
+            chunks = []
+            for top in range(0, page_height, chunk_height):
+                height = min(chunk_height, page_height - top)
+                png = await page.screenshot(
+                    full_page=True,
+                    type='png',
+                    scale='device',
+                    clip={'x': 0, 'y': top, 'width': viewport_width, 'height': height}
+                )
+                chunks.append((top, height, png))
+            
+            scale = await page.evaluate('window.devicePixelRatio')
+            
+            # 기존 구간 캡처와 같은 구간 계산 (850px 간격, 오버랩 0.5px, 스크롤이 끝에 닿으면 페이지 끝에 맞춤)
+            # 끝에 맞춰 앞 구간과 같아진 마지막 구간도 그대로 저장 - 같은 화면은 후처리(capture_processing)가 중복으로 제외
+            segment_step = 850
+            overlap = 0.5
+            effective_height = segment_step - overlap
+            segments = max(1, int((total_height + effective_height - 1) // effective_height))
+            max_scroll = page_height - viewport_height
+            
+            # 디시인사이드는 하단 136px 잘라서 캡처
+            shot_height = segment_step - 136 if post.site == 'dcinside' else viewport_height
+            
+            print(f"  📏 전체 높이: {total_height}px, {segments}개 구간으로 분할 (덩어리 {len(chunks)}개에서 자르기)")
+            
+            parts = []
+            for i in range(segments):
+                top = min(i * effective_height, max_scroll)
+                if segments == 1:
+                    filename = f"{post.site}_capture.png"
+                else:
+                    filename = f"{post.site}_part{i+1:02d}.png"
+                parts.append((top, top + shot_height, str(post_dir / filename)))
+            
+            # 디코딩/자르기/PNG 저장은 이벤트 루프를 막지 않도록 별도 스레드에서 처리
+            captured_files = await asyncio.get_running_loop().run_in_executor(
+                None, crop_parts_from_chunks, chunks, parts, scale
+            )
+            
+            print(f"  ✅ {segments}개 구간 저장 완료")
+            return captured_files
+            
+        except Exception as e:
+            print(f"  ⚠️ 한 번에 캡처 실패, 구간별 캡처로 전환: {e}")
+            return await self.capture_in_segments(page, post, safe_title, post_dir)
+    
+    async def postprocess_captures(self, posts, results):
+        """캡처된 게시물 폴더를 후처리하고 게시물별 압축 파일 목록 반환 (이벤트 루프를 막지 않도록 별도 스레드에서 대기)"""
+        from capture_processing import process_captures
+        
+        jobs = []
+        for post, post_files in zip(posts, results):
+            if not post_files:
+                continue
+            first_file = post_files[0] if isinstance(post_files, list) else post_files
+            jobs.append({
+                'post_dir': str(Path(first_file).parent),
+                'post': {'id': post.id, 'site': post.site, 'title': post.title, 'url': post.url}
+            })
+        
+        manifests = await asyncio.get_running_loop().run_in_executor(None, process_captures, jobs)
+        
+        processed = []
+        for post_files in results:
+            manifest = None
+            if post_files:
+                first_file = post_files[0] if isinstance(post_files, list) else post_files
+                manifest = manifests.get(str(Path(first_file).parent))
+            
+            if manifest is None:
+                # 캡처 실패는 그대로, 후처리에 실패한 게시물은 원본 PNG 유지
+                processed.append(post_files)
+            else:
+                post_dir = Path(first_file).parent
+                processed.append([str(post_dir / segment['file']) for segment in manifest['segments']])
+        return processed
+    
     async def capture_in_segments(self, page, post, safe_title, post_dir):
         """갤럭시 S25 사이즈에 맞게 페이지를 여러 구간으로 나누어 캡처 (오버랩 적용)"""
         try:
@@ -348,6 +482,7 @@ class CommunityScreenshotCapture:
             print(f"  📏 전체 높이: {total_height}px, {segments}개 구간으로 분할 (오버랩: {overlap}px)")
             
             captured_files = []
+            previous_scroll = None
             
             for i in range(segments):
                 # 스크롤 위치 계산 (오버랩 고려)
@@ -360,6 +495,13 @@ class CommunityScreenshotCapture:
                 await page.evaluate(f'window.scrollTo(0, {scroll_y})')
                 await asyncio.sleep(0.4)
                 
+                # 페이지 끝이라 더 내려가지 않으면 앞 구간과 같은 화면이므로 중단
+                actual_scroll = await page.evaluate('window.scrollY')
+                if previous_scroll is not None and actual_scroll <= previous_scroll:
+                    print(f"  ✂️ 페이지 끝에 도달 - 남은 구간 {segments - i}개 제외")
+                    break
+                previous_scroll = actual_scroll
+                
                 # 파일명 간소화 (폴더명에 이미 정보가 있으므로)
                 if segments == 1:
                     filename = f"{post.site}_capture.png"
@@ -411,7 +553,7 @@ class CommunityScreenshotCapture:
                     print(f"  ✅ 모바일 버튼 발견: '{text}'")
                     await element.click()
                     print("  🔘 모바일웹으로 보기 버튼 클릭 완료")
-                    await asyncio.sleep(1)
+                    await page.wait_for_load_state('domcontentloaded')
                     return  # 성공 시 바로 리턴
             except Exception as e:
                 print(f"  ⚠️ 모바일 버튼 클릭 실패: {e}")
@@ -423,8 +565,29 @@ class CommunityScreenshotCapture:
         except Exception as e:
             print(f"  ⚠️ 뽐뿌 팝업 처리 중 오류 (계속 진행): {e}")
     
+    async def wait_for_paint(self, page):
+        """스크롤 후 다음 화면이 그려질 때까지 대기 (최대 0.3초)"""
+        await page.evaluate("""
+            new Promise(resolve => {
+                requestAnimationFrame(() => requestAnimationFrame(resolve));
+                setTimeout(resolve, 300);
+            })
+        """)
+    
+    async def wait_for_images(self, page, timeout_ms):
+        """로딩 중인 이미지가 모두 끝날 때까지 대기 (최대 timeout_ms)"""
+        await page.evaluate("""
+            timeout => Promise.race([
+                Promise.all(Array.from(document.images).filter(img => !img.complete).map(img => new Promise(resolve => {
+                    img.addEventListener('load', resolve, {once: true});
+                    img.addEventListener('error', resolve, {once: true});
+                }))),
+                new Promise(resolve => setTimeout(resolve, timeout))
+            ])
+        """, timeout_ms)
+    
     async def scroll_to_load_content(self, page, delay=2):
-        """페이지를 스크롤하여 댓글 등 동적 컨텐츠 로드"""
+        """페이지를 스크롤하여 댓글 등 동적 컨텐츠 로드 (고정 대기 대신 렌더링/로딩 완료 확인, 최대 delay초)"""
         try:
             # 페이지 높이 확인
             page_height = await page.evaluate('document.body.scrollHeight')
@@ -435,15 +598,19 @@ class CommunityScreenshotCapture:
             while scroll_position < page_height:
                 scroll_position += viewport_height * 0.8
                 await page.evaluate(f'window.scrollTo(0, {scroll_position})')
-                await asyncio.sleep(0.3)  # 0.5초 → 0.3초
+                await self.wait_for_paint(page)
             
-            # 맨 아래까지 스크롤
+            # 맨 아래까지 스크롤 후 지연 로딩(댓글/이미지) 요청이 끝날 때까지 대기
             await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            await asyncio.sleep(delay)
+            try:
+                await page.wait_for_load_state('networkidle', timeout=delay * 1000)
+            except Exception:
+                pass
+            await self.wait_for_images(page, delay * 1000)
             
             # 다시 맨 위로 스크롤 (전체 캡처를 위해)
             await page.evaluate('window.scrollTo(0, 0)')
-            await asyncio.sleep(0.5)  # 1초 → 0.5초
+            await self.wait_for_paint(page)
             
         except Exception as e:
             print(f"⚠️ 스크롤 중 오류: {e}")
@@ -451,25 +618,30 @@ class CommunityScreenshotCapture:
     async def get_top_posts(self):
         """각 사이트별 랜덤 10개 게시물 조회"""
         import random
-        app = create_app()
+        app = create_app(start_scheduler=False)
         posts_by_site = {}
         
         with app.app_context():
             # 뽐뿌 제외하고 4개 사이트 캡처
             for site in ['bobae', 'ruliweb', 'dcinside', 'fmkorea', 'ppomppu']:
                 #site = "ppomppu" # 한 개 디버깅용
-                # 전체 게시물 중에서 랜덤 선택
                 all_posts = Post.query.filter(Post.site == site).all()
                 
-                if len(all_posts) > 10:
+                # 같은 내용으로 이미 캡처한 게시물은 제외 (force면 전부 대상)
+                candidates = all_posts if self.force else [
+                    post for post in all_posts if not self.capture_index.is_captured(post)
+                ]
+                skipped = len(all_posts) - len(candidates)
+                
+                if len(candidates) > 10:
                     # 10개 이상 있으면 랜덤으로 10개 선택
-                    posts = random.sample(all_posts, 10)
+                    posts = random.sample(candidates, 10)
                 else:
                     # 10개 미만이면 모든 게시물 선택
-                    posts = all_posts
+                    posts = candidates
                 
                 posts_by_site[site] = posts
-                print(f"📋 {self.site_configs[site]['name']}: {len(posts)}개 게시물 (랜덤 선택)")
+                print(f"📋 {self.site_configs[site]['name']}: {len(posts)}개 게시물 (랜덤 선택, 이미 캡처 {skipped}개 제외)")
         
         return posts_by_site
     
@@ -481,6 +653,10 @@ class CommunityScreenshotCapture:
         # 게시물 데이터 가져오기
         posts_by_site = await self.get_top_posts()
         
+        if not any(posts_by_site.values()):
+            print("✅ 새로 캡처할 게시물이 없습니다 (전부 다시 캡처하려면 --force)")
+            return []
+        
         async with async_playwright() as p:
             # Chromium 브라우저 실행 - 모바일 시뮬레이션 + 한글 지원 + 광고 차단
             browser = await p.chromium.launch(
@@ -502,35 +678,40 @@ class CommunityScreenshotCapture:
             
             captured_files = []
             total_posts = sum(len(posts) for posts in posts_by_site.values())
-            current_count = 0
+            progress = {'started': 0, 'total': total_posts}
+            
+            # 전체 동시 컨텍스트 수와 사이트별 동시 캡처 수 제한
+            global_slots = asyncio.Semaphore(Config.CAPTURE_CONCURRENCY)
+            site_slots = {site: asyncio.Semaphore(Config.CAPTURE_SITE_CONCURRENCY) for site in posts_by_site}
+            print(f"⚡ 동시 캡처: 전체 {Config.CAPTURE_CONCURRENCY}개, 사이트당 {Config.CAPTURE_SITE_CONCURRENCY}개")
             
             try:
-                # 사이트별로 순차 캡처
+                # 사이트별 게시물을 한꺼번에 예약하고, 결과는 사이트/게시물 순서대로 모음
+                tasks = []
+                task_posts = []
                 for site, posts in posts_by_site.items():
                     site_config = self.site_configs[site]
-                    print(f"\n🔥 {site_config['name']} 캡처 시작")
-                    
-                    for i, post in enumerate(posts, 1):
-                        current_count += 1
-                        print(f"\n[{current_count}/{total_posts}] {site_config['name']} 캡처 시작")
-                        
-                        try:
-                            post_files = await self.capture_post(browser, post, site_config, p)
-                            if post_files:
-                                if isinstance(post_files, list):
-                                    captured_files.extend(post_files)
-                                    print(f"  ✅ {site_config['name']} 성공: {len(post_files)}개 파일 생성")
-                                else:
-                                    captured_files.append(post_files)
-                                    print(f"  ✅ {site_config['name']} 성공: 1개 파일 생성")
-                            else:
-                                print(f"  ❌ {site_config['name']} 실패: 파일 생성되지 않음")
-                        except Exception as e:
-                            print(f"  ❌ {site_config['name']} 예외 발생: {str(e)}")
-                        
-                        # 사이트 부하 방지를 위한 딜레이 (단축)
-                        if i < len(posts):
-                            await asyncio.sleep(1)  # 2초 → 1초
+                    print(f"\n🔥 {site_config['name']} 캡처 예약: {len(posts)}개")
+                    for post in posts:
+                        task_posts.append(post)
+                        tasks.append(self.capture_post_with_limits(
+                            browser, post, site_config, p, global_slots, site_slots[site], progress
+                        ))
+                
+                results = await asyncio.gather(*tasks)
+                
+                # PNG 구간을 WebP/JPEG로 압축하고 썸네일/manifest 생성 (프로세스 풀)
+                if Config.CAPTURE_POSTPROCESS and Image is not None and any(results):
+                    results = await self.postprocess_captures(task_posts, results)
+                
+                for post, post_files in zip(task_posts, results):
+                    if not post_files:
+                        continue
+                    if not isinstance(post_files, list):
+                        post_files = [post_files]
+                    captured_files.extend(post_files)
+                    self.capture_index.record(post, post_files)
+                self.capture_index.save()
                 
                 print(f"\n✅ 고해상도 갤럭시 S25 분할 캡처 완료!")
                 print(f"📊 총 {len(captured_files)}개 파일 생성 (갤럭시 S25: 412x915 @ 3x DPI)")
@@ -547,8 +728,8 @@ class CommunityScreenshotCapture:
                 await browser.close()
 
 async def main():
-    """메인 실행 함수"""
-    capture = CommunityScreenshotCapture()
+    """메인 실행 함수 (--force: 이미 캡처한 게시물도 다시 캡처)"""
+    capture = CommunityScreenshotCapture(force='--force' in sys.argv[1:])
     captured_files = await capture.capture_all_posts()
     
     if captured_files:
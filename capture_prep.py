@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+캡처 페이지 준비 프로필
+사이트별 폰트/닉네임 블러/팝업 제거 규칙을 컨텍스트 init script 하나로 만들어 문서 시작 시점에 적용
+폰트는 static/fonts의 번들 폰트를 가로챈 요청으로 제공 (파일이 없으면 Google Fonts 사용)
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+# 앱 모듈을 위한 path 추가
+sys.path.append('.')
+from config import Config
+
+# 페이지에서 번들 폰트를 요청할 때 쓰는 가짜 주소 (컨텍스트 라우트가 로컬 파일로 응답)
+FONT_URL_PREFIX = 'https://capture-fonts.local/'
+
+# 번들 폰트 확장자 → Content-Type
+FONT_TYPES = {'.woff2': 'font/woff2', '.woff': 'font/woff', '.otf': 'font/otf', '.ttf': 'font/ttf'}
+
+# 파일 이름의 굵기 표기 → CSS font-weight
+FONT_WEIGHTS = {'Thin': 100, 'Light': 300, 'DemiLight': 350, 'Regular': 400, 'Medium': 500, 'Bold': 700, 'Black': 900}
+
+# 번들 폰트 파일 이름 접두어 → font-family (앞쪽이 우선)
+# 기본으로 저장소에 포함된 것은 나눔바른고딕 한글 음절 부분집합(OFL)이며, NotoSansKR-*.woff2를 넣으면 그쪽을 먼저 사용
+BUNDLED_FONT_FAMILIES = {'NotoSansKR': 'Noto Sans KR', 'NanumBarunGothic': 'NanumBarunGothic'}
+
+FONT_STACK = "'Noto Sans KR', 'NanumBarunGothic', 'Malgun Gothic', '맑은 고딕', 'Apple SD Gothic Neo', sans-serif"
+
+# 사이트별 준비 프로필
+# blur_selectors: 닉네임 블러 대상, popup_texts: 이 문구가 들어간 레이어는 제거
+PREP_PROFILES = {
+    'bobae': {
+        'blur_selectors': ['span.data4', '.data4'],
+        'popup_texts': []
+    },
+    'ruliweb': {
+        'blur_selectors': ['.nick', 'strong.nick', 'span.p_nick'],
+        'popup_texts': []
+    },
+    'fmkorea': {
+        'blur_selectors': [
+            '.nick', '.nickname', '.username', '.user_name',
+            '.member', '.writer', '.author_nick', '.author',
+            'span.nickname', 'span.member', '.member_nick',
+            '.xe_content .nick', 'strong.nick', 'b.nick',
+            '.comment_nick', '.reply_nick'
+        ],
+        'popup_texts': []
+    },
+    'dcinside': {
+        'blur_selectors': ['.nick', 'a.nick'],
+        'popup_texts': ['전체 서비스 설정에서 이미지 순서를', '이미지 순서']
+    },
+    'ppomppu': {
+        'blur_selectors': ['span.com_name_writer'],
+        'popup_texts': []
+    },
+    'default': {
+        'blur_selectors': ['.nick', '.nickname', '.writer'],
+        'popup_texts': []
+    }
+}
+
+# popup_texts를 찾을 레이어 후보 (기존 팝업 제거 스크립트와 같은 목록)
+POPUP_CONTAINERS = [
+    '.layer', '.popup', '.alert', '.notice',
+    '[class*="popup"]', '[class*="layer"]', '[class*="modal"]',
+    'div[style*="position: fixed"]', 'div[style*="z-index"]'
+]
+
+BLUR_DECLARATIONS = """
+    filter: blur(8px) !important;
+    user-select: none !important;
+    pointer-events: none !important;
+    color: transparent !important;
+    text-shadow: 0 0 8px rgba(0,0,0,0.5) !important;
+    background: rgba(200,200,200,0.3) !important;
+    border-radius: 4px !important;
+    padding: 2px 6px !important;
+"""
+
+
+def get_profile(site: str) -> Dict:
+    """사이트 준비 프로필 (없으면 기본값)"""
+    return PREP_PROFILES.get(site, PREP_PROFILES['default'])
+
+
+def bundled_fonts() -> List[Path]:
+    """static/fonts에 있는 번들 폰트 파일 목록 (BUNDLED_FONT_FAMILIES의 접두어로 시작하는 파일)"""
+    font_dir = Path(Config.CAPTURE_FONT_DIR)
+    if not font_dir.is_dir():
+        return []
+    return sorted(path for path in font_dir.iterdir()
+                  if path.suffix.lower() in FONT_TYPES and path.stem.split('-', 1)[0] in BUNDLED_FONT_FAMILIES)
+
+
+def font_allow_hosts() -> List[str]:
+    """리소스 차단에서 항상 허용할 폰트 호스트 (번들 폰트가 없을 때만 Google Fonts)"""
+    return [] if bundled_fonts() else list(Config.CAPTURE_WEBFONT_HOSTS)
+
+
+def font_css() -> str:
+    """번들 폰트(없으면 Google Fonts 스타일시트)의 @font-face와 전체 폰트 지정"""
+    faces = []
+    for path in bundled_fonts():
+        prefix, _, style = path.stem.partition('-')
+        family = BUNDLED_FONT_FAMILIES[prefix]
+        weight = FONT_WEIGHTS.get(style, 400)
+        faces.append(f"@font-face {{ font-family: '{family}'; font-weight: {weight}; "
+                     f"src: local('{family}'), url('{FONT_URL_PREFIX}{path.name}'); }}")
+    if not faces:
+        # @import는 스타일시트 맨 앞에 있어야 적용됨
+        faces.append(f"@import url('{Config.CAPTURE_WEBFONT_CSS}');")
+    return '\n'.join(faces) + f"\n* {{ font-family: {FONT_STACK} !important; }}"
+
+
+def build_init_script(site: str) -> str:
+    """문서 시작 시 스타일(폰트/블러)을 넣고, 팝업 문구가 있는 레이어를 계속 제거하는 스크립트"""
+    profile = get_profile(site)
+    css = font_css()
+    css += f"\n{', '.join(profile['blur_selectors'])} {{{BLUR_DECLARATIONS}}}"
+
+    return f"""
+        (() => {{
+            const css = {json.dumps(css, ensure_ascii=False)};
+            const popupTexts = {json.dumps(profile['popup_texts'], ensure_ascii=False)};
+            const popupContainers = {json.dumps(', '.join(POPUP_CONTAINERS))};
+
+            // 스타일은 한 번만 넣고, 페이지가 head를 다시 그려도 유지
+            const injectStyle = () => {{
+                if (document.getElementById('__capture_prep')) return;
+                const style = document.createElement('style');
+                style.id = '__capture_prep';
+                style.textContent = css;
+                (document.head || document.documentElement).appendChild(style);
+            }};
+
+            const removePopups = () => {{
+                if (!popupTexts.length || !document.body) return;
+                document.querySelectorAll(popupContainers).forEach(el => {{
+                    // 본문을 감싼 큰 레이어가 지워지지 않도록 짧은 문구의 레이어만 제거
+                    const text = el.textContent;
+                    if (text && text.length < 300 && popupTexts.some(t => text.includes(t))) el.remove();
+                }});
+            }};
+
+            injectStyle();
+            document.addEventListener('DOMContentLoaded', () => {{
+                injectStyle();
+                removePopups();
+                if (popupTexts.length) {{
+                    new MutationObserver(removePopups).observe(document.body, {{childList: true, subtree: true}});
+                }}
+            }});
+        }})();
+    """
+
+
+async def serve_bundled_font(route):
+    """FONT_URL_PREFIX 요청을 static/fonts의 파일로 응답"""
+    name = route.request.url[len(FONT_URL_PREFIX):].split('?', 1)[0]
+    path = Path(Config.CAPTURE_FONT_DIR) / Path(name).name
+    if not path.is_file():
+        await route.abort()
+        return
+    await route.fulfill(
+        path=str(path),
+        content_type=FONT_TYPES.get(path.suffix.lower(), 'font/woff2'),
+        headers={'Access-Control-Allow-Origin': '*', 'Cache-Control': 'max-age=31536000'}
+    )
+
+
+async def apply_prep_profile(context, site: str):
+    """컨텍스트에 사이트 준비 프로필 적용 (새 페이지마다 문서 시작 시 실행)"""
+    if bundled_fonts():
+        await context.route(f"{FONT_URL_PREFIX}**", serve_bundled_font)
+    await context.add_init_script(build_init_script(site))
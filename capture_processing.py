@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+캡처 후처리 스크립트
+capture_posts.py가 저장한 게시물별 PNG 구간을 WebP/JPEG로 압축하고 썸네일과 manifest.json 생성
+빈 구간과 바로 앞 구간과 픽셀 단위로 같은 구간은 제외 (프로세스 풀에서 게시물 단위로 병렬 처리)
+"""
+
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from PIL import Image, ImageChops
+
+# 앱 모듈을 위한 path 추가
+sys.path.append('.')
+from config import Config
+
+# 포맷별 확장자와 Pillow 저장 인자
+OUTPUT_FORMATS = {
+    'webp': {'ext': '.webp', 'format': 'WEBP', 'options': {'method': 4}},
+    'jpeg': {'ext': '.jpg', 'format': 'JPEG', 'options': {'optimize': True, 'progressive': True}}
+}
+
+
+def load_options() -> Dict:
+    """Config의 캡처 후처리 설정을 프로세스 간에 넘길 수 있는 dict로 변환"""
+    return {
+        'format': Config.CAPTURE_OUTPUT_FORMAT,
+        'quality': Config.CAPTURE_OUTPUT_QUALITY,
+        'thumbnail_width': Config.CAPTURE_THUMBNAIL_WIDTH,
+        'duplicate_pixel_ratio': Config.CAPTURE_DUPLICATE_PIXEL_RATIO,
+        'keep_originals': Config.CAPTURE_KEEP_ORIGINALS
+    }
+
+
+# 이보다 작은 밝기 차이는 렌더링 잡음으로 보고 같은 픽셀로 취급 (0~255)
+PIXEL_NOISE = 8
+
+
+def _changed_pixels(histogram: List[int], base: int) -> int:
+    """밝기 히스토그램에서 base와 PIXEL_NOISE 이상 차이 나는 픽셀 수"""
+    return sum(count for value, count in enumerate(histogram) if abs(value - base) >= PIXEL_NOISE)
+
+
+def is_blank(image: Image.Image, max_ratio: float) -> bool:
+    """원본 해상도에서 가장 많은 밝기와 다른 픽셀 비율이 max_ratio 이하일 때만 빈 화면(단색 여백)으로 판단"""
+    histogram = image.convert('L').histogram()
+    background = max(range(256), key=histogram.__getitem__)
+    return _changed_pixels(histogram, background) <= max_ratio * image.width * image.height
+
+
+def is_near_duplicate(image: Image.Image, previous: Image.Image, max_ratio: float) -> bool:
+    """원본 해상도에서 다른 픽셀 비율이 max_ratio 이하일 때만 같은 화면으로 판단 (크기가 다르면 다른 화면)"""
+    if image.size != previous.size:
+        return False
+    difference = ImageChops.difference(image.convert('L'), previous.convert('L'))
+    if difference.getbbox() is None:
+        return True
+    return _changed_pixels(difference.histogram(), 0) <= max_ratio * image.width * image.height
+
+
+def process_post_dir(post_dir: str, post_info: Optional[Dict] = None, options: Optional[Dict] = None) -> Dict:
+    """게시물 폴더 하나의 PNG 구간을 압축/정리하고 manifest.json 작성 (프로세스 풀 워커에서 실행)"""
+    options = options or load_options()
+    output = OUTPUT_FORMATS[options['format']]
+    post_dir = Path(post_dir)
+    sources = sorted(post_dir.glob('*.png'))
+
+    manifest = {
+        'post': post_info or {},
+        'format': options['format'],
+        'quality': options['quality'],
+        'processed_at': datetime.now().isoformat(timespec='seconds'),
+        'segments': [],
+        'dropped': [],
+        'thumbnail': None,
+        'source_bytes': 0,
+        'output_bytes': 0
+    }
+
+    previous = None
+    for index, source in enumerate(sources):
+        manifest['source_bytes'] += source.stat().st_size
+        with Image.open(source) as opened:
+            image = opened.convert('RGB')
+
+        # 첫 구간은 항상 유지, 이후 빈 화면이나 앞 구간과 같은 화면은 제외
+        reason = None
+        if index > 0 and is_blank(image, options['duplicate_pixel_ratio']):
+            reason = 'blank'
+        elif previous is not None and is_near_duplicate(image, previous, options['duplicate_pixel_ratio']):
+            reason = 'duplicate'
+
+        if reason:
+            manifest['dropped'].append({'source': source.name, 'reason': reason})
+            continue
+
+        target = source.with_suffix(output['ext'])
+        image.save(target, format=output['format'], quality=options['quality'], **output['options'])
+        size = target.stat().st_size
+        manifest['segments'].append({
+            'file': target.name,
+            'source': source.name,
+            'width': image.width,
+            'height': image.height,
+            'bytes': size
+        })
+        manifest['output_bytes'] += size
+
+        if manifest['thumbnail'] is None:
+            thumbnail = image.copy()
+            thumbnail.thumbnail((options['thumbnail_width'], options['thumbnail_width'] * 4))
+            thumbnail_path = post_dir / f"thumbnail{output['ext']}"
+            thumbnail.save(thumbnail_path, format=output['format'], quality=options['quality'], **output['options'])
+            manifest['thumbnail'] = thumbnail_path.name
+            manifest['output_bytes'] += thumbnail_path.stat().st_size
+
+        previous = image
+
+    # 임시 파일에 쓴 뒤 교체 - 쓰기에 실패하면 예외로 빠져나가 원본 PNG는 지우지 않음
+    manifest_tmp = post_dir / 'manifest.json.tmp'
+    with open(manifest_tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    manifest_tmp.replace(post_dir / 'manifest.json')
+
+    # 원본은 manifest.json까지 저장된 뒤에만 삭제 (CAPTURE_KEEP_ORIGINALS=1이면 보관)
+    if not options['keep_originals']:
+        for source in sources:
+            source.unlink()
+
+    return manifest
+
+
+def process_captures(jobs: List[Dict], workers: int = None) -> Dict[str, Dict]:
+    """여러 게시물 폴더를 프로세스 풀에서 후처리하고 {폴더: manifest} 반환 (jobs: [{'post_dir', 'post'}])
+
+    실패한 폴더는 결과에서 빠지고 원본 PNG가 그대로 남는다.
+    """
+    if not jobs:
+        return {}
+
+    options = load_options()
+    workers = workers or Config.CAPTURE_PROCESS_WORKERS
+    print(f"🗜️ 캡처 후처리 시작: {len(jobs)}개 게시물, {options['format']} q{options['quality']}, 프로세스 {workers}개")
+
+    manifests = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(process_post_dir, str(job['post_dir']), job.get('post'), options) for job in jobs]
+        for job, future in zip(jobs, futures):
+            try:
+                manifests[str(job['post_dir'])] = future.result()
+            except Exception as e:
+                print(f"  ❌ 후처리 실패 - {job['post_dir']}: {e}")
+
+    source_bytes = sum(m['source_bytes'] for m in manifests.values())
+    output_bytes = sum(m['output_bytes'] for m in manifests.values())
+    dropped = sum(len(m['dropped']) for m in manifests.values())
+    ratio = output_bytes / source_bytes * 100 if source_bytes else 0
+    print(f"✅ 캡처 후처리 완료: {source_bytes / 1024 / 1024:.1f}MB → {output_bytes / 1024 / 1024:.1f}MB "
+          f"({ratio:.0f}%), 제외된 구간 {dropped}개")
+    return manifests
+
+
+def main():
+    """날짜 폴더(기본: 오늘)의 아직 처리하지 않은 게시물 폴더를 후처리"""
+    date = sys.argv[1] if len(sys.argv) > 1 else datetime.now().strftime("%Y-%m-%d")
+    date_dir = Path("capture") / date
+    jobs = [{'post_dir': post_dir} for post_dir in sorted(date_dir.glob('*/post_*'))
+            if post_dir.is_dir() and not (post_dir / 'manifest.json').exists()]
+
+    if not jobs:
+        print(f"ℹ️ 처리할 캡처가 없습니다: {date_dir}")
+        return
+    process_captures(jobs)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import os
 
 class Config:
+    BASE_DIR = os.path.abspath(os.path.dirname(__file__))
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key'
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///community_aggregator.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
@@ -9,6 +10,157 @@ class Config:
     CRAWL_INTERVAL_HOURS = 1  # 1시간마다 크롤링
     MAX_POSTS_PER_SITE = 20   # 사이트당 최대 게시물 수
     
+    # 스케줄러 설정 (APScheduler, 작업은 DB에 저장)
+    SCHEDULER_ENABLED = os.environ.get('SCHEDULER_ENABLED', '1') == '1'  # 웹 서버에서만 켬 (스크립트/CI는 0)
+    SCHEDULER_JOB_TABLE = 'apscheduler_jobs'  # 잡 저장소 테이블
+    SCHEDULER_MISFIRE_GRACE = 300             # 늦어진 실행을 허용하는 시간 (초)
+    SCHEDULER_SITE_STAGGER = 30               # 사이트별 작업 시작 간격 (초)
+    
+    # 사이트별 적응형 크롤링 주기 (새/변경 게시물이 많으면 주기 단축, 없으면 연장)
+    CRAWL_ADAPTIVE = os.environ.get('CRAWL_ADAPTIVE', '1') == '1'
+    CRAWL_INTERVAL_BOUNDS = {
+        'default': {'min': 15 * 60, 'max': 6 * 60 * 60},  # 15분 ~ 6시간
+        'fmkorea': {'min': 30 * 60, 'max': 6 * 60 * 60}   # 차단이 잦아 최소 30분
+    }
+    CRAWL_TARGET_YIELD = 5        # 크롤링 한 번에 기대하는 새 게시물 수 (많으면 단축, 적으면 연장)
+    CRAWL_CHANGED_WEIGHT = 0.2    # 수치만 바뀐 기존 게시물의 가중치
+    
+    # 여러 워커 중 한 프로세스만 스케줄러 실행 (DB 임대 기반 리더 선출)
+    LEADER_LEASE_TTL = 30   # 임대 유효 시간 (초) - 리더가 죽으면 이 시간 뒤 다른 워커가 이어받음
+    LEADER_HEARTBEAT = 10   # 임대 갱신 주기 (초)
+    MIGRATION_LEASE_TTL = 600  # 스키마 마이그레이션 임대 유효 시간 (초) - 다른 워커는 이 시간까지 끝나기를 기다림
+
+    # 동시 크롤링 설정
+    CRAWL_CONCURRENT = os.environ.get('CRAWL_CONCURRENT', '0') == '1'  # 사이트별 워커에서 동시 크롤링 (기본 꺼짐, 1로 켬)
+    CRAWL_MAX_WORKERS = int(os.environ.get('CRAWL_MAX_WORKERS', 4))    # 동시 크롤링 워커 수
+    CRAWL_SITE_TIMEOUT = int(os.environ.get('CRAWL_SITE_TIMEOUT', 120))  # 사이트당 제한 시간 (초)
+    CRAWL_JOB_HISTORY = 20    # 상태 조회용으로 보관하는 최근 수동 크롤링 작업 수
+    CRAWL_JOB_LEASE_TTL = 60          # 수동 크롤링 작업 임대 유효 시간 (초) - 진행 상황 기록 때마다 연장
+    CRAWL_JOB_PROGRESS_INTERVAL = 5   # 수동 크롤링 진행 상황을 DB에 기록하는 간격 (초)
+    CRAWL_SITE_LOCK_TTL = 2 * CRAWL_SITE_TIMEOUT  # 사이트별 크롤링 잠금 유효 시간 (초) - 워커가 죽으면 이 시간 뒤 해제
+    
+    # 비동기 크롤러 HTTP 클라이언트 설정
+    CRAWL_ASYNC = os.environ.get('CRAWL_ASYNC', '0') == '1'  # 전체 크롤링을 하나의 이벤트 루프에서 실행 (기본 꺼짐, 1로 켬)
+    ASYNC_MAX_CONNECTIONS = 20   # 공유 커넥션 풀 최대 연결 수
+    ASYNC_MAX_KEEPALIVE = 10     # 유지할 keep-alive 연결 수
+    ASYNC_HTTP_TIMEOUT = 15      # 요청 타임아웃 (초)
+    
+    # 공유 Playwright 브라우저 풀 (JS 렌더링이 필요한 크롤러용)
+    BROWSER_POOL_SIZE = int(os.environ.get('BROWSER_POOL_SIZE', 2))    # 브라우저(워커 스레드) 수
+    BROWSER_POOL_HEADLESS = os.environ.get('BROWSER_POOL_HEADLESS', '1') == '1'
+    BROWSER_POOL_ARGS = [
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-blink-features=AutomationControlled',
+        '--disable-web-security'
+    ]
+    BROWSER_POOL_MAX_USES = 50          # 이 횟수만큼 컨텍스트를 만든 브라우저는 재시작
+    BROWSER_POOL_MAX_MEMORY_MB = 1024   # 워커 브라우저의 프로세스 트리(렌더러 포함) 메모리가 이보다 크면 재시작 (psutil)
+    BROWSER_POOL_TASK_TIMEOUT = 180     # 작업 하나의 최대 대기 시간 (초)
+    
+    # 브라우저 요청 차단 (광고/분석/미디어/폰트) - 프로필별 규칙은 app/crawlers/resource_blocking.py 참고
+    RESOURCE_BLOCKING_ENABLED = os.environ.get('RESOURCE_BLOCKING_ENABLED', '1') == '1'
+    RESOURCE_BLOCK_HOSTS = {
+        'ads': [
+            'doubleclick.net', 'googlesyndication.com', 'googleadservices.com', 'adservice.google.com',
+            'amazon-adsystem.com', 'criteo.com', 'criteo.net', 'taboola.com', 'outbrain.com',
+            'adnxs.com', 'dable.io', 'mobon.net', 'realclick.co.kr', 'adfit.kakao.com',
+            'tenping.kr', 'ad-shield.io', 'widerplanet.com', 'adpnut.com'
+        ],
+        'analytics': [
+            'google-analytics.com', 'googletagmanager.com', 'analytics.google.com',
+            'scorecardresearch.com', 'facebook.net', 'connect.facebook.net', 'hotjar.com',
+            'acecounter.com', 'wcs.naver.net', 'cloudflareinsights.com', 'clarity.ms'
+        ]
+    }
+    RESOURCE_BLOCK_PROFILES = {
+        # 목록 크롤링: HTML과 스크립트만 필요 - 이미지/미디어/폰트/스타일시트 모두 차단
+        'crawl': {
+            'types': ['image', 'media', 'font', 'stylesheet'],
+            'hosts': ['ads', 'analytics']
+        },
+        # 버튼을 눌러야 하는 페이지 (보배드림 정치 토글): 아이콘 버튼이 보이도록 이미지/스타일시트는 허용
+        'interactive': {
+            'types': ['media', 'font'],
+            'hosts': ['ads', 'analytics']
+        },
+        # 게시물 캡처: 본문 이미지와 스타일은 유지하고 동영상, 외부 폰트, 광고/분석만 차단
+        # (캡처용 폰트는 capture_prep.py가 static/fonts에서 제공, 파일이 없으면 Google Fonts 호스트를 허용)
+        'capture': {
+            'types': ['media'],
+            'third_party_types': ['font'],
+            'hosts': ['ads', 'analytics']
+        }
+    }
+    
+    # networkidle 대신 기다리는 사이트별 목록 셀렉터 (하나라도 나타나면 파싱 시작)
+    CRAWL_READY_SELECTORS = {
+        'ppomppu': 'a[href*="view.php"], a[href*="zboard.php"]',
+        'bobae': 'a[href*="view"], .list a',
+        'dcinside': 'tr.ub-content a, .gall_tit a',
+        'fmkorea': 'a.hx, .li.li_best a, a[href*="document_srl"]'
+    }
+    CRAWL_READY_TIMEOUT = 15000   # 셀렉터 대기 최대 시간 (ms) - 넘으면 그 시점의 내용으로 진행
+    
+    # 게시물 모바일 캡처 (capture_posts.py) 동시 실행 설정
+    CAPTURE_CONCURRENCY = int(os.environ.get('CAPTURE_CONCURRENCY', 4))            # 동시에 여는 컨텍스트 수
+    CAPTURE_SITE_CONCURRENCY = int(os.environ.get('CAPTURE_SITE_CONCURRENCY', 2))  # 사이트당 동시 캡처 수
+    CAPTURE_SITE_DELAY = 1      # 같은 사이트에서 캡처 하나가 끝난 뒤 다음 캡처까지 간격 (초)
+    CAPTURE_POST_TIMEOUT = 120  # 게시물 하나의 캡처 제한 시간 (초)
+    CAPTURE_RETRIES = 1         # 실패/시간 초과 시 재시도 횟수
+    CAPTURE_INDEX_FILE = os.path.join(BASE_DIR, 'capture', 'index.json')  # 캡처한 게시물 색인 (URL별 지문/파일)
+    CAPTURE_MODE = os.environ.get('CAPTURE_MODE', 'stitched')  # stitched: 한 번에 찍고 자르기, segments: 스크롤하며 구간별 촬영
+    CAPTURE_STITCH_CHUNK_HEIGHT = 4000  # 한 번에 렌더링할 최대 높이 (px) - 더 긴 페이지는 나눠 찍고 구간별로 잘라 냄
+    CAPTURE_FONT_DIR = os.path.join(BASE_DIR, 'static', 'fonts')  # 캡처에 쓰는 번들 폰트 (기본 NanumBarunGothic-Regular.woff2, NotoSansKR-Regular.woff2 등 추가 가능)
+    # 번들 폰트 파일이 없을 때 대신 쓰는 Google Fonts 스타일시트와 허용할 호스트
+    CAPTURE_WEBFONT_CSS = 'https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;500;700&display=swap'
+    CAPTURE_WEBFONT_HOSTS = ['fonts.googleapis.com', 'fonts.gstatic.com']
+    
+    # 캡처 후처리 (capture_processing.py) - 압축, 썸네일, 빈/중복 구간 제외, manifest.json
+    CAPTURE_POSTPROCESS = os.environ.get('CAPTURE_POSTPROCESS', '1') == '1'
+    CAPTURE_OUTPUT_FORMAT = os.environ.get('CAPTURE_OUTPUT_FORMAT', 'webp')  # webp 또는 jpeg
+    CAPTURE_OUTPUT_QUALITY = int(os.environ.get('CAPTURE_OUTPUT_QUALITY', 80))
+    CAPTURE_THUMBNAIL_WIDTH = 320        # 썸네일 폭 (px)
+    CAPTURE_DUPLICATE_PIXEL_RATIO = 0.0001  # 원본 해상도에서 앞 구간(중복) 또는 배경색(빈 구간)과 다른 픽셀 비율이 이 이하일 때만 제외
+    CAPTURE_KEEP_ORIGINALS = os.environ.get('CAPTURE_KEEP_ORIGINALS', '0') == '1'  # 원본 PNG 보관 여부 (기본 삭제, 1로 보관)
+    CAPTURE_PROCESS_WORKERS = int(os.environ.get('CAPTURE_PROCESS_WORKERS', os.cpu_count() or 2))
+    
+    # 모바일 크롤러 디버그용 전체 페이지 스크린샷 (기본 꺼짐)
+    CRAWL_DEBUG_SCREENSHOTS = os.environ.get('CRAWL_DEBUG_SCREENSHOTS', '0') == '1'
+    CRAWL_DEBUG_SCREENSHOT_DIR = os.path.join(BASE_DIR, 'cache', 'screenshots')
+    
+    # 호스트별 요청 속도 제한 (rate: 초당 요청 수, burst: 연속 허용 요청 수, jitter: 대기 시 추가되는 최대 무작위 지연)
+    # 키는 도메인 접미사로 매칭 (www.fmkorea.com, m.fmkorea.com → fmkorea.com)
+    CRAWL_RATE_LIMITS = {
+        'default': {'rate': 1.0, 'burst': 2, 'jitter': 0.5},
+        'fmkorea.com': {'rate': 1 / 3, 'burst': 1, 'jitter': 0.5},  # 3초 간격
+        'dogdrip.net': {'rate': 1.0, 'burst': 1, 'jitter': 0.3}     # 메인 페이지 방문 후 1초 간격
+    }
+    
+    # 목록 페이지 HTTP 캐시 (조건부 GET)
+    HTTP_CACHE_DIR = os.path.join(BASE_DIR, 'cache', 'http')
+    HTTP_CACHE_MAX_BYTES = 50 * 1024 * 1024  # 최대 50MB
+    HTTP_CACHE_MAX_AGE = 24 * 60 * 60        # 최대 1일 보관
+    
+    # 목록 페이지 내용 지문 (같으면 파싱/저장 생략)
+    FINGERPRINT_FILE = os.path.join(BASE_DIR, 'cache', 'fingerprints.json')
+    
+    # 보배드림 정치 필터 쿠키 (저장된 쿠키가 유효하면 브라우저 없이 요청)
+    BOBAE_COOKIE_FILE = os.path.join(BASE_DIR, 'cache', 'bobae_cookies.json')
+    BOBAE_COOKIE_MAX_AGE = 7 * 24 * 60 * 60     # 쿠키 만료 시각이 없어도 최대 7일 사용
+    BOBAE_COOKIE_REFRESH_BEFORE = 60 * 60       # 만료 1시간 전부터는 브라우저로 다시 발급
+    BOBAE_POLITICS_COOKIE_NAMES = ['politic']   # 이름에 이 문자열이 들어간 쿠키만 저장 (세션/추적 쿠키 제외)
+    
+    # 읽기 API 응답 캐시 (크롤링 결과가 커밋될 때마다 무효화)
+    # 데이터 버전은 DB(DataVersion)에 있어 리더가 아닌 워커도 DATA_VERSION_TTL 안에 새 버전을 봄
+    DATA_VERSION_TTL = float(os.environ.get('DATA_VERSION_TTL', 2))   # 데이터 버전을 다시 읽는 간격 (초)
+    RESPONSE_CACHE_MAX_ENTRIES = 256                                   # 메모리 캐시 최대 항목 수
+    RESPONSE_CACHE_REDIS_URL = os.environ.get('RESPONSE_CACHE_REDIS_URL')  # 설정 시 Redis 공유 캐시 사용
+    RESPONSE_CACHE_TTL = 24 * 60 * 60                                  # Redis 항목 보관 시간 (초)
+    
+    # 방문자 수는 메모리에서 세고 주기적으로 DB에 반영
+    VISIT_FLUSH_INTERVAL = int(os.environ.get('VISIT_FLUSH_INTERVAL', 30))  # 반영 주기 (초)
+    
     # 카테고리 설정
     CATEGORIES = {
         'economy': '경제/금융',
@@ -18,6 +170,11 @@ class Config:
         'other': '기타'
     }
     
+    POSTS_API_MAX_LIMIT = 500  # 게시물 API 한 번에 반환하는 최대 개수
+    
+    # 게시물 목록 사이트 우선순위: 보배 -> 루리웹 -> 개드립 -> 뽐뿌 -> 디시 -> 에펨 순 (그 외 사이트는 99)
+    SITE_PRIORITY = {'bobae': 0, 'ruliweb': 1, 'dogdrip': 2, 'ppomppu': 3, 'dcinside': 4, 'fmkorea': 5}
+    
     # 지원 사이트
     SUPPORTED_SITES = {
         'bobae': {
@@ -15,7 +15,7 @@ from app import create_app
 from app.crawlers.crawler_manager import CrawlerManager
 
 def main():
-    app = create_app()
+    app = create_app(start_scheduler=False)
     
     with app.app_context():
         print("🔄 커뮤니티 크롤링을 시작합니다...")
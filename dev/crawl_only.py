@@ -28,7 +28,7 @@ def crawl_all_sites():
     try:
         from app import create_app
         from app.models import Post, db
-        app = create_app()
+        app = create_app(start_scheduler=False)
         print("Flask 앱 초기화 성공 - 데이터베이스에 저장됩니다")
         use_database = True
     except Exception as e:
@@ -80,15 +80,19 @@ def crawl_all_sites():
                 # 기존 데이터 삭제 (최신 데이터만 유지)
                 Post.query.delete()
                 
-                # 새 데이터 저장
+                # 새 데이터 저장 (URL은 고유 인덱스이므로 중복 제거)
+                saved_urls = set()
                 for post_data in all_posts:
+                    if post_data['url'] in saved_urls:
+                        continue
+                    saved_urls.add(post_data['url'])
                     post = Post(
                         title=post_data['title'],
                         url=post_data['url'],
                         author=post_data.get('author'),
                         site=post_data['site'],
                         category=post_data.get('category', 'humor'),
-                        views=post_data.get('views'),
+                        views=post_data.get('views') or 0,
                         likes=post_data.get('likes'),
                         comments=post_data.get('comments'),
                         crawled_at=datetime.now()
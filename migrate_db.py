@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+기존 데이터베이스를 최신 스키마로 업그레이드하는 스크립트
+SQLite 파일은 작업 전에 같은 폴더에 백업본을 만든다.
+"""
+
+import os
+import shutil
+import sys
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from flask import Flask
+from config import Config
+from app.models import db
+from app.migrations import upgrade_database
+
+
+def create_migration_app():
+    """스케줄러 없이 데이터베이스만 연결한 앱 (create_app과 같은 instance 경로 사용)"""
+    app = Flask('app')
+    app.config.from_object(Config)
+    db.init_app(app)
+    return app
+
+
+def backup_sqlite(engine) -> str:
+    """SQLite 데이터베이스 파일 백업"""
+    if engine.url.get_backend_name() != 'sqlite':
+        return None
+
+    db_path = engine.url.database
+    if not db_path or db_path == ':memory:' or not os.path.exists(db_path):
+        return None
+
+    backup_path = f"{db_path}.bak_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    shutil.copy2(db_path, backup_path)
+    return backup_path
+
+
+def main():
+    app = create_migration_app()
+
+    with app.app_context():
+        backup_path = backup_sqlite(db.engine)
+        if backup_path:
+            print(f"💾 백업 생성: {backup_path}")
+
+        db.create_all()
+        applied = upgrade_database()
+
+        if applied:
+            print(f"✅ 마이그레이션 완료: {len(applied)}개 단계 적용")
+        else:
+            print("✅ 이미 최신 스키마입니다.")
+
+
+if __name__ == '__main__':
+    main()
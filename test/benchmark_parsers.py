@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+목록 파서 벤치마크 (네트워크 없음)
+test/fixtures의 녹화된 목록 페이지마다 크롤러 parse_posts를 반복 실행해
+파싱 시간, 메모리 할당량(tracemalloc), 추출한 게시물 수를 사이트별로 보여준다.
+recorded_at이 synthetic인 페이지는 손으로 만든 작은 합성 페이지라 실제 파싱 비용을 대표하지 않는다.
+
+사용법: python test/benchmark_parsers.py [반복횟수] [사이트 ...] [--json 결과.json]
+"""
+
+import contextlib
+import gc
+import io
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from test.replay import FixtureStore
+from test.record_fixtures import HTTP_CRAWLERS, MOBILE_CRAWLERS
+
+DEFAULT_REPEAT = 20
+
+
+def measure(parse, body, repeat: int) -> dict:
+    """parse(body)를 반복 실행해 시간/할당량/게시물 수 측정 (파서 로그 출력은 숨김)"""
+    sink = io.StringIO()
+
+    # 첫 실행은 워밍업 겸 결과 확인
+    with contextlib.redirect_stdout(sink):
+        posts = parse(body)
+
+    timings = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(sink):
+            started_at = time.perf_counter()
+            parse(body)
+            timings.append((time.perf_counter() - started_at) * 1000)
+        sink.seek(0)
+        sink.truncate()
+
+    # 할당량은 별도 1회 실행으로 측정 (tracemalloc이 시간 측정을 느리게 하므로)
+    # 파싱 트리는 순환 참조라 GC 전까지 남으므로, GC를 멈추고 실행 전후 스냅샷 차이를 할당 블록 수로 사용
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(sink):
+            before = tracemalloc.take_snapshot()
+            parse(body)
+            after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+
+    stats = after.compare_to(before, 'filename')
+    blocks = sum(max(stat.count_diff, 0) for stat in stats)
+
+    return {
+        'bytes': len(body),
+        'posts': len(posts),
+        'median_ms': round(statistics.median(timings), 3),
+        'min_ms': round(min(timings), 3),
+        'peak_kb': round(peak / 1024, 1),
+        'alloc_blocks': blocks
+    }
+
+
+def run_benchmarks(store: FixtureStore, repeat: int, sites=None) -> list:
+    """녹화된 모든 목록 페이지에 대해 해당 크롤러 파서 측정"""
+    results = []
+    for section, crawlers in (('http', HTTP_CRAWLERS), ('mobile', MOBILE_CRAWLERS)):
+        for entry in store.entries(section):
+            site = entry['site']
+            if site not in crawlers or (sites and site not in sites):
+                continue
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                crawler = crawlers[site]()
+            body = store.load(section, entry['url'])
+            if section == 'mobile':
+                body = body.decode('utf-8')
+
+            result = measure(crawler.parse_posts, body, repeat)
+            result.update({'site': site, 'kind': section, 'file': entry['file'],
+                           'recorded_at': entry.get('recorded_at')})
+            results.append(result)
+    return results
+
+
+def print_table(results: list):
+    """결과 표 출력"""
+    header = f"{'사이트':<10} {'구분':<7} {'크기(KB)':>9} {'게시물':>6} {'중앙값(ms)':>11} {'최소(ms)':>9} {'최대메모리(KB)':>14} {'할당블록':>8}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        print(f"{r['site']:<10} {r['kind']:<7} {r['bytes'] / 1024:>9.1f} {r['posts']:>6} {r['median_ms']:>11.2f} "
+              f"{r['min_ms']:>9.2f} {r['peak_kb']:>14.1f} {r['alloc_blocks']:>8}")
+
+
+def main():
+    args = sys.argv[1:]
+    output = None
+    if '--json' in args:
+        position = args.index('--json')
+        output = args[position + 1] if position + 1 < len(args) else 'parser_benchmark.json'
+        del args[position:position + 2]
+
+    repeat = DEFAULT_REPEAT
+    if args and args[0].isdigit():
+        repeat = int(args.pop(0))
+    sites = set(args)
+
+    store = FixtureStore()
+    print(f"⏱️ 목록 파서 벤치마크: 반복 {repeat}회, 녹화 페이지 {store.root}")
+    results = run_benchmarks(store, repeat, sites)
+    if not results:
+        print("ℹ️ 측정할 녹화 페이지가 없습니다 (python test/record_fixtures.py로 녹화)")
+        return
+
+    print_table(results)
+    synthetic = sorted({r['site'] for r in results if r.get('recorded_at') == 'synthetic'})
+    if synthetic:
+        print(f"⚠️ 합성 페이지 결과 포함 ({', '.join(synthetic)}) - 실제 녹화로 바꾸려면 python test/record_fixtures.py")
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump({'repeat': repeat, 'python': sys.version.split()[0], 'results': results},
+                      f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
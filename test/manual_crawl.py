@@ -10,7 +10,7 @@ from app.crawlers.crawler_manager import CrawlerManager
 
 def manual_crawl():
     """수동 크롤링 실행"""
-    app = create_app()
+    app = create_app(start_scheduler=False)
     
     with app.app_context():
         print("🔄 수동 크롤링을 시작합니다...")
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤러 목록 페이지 녹화 스크립트 (네트워크 필요)
+각 크롤러를 실제로 한 번 실행하면서 받은 페이지를 test/fixtures에 저장한다.
+- requests 세션 요청: 속도 제한은 지키고 HTTP 캐시는 거치지 않는 녹화 어댑터로 저장 (304 본문 없음 방지)
+- urllib/브라우저로 받은 목록(에펨코리아, 보배드림 쿠키 발급): parse_posts에 들어온 HTML을 사이트 목록 URL로 저장
+- 모바일 크롤러: 브라우저 풀이 돌려준 페이지 소스를 저장
+
+사용법: python test/record_fixtures.py [사이트 ...] [--mobile]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.crawlers.rate_limiter import RateLimitedAdapter
+from app.crawlers.site_crawlers import (PpomppuCrawler, FmkoreaCrawler, BobaeCrawler,
+                                        DcinsideCrawler, RuliwebCrawler, DogdripCrawler)
+from app.crawlers.mobile_crawler import (MobilePpomppuCrawler, MobileBobaeCrawler,
+                                         MobileDcinsideCrawler, MobileFmkoreaCrawler)
+from test.replay import FixtureStore
+
+HTTP_CRAWLERS = {
+    'ppomppu': PpomppuCrawler,
+    'fmkorea': FmkoreaCrawler,
+    'bobae': BobaeCrawler,
+    'dcinside': DcinsideCrawler,
+    'ruliweb': RuliwebCrawler,
+    'dogdrip': DogdripCrawler
+}
+
+MOBILE_CRAWLERS = {
+    'ppomppu': MobilePpomppuCrawler,
+    'bobae': MobileBobaeCrawler,
+    'dcinside': MobileDcinsideCrawler,
+    'fmkorea': MobileFmkoreaCrawler
+}
+
+# 세션을 거치지 않고 받은 목록 HTML을 저장할 URL (에펨코리아는 첫 번째 시도 URL 기준)
+LIST_URLS = {
+    'fmkorea': 'https://m.fmkorea.com/best2',
+    'bobae': 'https://www.bobaedream.co.kr/list?code=best'
+}
+
+
+class RecordingAdapter(RateLimitedAdapter):
+    """200 응답 본문을 기억해 두는 어댑터 (크롤링이 끝난 뒤 목록 페이지 여부와 함께 저장)"""
+
+    def __init__(self, **kwargs):
+        self.responses = []
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        if request.method == 'GET' and response.status_code == 200 and not kwargs.get('stream'):
+            self.responses.append((request.url, response.content, response.headers.get('Content-Type')))
+        return response
+
+
+def record_http(site: str, store: FixtureStore) -> int:
+    """사이트 크롤러를 실행하며 받은 페이지 녹화 후 저장한 페이지 수 반환"""
+    crawler = HTTP_CRAWLERS[site]()
+    adapter = RecordingAdapter()
+    crawler.session.mount('http://', adapter)
+    crawler.session.mount('https://', adapter)
+
+    # parse_posts에 들어온 HTML을 목록 페이지로 표시
+    parsed = []
+    parse_posts = crawler.parse_posts
+
+    def recording_parse_posts(content):
+        parsed.append(content)
+        return parse_posts(content)
+
+    crawler.parse_posts = recording_parse_posts
+    posts = crawler.crawl_popular_posts()
+
+    saved = 0
+    for url, body, content_type in adapter.responses:
+        store.save('http', url, site, body, content_type, list_page=body in parsed)
+        saved += 1
+
+    session_bodies = [body for _, body, _ in adapter.responses]
+    for content in parsed:
+        if content not in session_bodies and site in LIST_URLS:
+            body = content.encode('utf-8') if isinstance(content, str) else content
+            store.save('http', LIST_URLS[site], site, body, 'text/html; charset=UTF-8')
+            saved += 1
+
+    print(f"📼 {site}: 페이지 {saved}개 녹화, 게시물 {len(posts)}개")
+    return saved
+
+
+def record_mobile(site: str, store: FixtureStore) -> int:
+    """모바일 크롤러를 실행하며 받은 페이지 소스 녹화 후 저장한 페이지 수 반환"""
+    crawler = MOBILE_CRAWLERS[site]()
+    pages = []
+    run_with_mobile_page = crawler.run_with_mobile_page
+
+    def recording_run(fetch, url):
+        page_source = run_with_mobile_page(fetch, url)
+        if page_source:
+            pages.append((url, page_source))
+        return page_source
+
+    crawler.run_with_mobile_page = recording_run
+    posts = crawler.crawl_popular_posts()
+
+    for url, page_source in pages:
+        store.save('mobile', url, site, page_source.encode('utf-8'))
+
+    print(f"📼 {site} 모바일: 페이지 {len(pages)}개 녹화, 게시물 {len(posts)}개")
+    return len(pages)
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    mobile = '--mobile' in sys.argv
+    crawlers = MOBILE_CRAWLERS if mobile else HTTP_CRAWLERS
+    sites = args or list(crawlers.keys())
+
+    unknown = [site for site in sites if site not in crawlers]
+    if unknown:
+        print(f"❌ 알 수 없는 사이트: {', '.join(unknown)} (가능: {', '.join(crawlers.keys())})")
+        sys.exit(1)
+
+    store = FixtureStore()
+    print(f"📼 {'모바일 ' if mobile else ''}목록 페이지 녹화 시작: {', '.join(sites)} → {store.root}")
+    for site in sites:
+        try:
+            if mobile:
+                record_mobile(site, store)
+            else:
+                record_http(site, store)
+        except Exception as e:
+            print(f"❌ {site} 녹화 실패: {e}")
+
+
+if __name__ == "__main__":
+    main()
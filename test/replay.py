@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+녹화된 목록 페이지(test/fixtures)를 네트워크 없이 크롤러에 재생하는 도구
+(recorded_at이 synthetic인 항목은 실제 녹화가 아닌 합성 페이지 - test/fixtures/README.md)
+- FixtureStore: index.json(URL → HTML 파일)을 읽고 쓰는 저장소
+- ReplayAdapter: BaseCrawler.session에 마운트해 요청을 저장된 응답으로 돌려주는 어댑터
+- install_replay / install_mobile_replay: 크롤러 하나를 재생 모드로 전환
+- create_replay_client: 비동기 크롤러(async_crawler)용 재생 httpx 클라이언트
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+FIXTURE_DIR = Path(__file__).resolve().parent / 'fixtures'
+
+# index.json 구역: http는 requests 세션 요청, mobile은 Playwright 모바일 페이지 소스
+SECTIONS = ('http', 'mobile')
+
+
+def normalize_url(url: str) -> str:
+    """경로가 빈 URL에 '/'를 붙여 requests와 httpx의 요청 URL을 같은 키로 맞춤"""
+    parts = urlsplit(url)
+    return urlunsplit(parts._replace(path=parts.path or '/'))
+
+
+class FixtureStore:
+    """녹화된 페이지 저장소 (index.json + html/ 폴더)"""
+
+    def __init__(self, root: str = None):
+        self.root = Path(root) if root else FIXTURE_DIR
+        self.index_path = self.root / 'index.json'
+        self.html_dir = self.root / 'html'
+        self.index = {section: {} for section in SECTIONS}
+        if self.index_path.exists():
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index.update(json.load(f))
+
+    def lookup(self, section: str, url: str) -> Optional[Dict]:
+        """URL의 녹화 항목 (없으면 None)"""
+        return self.index[section].get(normalize_url(url))
+
+    def load(self, section: str, url: str) -> Optional[bytes]:
+        """URL의 녹화된 본문 (없으면 None)"""
+        entry = self.lookup(section, url)
+        if entry is None:
+            return None
+        return (self.html_dir / entry['file']).read_bytes()
+
+    def entries(self, section: str, site: str = None, list_only: bool = True) -> List[Dict]:
+        """구역의 녹화 항목 목록 (url 포함, site/목록 페이지 여부로 필터)"""
+        return [dict(entry, url=url) for url, entry in self.index[section].items()
+                if (site is None or entry['site'] == site) and (entry.get('list_page') or not list_only)]
+
+    def save(self, section: str, url: str, site: str, body: bytes,
+             content_type: str = None, list_page: bool = True):
+        """본문을 html/에 저장하고 index.json 갱신"""
+        prefix = 'mobile_' if section == 'mobile' else ''
+        existing = self.lookup(section, url)
+        if existing:
+            name = existing['file']
+        else:
+            used = {entry['file'] for entries in self.index.values() for entry in entries.values()}
+            stem = f"{prefix}{site}" if list_page else f"{prefix}{site}_page"
+            name, number = f"{stem}.html", 2
+            while name in used:
+                name, number = f"{stem}_{number}.html", number + 1
+
+        self.html_dir.mkdir(parents=True, exist_ok=True)
+        (self.html_dir / name).write_bytes(body)
+
+        entry = {'site': site, 'file': name, 'list_page': list_page,
+                 'recorded_at': datetime.now().isoformat(timespec='seconds')}
+        if content_type:
+            entry['content_type'] = content_type
+        self.index[section][normalize_url(url)] = entry
+
+        temp_path = self.index_path.with_suffix('.json.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        os.replace(temp_path, self.index_path)
+
+
+class ReplayAdapter(HTTPAdapter):
+    """녹화된 응답을 돌려주는 어댑터 (속도 제한/캐시/네트워크 없음, 녹화에 없는 URL은 연결 오류)"""
+
+    def __init__(self, store: FixtureStore = None, **kwargs):
+        self.store = store or FixtureStore()
+        self.requested = []
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.requested.append(request.url)
+        entry = self.store.lookup('http', request.url)
+        if entry is None:
+            raise requests.exceptions.ConnectionError(f"녹화된 페이지 없음: {request.url}", request=request)
+
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = request.url
+        response.request = request
+        response.headers = CaseInsensitiveDict({'Content-Type': entry.get('content_type', 'text/html; charset=UTF-8')})
+        response._content = self.store.load('http', request.url)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+
+def install_replay(crawler, store: FixtureStore = None) -> ReplayAdapter:
+    """크롤러 세션의 어댑터(속도 제한 + HTTP 캐시)를 재생 어댑터로 교체"""
+    adapter = ReplayAdapter(store)
+    crawler.session.mount('http://', adapter)
+    crawler.session.mount('https://', adapter)
+    return adapter
+
+
+def install_mobile_replay(crawler, store: FixtureStore = None):
+    """모바일 크롤러가 브라우저 풀 대신 녹화된 페이지 소스를 받도록 교체"""
+    store = store or FixtureStore()
+
+    def replay_page(fetch, url: str) -> str:
+        body = store.load('mobile', url)
+        if body is None:
+            print(f"❌ {crawler.site_name} 녹화된 모바일 페이지 없음: {url}")
+            return None
+        return body.decode('utf-8')
+
+    crawler.run_with_mobile_page = replay_page
+
+
+def create_replay_client(store: FixtureStore = None) -> httpx.AsyncClient:
+    """녹화된 응답을 돌려주는 비동기 크롤러용 httpx 클라이언트 (녹화에 없는 URL은 연결 오류)"""
+    store = store or FixtureStore()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        entry = store.lookup('http', url)
+        if entry is None:
+            raise httpx.ConnectError(f"녹화된 페이지 없음: {url}", request=request)
+        return httpx.Response(200, content=store.load('http', url),
+                              headers={'Content-Type': entry.get('content_type', 'text/html; charset=UTF-8')})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler), follow_redirects=True)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤러 관리자의 사이트 잠금과 실행 결과 기록 테스트 (네트워크 없이 가짜 크롤러로 실행)
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from flask import Flask
+
+from app.crawlers import crawler_manager, http_cache, rate_limiter
+from app.crawlers.async_crawler import create_async_client
+from app.crawlers.crawler_manager import CrawlerManager
+from app.crawlers.fingerprints import FingerprintStore
+from app.crawlers.site_crawlers import PpomppuCrawler
+from app.leader import current_lease_owner
+from app.models import db
+from config import Config
+from test.replay import FixtureStore
+
+
+class FakeCrawler:
+    """지정한 시간만큼 기다린 뒤 빈 목록을 반환하는 크롤러"""
+    delay = 0.0
+    unchanged = False
+    pending_fingerprint = None
+
+    def __init__(self):
+        self.fingerprints = None
+        self.finished = threading.Event()
+
+    def crawl_popular_posts(self):
+        time.sleep(self.delay)
+        self.finished.set()
+        return []
+
+    def commit_validators(self):
+        pass
+
+
+class CountingRateLimiter(rate_limiter.HostRateLimiter):
+    """호출된 URL을 기록하는 속도 제한기 (예산이 커서 사실상 대기 없음)"""
+
+    def __init__(self):
+        super().__init__(limits={'default': {'rate': 1000.0, 'burst': 1000}})
+        self.waited = []
+
+    async def wait_async(self, url: str) -> float:
+        self.waited.append(url)
+        return await super().wait_async(url)
+
+
+class SlowCrawler(FakeCrawler):
+    delay = 1.5
+
+
+class FastCrawler(FakeCrawler):
+    delay = 0.05
+
+
+def make_app(db_path):
+    """크롤링 잠금 테이블만 쓰는 최소 앱 (워커 스레드도 같은 DB를 보도록 파일 DB 사용)"""
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def make_manager():
+    manager = CrawlerManager()
+    manager.crawlers = {'slow': SlowCrawler(), 'fast': FastCrawler()}
+    return manager
+
+
+def test_timed_out_site_releases_lease():
+    """제한 시간을 넘긴 사이트의 DB 임대는 워커가 끝나면 바로 풀림"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        app = make_app(os.path.join(temp_dir, 'crawl.db'))
+        manager = make_manager()
+
+        with app.app_context():
+            manager.crawl_all_sites(concurrent=True, max_workers=2, site_timeout=0.5)
+            assert manager.current_run['slow']['status'] == 'timeout'
+            assert manager.current_run['fast']['status'] == 'success'
+            assert current_lease_owner('crawl_site:fast') is None
+
+            # 워커가 아직 실행 중이면 같은 사이트의 다음 크롤링은 건너뜀
+            assert manager.crawl_site_with_report('slow')['status'] == 'skipped'
+
+            deadline = time.monotonic() + 5
+            while 'slow' in manager._running_sites and time.monotonic() < deadline:
+                time.sleep(0.05)
+            time.sleep(0.1)
+
+            assert current_lease_owner('crawl_site:slow') is None
+            assert not manager._abandoned_sites
+        print("✅ 제한 시간 초과 사이트 임대 해제")
+
+
+def test_runs_use_fresh_crawlers_and_own_reports():
+    """실행마다 새 크롤러 인스턴스를 쓰고, 사이트별 실행은 자기 결과를 반환"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        app = make_app(os.path.join(temp_dir, 'crawl.db'))
+        manager = make_manager()
+        prototype = manager.crawlers['fast']
+
+        with app.app_context():
+            report = manager.crawl_site_with_report('fast')
+            assert report['status'] == 'success'
+            assert not prototype.finished.is_set()
+
+            # 전체 크롤링이 시작돼도 이미 받은 결과는 바뀌지 않음
+            manager.crawl_all_sites(concurrent=False)
+            assert manager.current_run['fast'] is not report
+            assert report['status'] == 'success'
+            assert manager.crawl_site('fast') == 0
+        print("✅ 실행별 크롤러와 결과 분리")
+
+
+def test_async_crawl_uses_rate_limiter_and_http_cache():
+    """CRAWL_ASYNC면 비동기 경로로 크롤링하고, 요청은 속도 제한기와 조건부 GET을 거침"""
+    store = FixtureStore()
+    url = 'https://www.ppomppu.co.kr/hot.php?category=2'
+    requests_seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(dict(request.headers))
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=store.load('http', str(request.url)),
+                              headers={'Content-Type': 'text/html; charset=UTF-8', 'ETag': '"v1"'})
+
+    saved = (Config.CRAWL_ASYNC, crawler_manager.create_async_client,
+             http_cache.http_cache_instance, rate_limiter.rate_limiter_instance)
+    limiter = CountingRateLimiter()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        try:
+            Config.CRAWL_ASYNC = True
+            crawler_manager.create_async_client = lambda: create_async_client(transport=httpx.MockTransport(handler))
+            http_cache.http_cache_instance = http_cache.HTTPCache(cache_dir=os.path.join(temp_dir, 'http_cache'))
+            rate_limiter.rate_limiter_instance = limiter
+
+            app = make_app(os.path.join(temp_dir, 'crawl.db'))
+            manager = CrawlerManager()
+            manager.fingerprints = FingerprintStore(os.path.join(temp_dir, 'fingerprints.json'))
+            manager.crawlers = {'ppomppu': PpomppuCrawler(), 'fast': FastCrawler()}
+
+            with app.app_context():
+                assert manager.crawl_all_sites() > 0
+                assert manager.current_run['ppomppu']['status'] == 'success'
+                assert manager.current_run['fast']['status'] == 'success'
+
+                # 저장 후 기록된 ETag로 다음 크롤링은 304를 받아 파싱을 건너뜀
+                assert manager.crawl_all_sites() == 0
+                assert manager.current_run['ppomppu']['status'] == 'unchanged'
+                assert requests_seen[-1].get('if-none-match') == '"v1"'
+                assert manager.current_run['ppomppu']['http_cache']['hits'] == 1
+
+                assert limiter.waited == [url, url]
+                assert current_lease_owner('crawl_site:ppomppu') is None
+        finally:
+            (Config.CRAWL_ASYNC, crawler_manager.create_async_client,
+             http_cache.http_cache_instance, rate_limiter.rate_limiter_instance) = saved
+    print("✅ 비동기 크롤링 경로")
+
+
+if __name__ == "__main__":
+    test_timed_out_site_releases_lease()
+    test_runs_use_fresh_crawlers_and_own_reports()
+    test_async_crawl_uses_rate_limiter_and_http_cache()
@@ -10,7 +10,7 @@ from app.crawlers.crawler_manager import CrawlerManager
 
 def test_exclude_filter():
     """제외 필터 테스트"""
-    app = create_app()
+    app = create_app(start_scheduler=False)
     
     with app.app_context():
         print("🔄 제외 필터가 적용된 크롤링 테스트를 시작합니다...")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기존(초기) 스키마 SQLite 데이터베이스에 마이그레이션을 적용하는 테스트 (네트워크 없음)
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from sqlalchemy import create_engine, text
+
+from app.leader import acquire_lease, current_lease_owner
+from app.migrations import MIGRATION_LEASE, index_names, upgrade_database
+from app.models import Post, db
+from config import Config
+
+# 인덱스와 site_rank 컬럼이 없던 초기 post 테이블
+BASELINE_POST_TABLE = """
+CREATE TABLE post (
+    id INTEGER NOT NULL PRIMARY KEY,
+    title VARCHAR(500) NOT NULL,
+    url VARCHAR(1000) NOT NULL,
+    site VARCHAR(50) NOT NULL,
+    category VARCHAR(50) NOT NULL,
+    author VARCHAR(100),
+    views INTEGER,
+    likes INTEGER,
+    comments INTEGER,
+    created_at DATETIME,
+    crawled_at DATETIME
+)
+"""
+
+
+def make_baseline_db(db_path):
+    """URL이 중복된 게시물이 들어 있는 초기 스키마 데이터베이스"""
+    engine = create_engine(f'sqlite:///{db_path}')
+    with engine.begin() as conn:
+        conn.execute(text(BASELINE_POST_TABLE))
+        for i, url in enumerate(['a', 'b', 'a', 'c', 'b', 'a']):
+            conn.execute(text(
+                "INSERT INTO post (title, url, site, category, views, crawled_at) "
+                "VALUES (:title, :url, :site, '인기', :views, :crawled_at)"
+            ), {'title': f'게시물 {i}', 'url': f'https://example.com/{url}', 'site': 'bobae',
+                'views': None if i == 3 else i, 'crawled_at': None if i == 1 else '2026-01-01 00:00:00'})
+    engine.dispose()
+
+
+def make_app(db_path):
+    """create_app처럼 create_all 뒤 마이그레이션을 적용할 최소 앱"""
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def test_upgrade_baseline_database_with_duplicate_urls():
+    """중복 URL은 가장 먼저 저장된 행만 남기고, 인덱스와 컬럼을 추가하며, 다시 실행하면 바뀌는 것이 없음"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, 'baseline.db')
+        make_baseline_db(db_path)
+        app = make_app(db_path)
+
+        with app.app_context():
+            applied = upgrade_database()
+            assert applied
+
+            posts = Post.query.order_by(Post.id).all()
+            assert [(post.id, post.url[-1]) for post in posts] == [(1, 'a'), (2, 'b'), (4, 'c')]
+            assert all(post.site_rank is not None and post.crawled_at for post in posts)
+
+            with db.engine.connect() as conn:
+                assert {'ux_post_url', 'ix_post_ranked'} <= index_names(conn, 'post')
+
+            assert upgrade_database() == []
+            assert current_lease_owner(MIGRATION_LEASE) is None
+    print("✅ 초기 스키마 마이그레이션")
+
+
+def test_upgrade_waits_for_other_worker():
+    """다른 워커가 마이그레이션 임대를 가진 동안에는 적용하지 않고 기다림"""
+    saved_ttl = Config.MIGRATION_LEASE_TTL
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, 'baseline.db')
+        make_baseline_db(db_path)
+        app = make_app(db_path)
+
+        with app.app_context():
+            try:
+                Config.MIGRATION_LEASE_TTL = 1
+                assert acquire_lease(MIGRATION_LEASE, 'other-worker', 30)
+                try:
+                    upgrade_database()
+                except RuntimeError:
+                    pass
+                else:
+                    raise AssertionError("임대를 가진 워커가 있는데 마이그레이션이 실행됨")
+                assert db.session.execute(text("SELECT COUNT(*) FROM post")).scalar() == 6
+            finally:
+                Config.MIGRATION_LEASE_TTL = saved_ttl
+    print("✅ 다른 워커의 마이그레이션 대기")
+
+
+if __name__ == "__main__":
+    test_upgrade_baseline_database_with_duplicate_urls()
+    test_upgrade_waits_for_other_worker()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+게시물 목록 API(/api/posts)의 커서 페이지와 기존 응답 형식 테스트 (메모리 SQLite, 네트워크 없음)
+"""
+
+import base64
+import json
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+
+from app import cache
+from app.models import Post, db
+from app.routes import decode_cursor, encode_cursor, main
+from config import Config
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app')
+
+
+def make_app():
+    """목록 API만 쓰는 최소 앱 (응답 캐시는 앱마다 새로 만듦)"""
+    app = Flask(__name__, root_path=APP_DIR)
+    app.config.from_object(Config)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    db.init_app(app)
+    app.register_blueprint(main)
+    cache.response_cache_instance = None
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def add_posts():
+    """사이트마다 조회수와 수집 시각이 겹치는 게시물 추가"""
+    same_time = datetime(2026, 1, 1, 12, 0)
+    for site in ('bobae', 'ruliweb', 'ppomppu'):
+        for i in range(7):
+            db.session.add(Post(
+                title=f'{site} 게시물 {i}',
+                url=f'https://example.com/{site}/{i}',
+                site=site,
+                category='인기',
+                views=[100, 50, 50, 50, 50, 10, 0][i],
+                crawled_at=same_time if i % 2 else datetime(2026, 1, 1, 12, i)
+            ))
+    db.session.commit()
+
+
+def make_cursor(payload) -> str:
+    raw = json.dumps(payload).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def test_cursor_round_trip():
+    """커서는 마지막 게시물의 정렬 키로 되돌아감 (수집 시각이 없으면 가장 이른 시각)"""
+    app = make_app()
+    with app.app_context():
+        add_posts()
+        post = Post.ranked().first()
+        assert decode_cursor(encode_cursor(post)) == post.rank_key()
+
+    assert decode_cursor(make_cursor([1, 10, None, 3])) == (1, 10, datetime.min, 3)
+    print("✅ 커서 인코딩/디코딩")
+
+
+def test_malformed_cursor():
+    """형식이 잘못된 커서는 ValueError, API는 400"""
+    malformed = ['!!!', 'bm90LWpzb24', make_cursor({'a': 1}), make_cursor([1, 2, 3]),
+                 make_cursor(['x', 1, None, 1]), make_cursor([1, 1, 'not-a-date', 1])]
+    for cursor in malformed:
+        try:
+            decode_cursor(cursor)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"잘못된 커서가 통과함: {cursor}")
+
+    app = make_app()
+    with app.app_context():
+        add_posts()
+        client = app.test_client()
+        for cursor in malformed:
+            response = client.get('/api/posts', query_string={'limit': 5, 'cursor': cursor})
+            assert response.status_code == 400, cursor
+    print("✅ 잘못된 커서 거부")
+
+
+def test_pages_have_no_gaps_or_duplicates():
+    """조회수와 수집 시각이 같은 게시물이 페이지 경계에 걸쳐도 빠지거나 겹치지 않음 (조회수 NULL 포함)"""
+    app = make_app()
+    with app.app_context():
+        add_posts()
+        db.session.execute(db.update(Post).where(Post.id.in_([3, 7, 10])).values(views=None))
+        db.session.commit()
+        expected = [post.id for post in Post.ranked().all()]
+
+        client = app.test_client()
+        for limit in (1, 2, 3, 4, 5):
+            seen = []
+            cursor = ''
+            while True:
+                data = client.get('/api/posts', query_string={'limit': limit, 'cursor': cursor}).get_json()
+                assert len(data['posts']) <= limit
+                seen += [post['id'] for post in data['posts']]
+                cursor = data['next_cursor']
+                if not cursor:
+                    break
+            assert seen == expected, f"limit={limit}: {seen}"
+    print("✅ 커서 페이지 누락/중복 없음")
+
+
+def legacy_order(posts, limit):
+    """기존 get_posts의 정렬 (수집 시각 역순으로 읽은 뒤 사이트 우선순위, 조회수 순으로 안정 정렬)"""
+    site_priority = {'bobae': 0, 'ruliweb': 1, 'dogdrip': 2, 'ppomppu': 3, 'dcinside': 4, 'fmkorea': 5}
+    by_crawled_at = sorted(posts, key=lambda x: x.crawled_at, reverse=True)
+    return sorted(by_crawled_at, key=lambda x: (site_priority.get(x.site, 99), -(x.views or 0)))[:limit]
+
+
+def test_legacy_response_matches_old_ordering():
+    """cursor 인자가 없으면 기존과 같은 순서와 형식 (조회수 NULL은 그대로, limit은 범위 제한)"""
+    app = make_app()
+    with app.app_context():
+        for i in range(30):
+            db.session.add(Post(
+                title=f'게시물 {i}',
+                url=f'https://example.com/{i}',
+                site=['bobae', 'dcinside', 'fmkorea', 'unknown'][i % 4],
+                category='인기',
+                views=[0, 20, 5, 20, 0][i % 5],
+                crawled_at=datetime(2026, 1, 1, 0, i)
+            ))
+        db.session.commit()
+        db.session.execute(db.update(Post).where(Post.id % 3 == 0).values(views=None))
+        db.session.commit()
+
+        client = app.test_client()
+        for limit in (1, 7, 50):
+            data = client.get('/api/posts', query_string={'limit': limit}).get_json()
+            expected = legacy_order(Post.query.all(), limit)
+            assert data == {'posts': [post.to_dict() for post in expected], 'total': len(expected)}
+
+        assert any(post['views'] is None for post in client.get('/api/posts').get_json()['posts'])
+
+        site_posts = client.get('/api/posts', query_string={'site': 'fmkorea'}).get_json()['posts']
+        assert [post['id'] for post in site_posts] == \
+            [post.id for post in legacy_order(Post.query.filter_by(site='fmkorea').all(), 50)]
+
+        assert client.get('/api/posts', query_string={'limit': -1}).get_json()['total'] == 1
+        assert client.get('/api/posts', query_string={'limit': 10 ** 6}).get_json()['total'] == 30
+    print("✅ 기존 응답 순서/형식 유지")
+
+
+if __name__ == "__main__":
+    test_cursor_round_trip()
+    test_malformed_cursor()
+    test_pages_have_no_gaps_or_duplicates()
+    test_legacy_response_matches_old_ordering()
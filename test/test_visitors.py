@@ -7,7 +7,7 @@ from app.models import db, SiteVisit
 from datetime import datetime
 
 def main():
-    app = create_app()
+    app = create_app(start_scheduler=False)
     with app.app_context():
         total = db.session.query(db.func.sum(SiteVisit.visit_count)).scalar()
         today = datetime.utcnow().date()